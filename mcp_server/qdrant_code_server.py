@@ -30,6 +30,8 @@ from mcp.types import (
 
 from src.config.jina_provider import EmbedderConfig, SentenceTransformerEmbedder
 from src.storage.qdrant_store import QdrantStoreConfig, QdrantStore
+from src.storage.local_index import LocalIndexConfig, LocalVectorIndex
+from src.retrieval.result_cache import SearchResultCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -37,11 +39,20 @@ logger = logging.getLogger("qdrant-code-mcp")
 
 # Global state
 embedder: Optional[SentenceTransformerEmbedder] = None
-stores: dict[str, QdrantStore] = {}
+stores: dict[str, QdrantStore | LocalVectorIndex] = {}
 
 EMBEDDING_MODEL = "nomic-ai/nomic-embed-code"
 VECTOR_SIZE = 3584
 COLLECTIONS = ["agent_kit", "inngest_overall"]
+# "qdrant" (server) or "local" (embedded index over output/embeddings, no server needed)
+VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "qdrant").lower()
+
+# Collections are written by separate ingestion processes, so write versions
+# bumped there are not visible here; cached results also expire after a TTL
+result_cache = SearchResultCache(
+    max_size=int(os.getenv("SEARCH_RESULT_CACHE_SIZE", "512")),
+    ttl_seconds=float(os.getenv("SEARCH_RESULT_CACHE_TTL", "300"))
+)
 
 
 async def initialize_embedder():
@@ -59,11 +70,15 @@ async def initialize_embedder():
 
 
 async def initialize_qdrant_stores():
-    """Initialize Qdrant connections for both collections."""
+    """Initialize Qdrant connections (or local indexes) for both collections."""
     global stores
     
     for collection in COLLECTIONS:
-        if collection not in stores:
+        if collection not in stores and VECTOR_BACKEND == "local":
+            logger.info(f"Opening local index for collection: {collection}")
+            stores[collection] = LocalVectorIndex(LocalIndexConfig.from_env(collection))
+            logger.info(f"Opened local index: {collection}")
+        elif collection not in stores:
             logger.info(f"Connecting to Qdrant collection: {collection}")
             config = QdrantStoreConfig(
                 host="localhost",
@@ -226,15 +241,24 @@ async def search_collection(collection: str, arguments: dict) -> list[TextConten
     
     logger.info(f"Searching {collection} for: {query[:50]}...")
     
-    # Generate query embedding
-    embedding = await embedder.embed_documents([query])
-    query_vector = embedding[0]
+    async def run_search():
+        # Generate query embedding
+        embedding = await embedder.embed_documents([query])
+        query_vector = embedding[0]
+        
+        # Search Qdrant
+        store = stores[collection]
+        return store.search(
+            query_embedding=query_vector,
+            limit=limit,
+            score_threshold=score_threshold
+        )
     
-    # Search Qdrant
-    store = stores[collection]
-    results = store.search(
-        query_embedding=query_vector,
+    results = await result_cache.get_or_compute(
+        query=query,
+        collection=collection,
         limit=limit,
+        compute=run_search,
         score_threshold=score_threshold
     )
     
@@ -303,6 +327,8 @@ async def get_collection_stats() -> list[TextContent]:
         stats = store.get_stats()
         
         stats_lines.append(f"\n{collection}:")
+        if stats.get("alias_for"):
+            stats_lines.append(f"  Serving: {stats['alias_for']}")
         stats_lines.append(f"  Points: {stats.get('points_count', 0)}")
         stats_lines.append(f"  Indexed: {stats.get('indexed_vectors_count', 0)}")
         stats_lines.append(f"  Status: {stats.get('status', 'unknown')}")
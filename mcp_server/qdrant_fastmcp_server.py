@@ -20,6 +20,8 @@ from fastmcp import FastMCP
 
 from src.config.jina_provider import EmbedderConfig, SentenceTransformerEmbedder
 from src.storage.qdrant_store import QdrantStoreConfig, QdrantStore
+from src.storage.local_index import LocalIndexConfig, LocalVectorIndex
+from src.retrieval.result_cache import SearchResultCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,14 +32,23 @@ mcp = FastMCP("qdrant-codes")
 
 # Global state
 embedder: Optional[SentenceTransformerEmbedder] = None
-stores: dict[str, QdrantStore] = {}
+stores: dict[str, QdrantStore | LocalVectorIndex] = {}
 
 EMBEDDING_MODEL = "nomic-ai/nomic-embed-code"
 VECTOR_SIZE = 3584
 COLLECTIONS = ["agent_kit", "inngest_overall"]
+# "qdrant" (server) or "local" (embedded index over output/embeddings, no server needed)
+VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "qdrant").lower()
 QDRANT_HOST = os.getenv("QDRANT_HOST", "localhost")
 QDRANT_PORT = int(os.getenv("QDRANT_PORT", "6333"))
 
+# Collections are written by separate ingestion processes, so write versions
+# bumped there are not visible here; cached results also expire after a TTL
+result_cache = SearchResultCache(
+    max_size=int(os.getenv("SEARCH_RESULT_CACHE_SIZE", "512")),
+    ttl_seconds=float(os.getenv("SEARCH_RESULT_CACHE_TTL", "300"))
+)
+
 
 def get_embedder():
     """Lazy-load and return the embedder."""
@@ -54,9 +65,13 @@ def get_embedder():
     return embedder
 
 
-def get_store(collection: str) -> QdrantStore:
-    """Lazy-load and return a Qdrant store."""
+def get_store(collection: str) -> QdrantStore | LocalVectorIndex:
+    """Lazy-load and return a Qdrant store (or local index, see VECTOR_BACKEND)."""
     global stores
+    if collection not in stores and VECTOR_BACKEND == "local":
+        logger.info(f"Opening local index for collection: {collection}")
+        stores[collection] = LocalVectorIndex(LocalIndexConfig.from_env(collection))
+        logger.info(f"Opened local index: {collection}")
     if collection not in stores:
         logger.info(f"Connecting to Qdrant collection: {collection}")
         config = QdrantStoreConfig(
@@ -119,6 +134,8 @@ async def qdrant_get_stats() -> str:
         stats = store.get_stats()
         
         stats_lines.append(f"\n{collection}:")
+        if stats.get("alias_for"):
+            stats_lines.append(f"  Serving: {stats['alias_for']}")
         stats_lines.append(f"  Points: {stats.get('points_count', 0)}")
         stats_lines.append(f"  Indexed: {stats.get('indexed_vectors_count', 0)}")
         stats_lines.append(f"  Status: {stats.get('status', 'unknown')}")
@@ -134,16 +151,25 @@ async def _search_collection(collection: str, query: str, limit: int, score_thre
     
     logger.info(f"Searching {collection} for: {query[:50]}...")
     
-    # Generate query embedding
-    emb = get_embedder()
-    embedding = await emb.embed_documents([query])
-    query_vector = embedding[0]
+    async def run_search():
+        # Generate query embedding
+        emb = get_embedder()
+        embedding = await emb.embed_documents([query])
+        query_vector = embedding[0]
+        
+        # Search Qdrant
+        store = get_store(collection)
+        return store.search(
+            query_embedding=query_vector,
+            limit=limit,
+            score_threshold=score_threshold
+        )
     
-    # Search Qdrant
-    store = get_store(collection)
-    results = store.search(
-        query_embedding=query_vector,
+    results = await result_cache.get_or_compute(
+        query=query,
+        collection=collection,
         limit=limit,
+        compute=run_search,
         score_threshold=score_threshold
     )
     
@@ -174,6 +200,9 @@ if __name__ == "__main__":
     logger.info("Starting Qdrant FastMCP Server")
     logger.info(f"Collections: {', '.join(COLLECTIONS)}")
     logger.info(f"Embedding model: {EMBEDDING_MODEL}")
-    logger.info(f"Qdrant: {QDRANT_HOST}:{QDRANT_PORT}")
+    if VECTOR_BACKEND == "local":
+        logger.info("Vector backend: local index")
+    else:
+        logger.info(f"Qdrant: {QDRANT_HOST}:{QDRANT_PORT}")
     
     mcp.run()
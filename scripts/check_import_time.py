@@ -0,0 +1,135 @@
+"""
+Import-Time Budget Check
+
+Measures the cold import time of each entry point (CLI, API, MCP servers) in a
+fresh interpreter with ``python -X importtime`` and fails when one exceeds its
+budget. Heavy dependencies (torch, transformers, docling, openai clients) must
+be imported on first use, not at module import; this check catches regressions.
+
+Usage:
+    python scripts/check_import_time.py
+    python scripts/check_import_time.py --budget src.cli.main=250 --top 15
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Entry point module -> budget in milliseconds
+DEFAULT_BUDGETS_MS: Dict[str, float] = {
+    "src.cli.main": 400.0,
+    "src.api.main": 3000.0,
+    "mcp_server.qdrant_fastmcp_server": 2000.0,
+    "mcp_server.qdrant_code_server": 2000.0,
+}
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure_import(module: str) -> Tuple[Optional[float], List[Tuple[float, str]], str]:
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        (total ms or None if the import failed, [(cumulative ms, module)], error output)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+
+    root_package = module.split(".")[0]
+    entries: List[Tuple[float, str]] = []
+    other_lines: List[str] = []
+    total_us = 0
+    counting = False
+
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            if not line.startswith("import time:"):
+                other_lines.append(line)
+            continue
+
+        cumulative_us = int(match.group(2))
+        depth = (len(match.group(3)) - 1) // 2
+        name = match.group(4)
+        entries.append((cumulative_us / 1000, name))
+
+        # Top-level imports from the entry point's package on (skips interpreter startup)
+        if depth == 0:
+            counting = counting or name.split(".")[0] == root_package
+            if counting:
+                total_us += cumulative_us
+
+    if result.returncode != 0:
+        return None, entries, "\n".join(other_lines[-5:])
+    return total_us / 1000, entries, ""
+
+
+def parse_budgets(overrides: List[str]) -> Dict[str, float]:
+    """Apply ``module=ms`` overrides to the default budgets."""
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for override in overrides:
+        module, _, value = override.partition("=")
+        if not value:
+            raise SystemExit(f"Invalid budget '{override}' (expected module=ms)")
+        budgets[module] = float(value)
+    return budgets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail when entry point import time exceeds its budget")
+    parser.add_argument("--budget", action="append", default=[], metavar="MODULE=MS",
+                        help="Override or add an entry point budget (repeatable)")
+    parser.add_argument("--only", nargs="+", help="Only check these entry points")
+    parser.add_argument("--runs", type=int, default=3, help="Imports per entry point (fastest counts)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list for failures")
+    args = parser.parse_args()
+
+    budgets = parse_budgets(args.budget)
+    modules = args.only or list(budgets)
+
+    failures = 0
+    print(f"{'Entry point':<40} {'Import ms':>10} {'Budget ms':>10}  Status")
+    for module in modules:
+        budget = budgets.get(module, DEFAULT_BUDGETS_MS.get(module, 1000.0))
+
+        best: Optional[float] = None
+        entries: List[Tuple[float, str]] = []
+        error = ""
+        for _ in range(max(1, args.runs)):
+            total, run_entries, error = measure_import(module)
+            if total is None:
+                break
+            if best is None or total < best:
+                best, entries = total, run_entries
+
+        if best is None:
+            failures += 1
+            print(f"{module:<40} {'-':>10} {budget:>10.0f}  IMPORT ERROR")
+            for line in error.splitlines():
+                print(f"    {line}")
+            continue
+
+        over = best > budget
+        failures += over
+        print(f"{module:<40} {best:>10.1f} {budget:>10.0f}  {'OVER BUDGET' if over else 'ok'}")
+        if over:
+            for cumulative_ms, name in sorted(entries, reverse=True)[:args.top]:
+                print(f"    {cumulative_ms:>9.1f} ms  {name}")
+
+    if failures:
+        print(f"\n{failures} entry point(s) failed the import-time check")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
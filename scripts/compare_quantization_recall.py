@@ -0,0 +1,74 @@
+"""
+Quantization Recall Comparison
+
+Measures recall@k and latency of quantized search against the unquantized
+exact baseline on an existing Qdrant collection. Stored vectors are sampled
+as queries, so no embedding model is needed.
+
+Usage:
+    python scripts/compare_quantization_recall.py --collection agent_kit --quantization binary
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.storage.qdrant_store import QdrantStore, QdrantStoreConfig
+from src.storage.search_tuner import sample_query_vectors, exact_baselines, measure_recall
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare quantized search recall against exact search")
+    parser.add_argument("--collection", required=True, help="Collection to evaluate")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6333)
+    parser.add_argument("--quantization", default="binary", choices=["int8", "binary"],
+                        help="Quantization the collection was created with")
+    parser.add_argument("--samples", type=int, default=100, help="Number of sampled queries")
+    parser.add_argument("--k", type=int, default=10, help="Recall@k")
+    parser.add_argument("--oversampling", type=float, nargs="+", default=[1.0, 2.0, 3.0, 4.0])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    store = QdrantStore(QdrantStoreConfig(
+        host=args.host,
+        port=args.port,
+        collection_name=args.collection,
+        enable_quantization=True,
+        quantization_type=args.quantization
+    ))
+    print(f"✓ Connected to {args.collection} ({store.get_stats()['points_count']} points)")
+
+    queries = sample_query_vectors(store, args.samples, args.seed)
+    if not queries:
+        print("✗ Collection has no vectors to sample")
+        sys.exit(1)
+    print(f"✓ Sampled {len(queries)} stored vectors as queries")
+
+    baselines = exact_baselines(store, queries, args.k)
+
+    rows: List[Dict[str, Any]] = []
+    for rescore in (False, True):
+        for oversampling in (args.oversampling if rescore else [1.0]):
+            stats = measure_recall(
+                store, queries, baselines, args.k,
+                oversampling=oversampling, rescore=rescore
+            )
+            rows.append({"rescore": rescore, "oversampling": oversampling, **stats})
+
+    print(f"\nRecall@{args.k} vs exact unquantized baseline ({args.quantization} quantization)")
+    print(f"{'rescore':<9}{'oversampling':>13}{'recall':>9}{'p50 ms':>9}{'p95 ms':>9}")
+    for row in rows:
+        print(
+            f"{str(row['rescore']):<9}{row['oversampling']:>13.1f}{row['recall']:>9.3f}"
+            f"{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -18,16 +18,20 @@ from pydantic_ai import Agent, RunContext
 from .prompts import SYSTEM_PROMPT
 from .tools import (
     vector_search_tool,
+    multi_query_search_tool,
     graph_search_tool,
     hybrid_search_tool,
     get_document_tool,
+    get_chunk_context_tool,
     list_documents_tool,
     get_entity_relationships_tool,
     get_entity_timeline_tool,
     VectorSearchInput,
+    MultiQuerySearchInput,
     GraphSearchInput,
     HybridSearchInput,
     DocumentInput,
+    ChunkContextInput,
     DocumentListInput,
     EntityRelationshipInput,
     EntityTimelineInput,
@@ -88,6 +92,31 @@ async def vector_search(
     return results
 
 
+@rag_agent.tool
+async def multi_query_search(
+    ctx: RunContext[AgentDependencies],
+    queries: List[str],
+    limit: int = 5
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Search for several related queries at once.
+    
+    Use this instead of calling vector_search repeatedly when a question
+    needs multiple phrasings or sub-questions; all queries are embedded
+    and searched together in a single batch.
+    
+    Args:
+        queries: Search queries (1-10)
+        limit: Maximum number of results per query (1-50)
+    
+    Returns:
+        Dict mapping each query to its matching chunks
+    """
+    input_data = MultiQuerySearchInput(queries=queries, limit=limit)
+    results = await multi_query_search_tool(input_data)
+    return results
+
+
 @rag_agent.tool
 async def graph_search(
     ctx: RunContext[AgentDependencies],
@@ -142,6 +171,32 @@ async def hybrid_search(
     return results
 
 
+@rag_agent.tool
+async def get_chunk_context(
+    ctx: RunContext[AgentDependencies],
+    chunk_ids: List[str],
+    collection: str,
+    window: int = 1
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve the chunks surrounding specific search hits.
+    
+    Prefer this over get_document when a hit needs more context: only the
+    neighboring chunks (chunk_index ± window) are fetched, and windows that
+    overlap are merged.
+    
+    Args:
+        chunk_ids: Chunk IDs from vector search results (1-20)
+        collection: Collection the chunks came from
+        window: Neighboring chunks to include on each side (0-5)
+    
+    Returns:
+        Context windows with document ID, chunk range and joined content
+    """
+    input_data = ChunkContextInput(chunk_ids=chunk_ids, collection=collection, window=window)
+    return await get_chunk_context_tool(input_data)
+
+
 @rag_agent.tool
 async def get_document(
     ctx: RunContext[AgentDependencies],
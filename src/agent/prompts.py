@@ -30,6 +30,7 @@ Tool usage guidelines:
 - Use **vector search** for finding similar content and detailed explanations
 - Use **graph search** when the user asks about relationships between entities
 - Use **hybrid search** for combining semantic and exact matching
+- Use **get_chunk_context** to expand search hits with neighboring chunks; only load a full document with **get_document** when you really need all of it
 - Use **knowledge graph** for understanding entity relationships and temporal information
 - Combine both approaches when needed for comprehensive answers
 
@@ -19,7 +19,6 @@ from pydantic import BaseModel, Field
 from ..models.chunk import Chunk
 from ..models.result import QueryResult
 from ..models.document import Document
-from ..config.providers import get_embedding_client, get_embedding_model
 from ..storage.chroma_client import get_chroma_client
 from ..storage.collection_manager import get_collection_manager
 from ..graph.graph_client import (
@@ -28,20 +27,17 @@ from ..graph.graph_client import (
     _get_global_client as get_graph_client,
 )
 # Import new retrieval functions
-from ..retrieval.vector_search import vector_search_by_text
+from ..retrieval.vector_search import vector_search_by_text, vector_search_batch_by_text
 from ..retrieval.graph_search import graph_search, get_entity_relationships, get_entity_timeline
 from ..retrieval.hybrid_search import hybrid_search
+from ..retrieval.query_embedder import get_query_embedding_service
 
 logger = logging.getLogger(__name__)
 
-# Initialize embedding client
-embedding_client = get_embedding_client()
-EMBEDDING_MODEL = get_embedding_model()
-
 
 async def generate_embedding(text: str) -> List[float]:
     """
-    Generate embedding for text using configured provider.
+    Generate embedding for text using the shared query embedding service.
     
     Args:
         text: Text to embed
@@ -50,11 +46,7 @@ async def generate_embedding(text: str) -> List[float]:
         Embedding vector
     """
     try:
-        response = await embedding_client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=text
-        )
-        return response.data[0].embedding
+        return await get_query_embedding_service().embed(text)
     except Exception as e:
         logger.error(f"Failed to generate embedding: {e}")
         raise
@@ -67,6 +59,12 @@ class VectorSearchInput(BaseModel):
     limit: int = Field(default=10, ge=1, le=50, description="Maximum number of results")
 
 
+class MultiQuerySearchInput(BaseModel):
+    """Input for multi-query vector search tool."""
+    queries: List[str] = Field(..., min_length=1, max_length=10, description="Search queries")
+    limit: int = Field(default=5, ge=1, le=50, description="Maximum number of results per query")
+
+
 class GraphSearchInput(BaseModel):
     """Input for graph search tool."""
     query: str = Field(..., description="Search query")
@@ -84,6 +82,13 @@ class DocumentInput(BaseModel):
     document_id: str = Field(..., description="Document ID to retrieve")
 
 
+class ChunkContextInput(BaseModel):
+    """Input for neighbor-window context retrieval."""
+    chunk_ids: List[str] = Field(..., min_length=1, max_length=20, description="Hit chunk IDs from a search")
+    collection: str = Field(..., description="Collection the chunks came from")
+    window: int = Field(default=1, ge=0, le=5, description="Neighboring chunks to include on each side")
+
+
 class DocumentListInput(BaseModel):
     """Input for listing documents."""
     limit: int = Field(default=20, ge=1, le=100, description="Maximum number of documents")
@@ -130,7 +135,8 @@ async def vector_search_tool(input_data: VectorSearchInput) -> List[Dict[str, An
                 "score": r.similarity,
                 "metadata": r.metadata,
                 "document_title": r.metadata.get("title", ""),
-                "document_source": r.metadata.get("source", "")
+                "document_source": r.metadata.get("source", ""),
+                "collection": r.collection
             }
             for r in results
         ]
@@ -140,6 +146,43 @@ async def vector_search_tool(input_data: VectorSearchInput) -> List[Dict[str, An
         return []
 
 
+async def multi_query_search_tool(input_data: MultiQuerySearchInput) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Run several vector searches as one batch.
+    
+    Args:
+        input_data: Search parameters
+    
+    Returns:
+        Dict mapping each query to its matching chunks
+    """
+    try:
+        batch_results = await vector_search_batch_by_text(
+            query_texts=input_data.queries,
+            limit=input_data.limit
+        )
+        
+        return {
+            query: [
+                {
+                    "chunk_id": r.chunk_id,
+                    "document_id": r.metadata.get("document_id", ""),
+                    "content": r.content,
+                    "score": r.similarity,
+                    "metadata": r.metadata,
+                    "document_title": r.metadata.get("title", ""),
+                    "document_source": r.metadata.get("source", "")
+                }
+                for r in results
+            ]
+            for query, results in zip(input_data.queries, batch_results)
+        }
+        
+    except Exception as e:
+        logger.error(f"Multi-query search failed: {e}")
+        return {query: [] for query in input_data.queries}
+
+
 async def graph_search_tool(input_data: GraphSearchInput) -> List[Dict[str, Any]]:
     """
     Search the knowledge graph using the new retrieval module.
@@ -250,6 +293,43 @@ async def get_document_tool(input_data: DocumentInput) -> Optional[Dict[str, Any
         return None
 
 
+async def get_chunk_context_tool(input_data: ChunkContextInput) -> List[Dict[str, Any]]:
+    """
+    Retrieve the chunks surrounding search hits (chunk_index ± window).
+    
+    Cheaper than get_document_tool for large documents: only the windows
+    around the hits are fetched, in one query, with overlapping windows merged.
+    
+    Args:
+        input_data: Context retrieval parameters
+    
+    Returns:
+        One entry per merged window with its joined content
+    """
+    try:
+        manager = get_collection_manager()
+        windows = await manager.get_neighbor_chunks(
+            collection_name=input_data.collection,
+            chunk_ids=input_data.chunk_ids,
+            window=input_data.window
+        )
+        
+        return [
+            {
+                "document_id": w.document_id,
+                "document_title": w.chunks[0]["metadata"].get("document_title", "") if w.chunks else "",
+                "chunk_range": [w.start, w.end],
+                "hit_chunk_ids": w.hit_ids,
+                "content": w.content,
+            }
+            for w in windows
+        ]
+        
+    except Exception as e:
+        logger.error(f"Chunk context retrieval failed: {e}")
+        return []
+
+
 async def list_documents_tool(input_data: DocumentListInput) -> List[Dict[str, Any]]:
     """
     List available documents from Chroma.
@@ -356,7 +436,8 @@ async def perform_comprehensive_search(
     query: str,
     use_vector: bool = True,
     use_graph: bool = True,
-    limit: int = 10
+    limit: int = 10,
+    related_queries: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Perform a comprehensive search using multiple methods.
@@ -366,6 +447,8 @@ async def perform_comprehensive_search(
         use_vector: Whether to use vector search
         use_graph: Whether to use graph search
         limit: Maximum results per search type
+        related_queries: Extra phrasings searched in the same vector batch;
+            their hits are returned under "related_results"
     
     Returns:
         Combined search results from vector and graph searches
@@ -379,7 +462,11 @@ async def perform_comprehensive_search(
     
     tasks = []
     
-    if use_vector:
+    if use_vector and related_queries:
+        tasks.append(multi_query_search_tool(
+            MultiQuerySearchInput(queries=[query, *related_queries], limit=limit)
+        ))
+    elif use_vector:
         tasks.append(vector_search_tool(VectorSearchInput(query=query, limit=limit)))
     
     if use_graph:
@@ -389,7 +476,14 @@ async def perform_comprehensive_search(
         search_results = await asyncio.gather(*tasks, return_exceptions=True)
         
         if use_vector and len(search_results) > 0 and not isinstance(search_results[0], Exception):
-            results["vector_results"] = search_results[0]
+            if related_queries:
+                by_query = search_results[0]
+                results["vector_results"] = by_query.get(query, [])
+                results["related_results"] = {
+                    q: by_query.get(q, []) for q in related_queries
+                }
+            else:
+                results["vector_results"] = search_results[0]
         
         if use_graph:
             graph_idx = 1 if use_vector else 0
@@ -8,7 +8,6 @@ Provides endpoints for:
 - Managing batch job lifecycle
 """
 
-import asyncio
 import json
 from typing import Optional, List
 from pathlib import Path
@@ -24,6 +23,7 @@ from src.ingestion.batch_processor import (
     create_and_process_batch
 )
 from src.ingestion.ingest import IngestionConfig
+from src.ingestion.progress import get_progress_broker
 
 router = APIRouter(prefix="/api/v1/ingest/batch", tags=["Batch Processing"])
 
@@ -210,8 +210,9 @@ async def stream_batch_progress(batch_id: str):
     """
     Stream batch job progress via Server-Sent Events (SSE).
     
-    Continuously streams progress updates until the batch job completes or fails.
-    Updates are sent every 1 second.
+    Sends the current status immediately, then every update as soon as the
+    batch processor publishes it, until the batch job completes or fails.
+    Slow clients receive the latest state rather than every intermediate one.
     
     Args:
         batch_id: Batch job ID
@@ -223,36 +224,36 @@ async def stream_batch_progress(batch_id: str):
     
     # Verify batch exists
     try:
-        await processor.get_batch_progress(batch_id)
+        initial = await processor.get_batch_progress(batch_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     
+    finished = (BatchStatus.COMPLETED.value, BatchStatus.FAILED.value, BatchStatus.CANCELLED.value)
+    
+    async def poll_progress():
+        try:
+            return await processor.get_batch_progress(batch_id)
+        except ValueError:
+            return None
+    
     async def generate_progress():
         """Generate SSE progress events."""
-        last_progress = -1.0
+        yield f"data: {json.dumps(initial)}\n\n"
         
-        while True:
-            try:
-                progress = await processor.get_batch_progress(batch_id)
-                current_progress = progress["progress"]
-                
-                # Send update if progress changed
-                if current_progress != last_progress:
+        if initial["status"] not in finished:
+            # The batch may be running in another worker process; poll its
+            # stored progress when no update is published here
+            async for progress in get_progress_broker().follow(
+                f"batch:{batch_id}",
+                poll=poll_progress,
+                is_final=lambda progress: progress.get("status") in finished,
+            ):
+                if progress is None:
+                    yield ": heartbeat\n\n"
+                else:
                     yield f"data: {json.dumps(progress)}\n\n"
-                    last_progress = current_progress
-                
-                # Stop streaming if completed or failed
-                status = progress["status"]
-                if status in (BatchStatus.COMPLETED.value, BatchStatus.FAILED.value, BatchStatus.CANCELLED.value):
-                    yield f"data: {json.dumps({'done': True})}\n\n"
-                    break
-                
-                # Poll every 1 second
-                await asyncio.sleep(1.0)
-                
-            except Exception as e:
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
-                break
+        
+        yield f"data: {json.dumps({'done': True})}\n\n"
     
     return StreamingResponse(
         generate_progress(),
@@ -289,6 +290,7 @@ async def cancel_batch_job(batch_id: str):
         # Update status
         job.status = BatchStatus.CANCELLED
         processor._save_batch_job(job)
+        processor.publish_progress(job)
         
         return {
             "status": "success",
@@ -5,10 +5,11 @@ Extends the base routes with collection-specific endpoints.
 """
 
 from typing import Optional, List
-from fastapi import APIRouter, Query as FastAPIQuery
+from fastapi import APIRouter, HTTPException, Query as FastAPIQuery
 
 from src.storage.collection_manager import get_collection_manager
 from src.models.collection import CollectionCategory
+from src.api.streaming import peek_first, stream_ndjson
 
 
 collection_router = APIRouter(prefix="/api/v1/collections", tags=["Collections"])
@@ -121,6 +122,76 @@ async def delete_collection_endpoint(collection_name: str):
         }
 
 
+@collection_router.get("/{collection_name}/context")
+async def get_chunk_context(
+    collection_name: str,
+    chunk_ids: List[str] = FastAPIQuery(..., description="Hit chunk IDs"),
+    window: int = FastAPIQuery(1, ge=0, le=10, description="Neighbors on each side"),
+):
+    """
+    Get the chunks surrounding search hits instead of whole documents.
+    
+    Args:
+        collection_name: Collection holding the chunks
+        chunk_ids: Hit chunk IDs
+        window: Neighboring chunks to include on each side (chunk_index ± window)
+        
+    Returns:
+        Merged context windows with their chunks
+    """
+    manager = get_collection_manager()
+    try:
+        windows = await manager.get_neighbor_chunks(
+            collection_name=collection_name,
+            chunk_ids=chunk_ids,
+            window=window,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    return {
+        "collection": collection_name,
+        "windows": [w.to_dict() for w in windows],
+        "total_chunks": sum(len(w.chunks) for w in windows),
+    }
+
+
+@collection_router.get("/{collection_name}/export")
+async def export_collection(
+    collection_name: str,
+    document_id: Optional[str] = FastAPIQuery(None, description="Only export this document's chunks"),
+    with_vectors: bool = FastAPIQuery(False, description="Include stored vectors"),
+    batch_size: int = FastAPIQuery(256, ge=1, le=5000, description="Chunks read per page"),
+):
+    """
+    Export a collection as NDJSON, one chunk per line.
+    
+    Pages through the collection and writes each chunk as it is read, so
+    memory stays constant regardless of collection size.
+    
+    Args:
+        collection_name: Collection to export
+        document_id: Restrict to one document (optional)
+        with_vectors: Include each chunk's vector
+        batch_size: Page size
+        
+    Returns:
+        application/x-ndjson stream
+    """
+    manager = get_collection_manager()
+    try:
+        _, items = await peek_first(manager.iter_collection(
+            collection_name,
+            where={"document_id": document_id} if document_id else None,
+            batch_size=batch_size,
+            include_embeddings=with_vectors,
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    return stream_ndjson(items)
+
+
 @collection_router.post("/search")
 async def search_across_collections(
     query: str,
@@ -136,21 +207,34 @@ async def search_across_collections(
         n_results_per_collection: Results per collection
         
     Returns:
-        Search results grouped by collection
+        Search results grouped by collection, plus any collections that
+        failed or timed out
     """
-    from src.ingestion.embedder import create_embedder
+    from src.retrieval.query_embedder import get_query_embedding_service
+    from src.retrieval.result_cache import get_search_result_cache
     
-    # Generate query embedding
-    embedder = create_embedder()
-    query_embedding = await embedder.embed_query(query)
+    async def run_search():
+        # Generate query embedding (shared warm client + cache)
+        query_embedding = await get_query_embedding_service().embed(query)
+        
+        # Search across collections (concurrently, with per-collection timeouts)
+        manager = get_collection_manager()
+        return await manager.search_all_collections_batch(
+            query_embeddings=[query_embedding],
+            n_results_per_collection=n_results_per_collection,
+            categories=categories,
+        )
     
-    # Search across collections
-    manager = get_collection_manager()
-    results = await manager.search_all_collections(
-        query_embedding=query_embedding,
-        n_results_per_collection=n_results_per_collection,
-        categories=categories,
+    # Invalidated by any collection write; partial results are never cached
+    fan_out_result = await get_search_result_cache().get_or_compute(
+        query=query,
+        collection=None,
+        limit=n_results_per_collection,
+        filters={"categories": sorted(c.value for c in categories)} if categories else None,
+        compute=run_search,
+        should_cache=lambda r: not r.partial,
     )
+    results = {name: per_query[0] for name, per_query in fan_out_result.results.items()}
     
     # Format response
     formatted_results = {}
@@ -174,6 +258,9 @@ async def search_across_collections(
         "results": formatted_results,
         "total_results": total_results,
         "collections_searched": len(results),
+        "failed_collections": fan_out_result.failed,
+        "timed_out_collections": fan_out_result.timed_out,
+        "partial": fan_out_result.partial,
     }
 
 
@@ -8,6 +8,8 @@ Provides REST API endpoints for:
 - System health checks
 """
 
+import asyncio
+import logging
 import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Dict, Any
@@ -17,13 +19,21 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
 from src.storage.chroma_client import initialize_chroma, close_chroma, get_chroma_client
+from src.storage.fanout import close_fanout_executor
+from src.retrieval.query_embedder import (
+    initialize_query_embedding_service,
+    close_query_embedding_service,
+)
 from src.config.providers import ProviderConfig
+from src.ingestion.model_registry import get_model_registry, close_model_registry
+from src.ingestion.job_queue import get_ingestion_queue, close_ingestion_queue
 
 # Import monitoring and middleware
 from src.monitoring import configure_logging, get_metrics, collect_system_metrics, Timer
 from src.api.middleware import (
     configure_cors,
     configure_error_handling,
+    configure_metrics,
     validation_exception_handler,
     rag_exception_handler,
 )
@@ -34,6 +44,14 @@ from src.api import routes
 from src.api import collection_routes
 from src.api import batch_routes
 
+logger = logging.getLogger(__name__)
+
+
+def _log_warmup_result(task: asyncio.Task) -> None:
+    """Log a model warmup task that ended with an error."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Model warmup stopped", exc_info=task.exception())
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -58,8 +76,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await initialize_chroma()
         print("✓ Chroma client initialized")
         
+        # Warm shared query embedder (one client + cache for all retrieval paths)
+        print("Initializing query embedding service...")
+        await initialize_query_embedding_service()
+        print("✓ Query embedding service ready")
+        
+        # Load and warm shared models (tokenizer, embedder, reranker, Docling)
+        # in the background, retrying with backoff; /ready reports 503 until
+        # warmup completes
+        print("Warming up models in background...")
+        app.state.model_warmup = asyncio.create_task(get_model_registry().warmup_with_retry())
+        app.state.model_warmup.add_done_callback(_log_warmup_result)
+        
+        # Start the bounded ingestion worker pool (re-queues interrupted jobs)
+        get_ingestion_queue().start(routes.run_ingestion_job)
+        print("✓ Ingestion queue started")
+        
         # Start background system metrics collection
-        import asyncio
         async def collect_metrics_loop():
             while True:
                 try:
@@ -76,6 +109,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         print("✓ RAG Agent API ready!")
         print(f"  - Logging: {log_level} ({'JSON' if json_format else 'Colored'})")
         print(f"  - Chroma: Connected")
+        print("  - Models: warming up (see /ready)")
         print(f"  - Metrics: Collecting every 60s")
         print("=" * 60)
         
@@ -91,11 +125,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     print("=" * 60)
     
     try:
+        # Stop ingestion first so running jobs are re-queued while the
+        # clients they use are still open, and stop warmup before the models
+        # it is loading are released
+        await close_ingestion_queue()
+        app.state.model_warmup.cancel()
+        await asyncio.gather(app.state.model_warmup, return_exceptions=True)
+        
         # Close Chroma connection
         print("Closing Chroma client...")
         await close_chroma()
         print("✓ Chroma client closed")
         
+        close_fanout_executor()
+        await close_query_embedding_service()
+        close_model_registry()
+        
         print("=" * 60)
         print("✓ RAG Agent API shutdown complete")
         print("=" * 60)
@@ -119,7 +164,10 @@ configure_cors(app)
 # 2. Error handling middleware
 configure_error_handling(app)
 
-# 3. Register custom exception handlers
+# 3. Request metrics (outermost: times every route, including errors)
+configure_metrics(app)
+
+# 4. Register custom exception handlers
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(RAGException, rag_exception_handler)
 
@@ -139,6 +187,7 @@ async def root():
         "description": "Document ingestion and RAG-based question answering with knowledge graph",
         "endpoints": {
             "health": "/health",
+            "ready": "/ready",
             "ingest_document": "/api/v1/ingest/document",
             "ingest_status": "/api/v1/ingest/status/{document_id}",
             "ingest_stream": "/api/v1/ingest/stream/{document_id}",
@@ -146,6 +195,7 @@ async def root():
             "batch_status": "/api/v1/ingest/batch/{batch_id}",
             "batch_stream": "/api/v1/ingest/batch/{batch_id}/stream",
             "query": "/api/v1/query",
+            "search_batch": "/api/v1/search/batch",
             "documents": "/api/v1/documents",
             "collections": "/api/v1/collections",
         },
@@ -210,20 +260,38 @@ async def health_check():
     return JSONResponse(status_code=status_code, content=health_status)
 
 
+# Readiness endpoint
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness check endpoint.
+    
+    Reports ready only after the shared models have loaded and completed
+    their warmup inference; returns 503 while warming up or if warmup failed.
+    """
+    models = get_model_registry().get_status()
+    status_code = 200 if models["ready"] else 503
+    
+    return JSONResponse(
+        status_code=status_code,
+        content={"status": "ready" if models["ready"] else "not_ready", "models": models},
+    )
+
+
 # Metrics endpoint
 @app.get("/metrics")
 async def metrics_endpoint():
     """
-    Prometheus-compatible metrics endpoint.
+    Metrics endpoint.
     
-    Returns metrics in JSON format with statistics.
+    Returns metrics in JSON format with statistics per tagged series.
     """
     metrics = get_metrics()
     
     return {
         "format": "json",
         "metrics": metrics.export_json(),
-        "prometheus_format": "/metrics/prometheus",  # Future endpoint
+        "prometheus_format": "/metrics/prometheus",
     }
 
 
@@ -240,7 +308,7 @@ async def prometheus_metrics():
     metrics = get_metrics()
     prometheus_text = metrics.export_prometheus()
     
-    return PlainTextResponse(content=prometheus_text, media_type="text/plain")
+    return PlainTextResponse(content=prometheus_text, media_type="text/plain; version=0.0.4")
 
 
 if __name__ == "__main__":
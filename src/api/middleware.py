@@ -7,6 +7,7 @@ Provides:
 - Request/response logging
 - CORS configuration
 - Exception to HTTP status code mapping
+- Per-route request metrics (ASGI)
 """
 
 import logging
@@ -18,7 +19,9 @@ from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from ..monitoring.metrics import track_request
 from ..exceptions import (
     RAGException,
     DocumentProcessingError,
@@ -30,6 +33,7 @@ from ..exceptions import (
     ConfigurationError,
     EmbeddingError,
     MemoryLimitError,
+    QueueFullError,
 )
 
 logger = logging.getLogger(__name__)
@@ -44,6 +48,7 @@ EXCEPTION_STATUS_CODES: Dict[type, int] = {
     ConfigurationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
     EmbeddingError: status.HTTP_502_BAD_GATEWAY,
     MemoryLimitError: status.HTTP_507_INSUFFICIENT_STORAGE,
+    QueueFullError: status.HTTP_429_TOO_MANY_REQUESTS,
     DocumentProcessingError: status.HTTP_422_UNPROCESSABLE_ENTITY,
     VectorStoreError: status.HTTP_500_INTERNAL_SERVER_ERROR,
     RAGException: status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -182,6 +187,45 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware that times every HTTP request via track_request().
+    
+    The endpoint label is the matched route template (e.g.
+    ``/api/v1/ingest/status/{document_id}``), not the raw path, to keep
+    series cardinality bounded; unmatched paths are labelled ``unmatched``.
+    Streaming responses are timed until their last body chunk is sent.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            track_request(
+                endpoint=getattr(route, "path", None) or "unmatched",
+                method=scope["method"],
+                status_code=status_code,
+                duration_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
+
 def configure_cors(app) -> None:
     """Configure CORS middleware for API."""
     
@@ -202,6 +246,12 @@ def configure_error_handling(app) -> None:
     app.add_middleware(RequestLoggingMiddleware)
 
 
+def configure_metrics(app) -> None:
+    """Configure request metrics middleware (add last so it wraps everything)."""
+    
+    app.add_middleware(MetricsMiddleware)
+
+
 # Custom exception handlers for FastAPI
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle Pydantic validation errors."""
@@ -229,7 +279,12 @@ async def rag_exception_handler(request: Request, exc: RAGException):
     response["status_code"] = status_code
     response["request_id"] = request_id
     
+    headers = None
+    if "retry_after" in exc.details:
+        headers = {"Retry-After": str(exc.details["retry_after"])}
+    
     return JSONResponse(
         status_code=status_code,
-        content=response
+        content=response,
+        headers=headers
     )
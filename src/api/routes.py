@@ -4,6 +4,7 @@ API Routes for RAG Agent.
 Provides endpoints for:
 - Document upload and ingestion
 - RAG-based querying with streaming responses
+- Batch vector search (JSON or NDJSON)
 - Document management (list, get, delete)
 """
 
@@ -12,10 +13,10 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks, Form
+from fastapi import APIRouter, File, UploadFile, HTTPException, Form, Query as FastAPIQuery
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
@@ -26,12 +27,16 @@ from src.agent.agent import rag_agent, AgentDependencies
 from src.storage.chroma_client import get_chroma_client
 from src.storage.collection_manager import get_collection_manager
 from src.config.providers import ProviderConfig
+from src.exceptions import QueueFullError
+from src.api.streaming import stream_events, stream_chunk_frames, stream_agent_run, extract_sources, peek_first, stream_ndjson
+from src.ingestion.progress import get_progress_broker
+from src.ingestion.model_registry import get_model_registry
+from src.ingestion.job_queue import get_ingestion_queue
+from src.retrieval.query_embedder import get_query_embedding_service
 
 
 router = APIRouter(prefix="/api/v1", tags=["RAG Agent"])
 
-# In-memory ingestion status storage (replace with Redis/DB in production)
-_ingestion_status: Dict[str, Dict] = {}
 
 
 # Request/Response Models
@@ -47,7 +52,7 @@ class IngestionStatus(BaseModel):
     """Ingestion status for a document."""
     document_id: str
     filename: str
-    status: str  # "processing", "completed", "failed"
+    status: str  # "queued", "processing", "completed", "failed"
     progress: float  # 0.0 to 1.0
     current_step: str
     chunks_created: Optional[int] = None
@@ -62,6 +67,10 @@ class QueryRequest(BaseModel):
     """Request for RAG query."""
     question: str = Field(..., description="Question to ask the RAG agent")
     stream: bool = Field(default=True, description="Whether to stream the response")
+    stream_events: bool = Field(
+        default=False,
+        description="Stream typed SSE events (text, tool calls, sources) instead of plain chunk frames"
+    )
     max_chunks: int = Field(default=5, description="Maximum number of chunks to retrieve")
     collection: Optional[str] = Field(None, description="Specific collection to search (optional)")
     categories: Optional[List[str]] = Field(None, description="Collection categories to search (optional)")
@@ -82,6 +91,23 @@ class DocumentListResponse(BaseModel):
     total: int
 
 
+MAX_BATCH_QUERIES = int(os.getenv("SEARCH_BATCH_MAX_QUERIES", "100"))
+
+
+class BatchSearchQuery(BaseModel):
+    """One query of a batch search."""
+    query: str = Field(..., min_length=1, description="Search query")
+    filters: Optional[Dict[str, Any]] = Field(None, description="Metadata filter (Chroma where clause)")
+    categories: Optional[List[CollectionCategory]] = Field(None, description="Collection categories to search (None = all)")
+    n_results: int = Field(default=5, ge=1, le=100, description="Results per collection")
+
+
+class BatchSearchRequest(BaseModel):
+    """Request for batch search."""
+    queries: List[BatchSearchQuery] = Field(..., min_length=1, max_length=MAX_BATCH_QUERIES)
+    stream: bool = Field(default=False, description="Stream one NDJSON line per query, in request order")
+
+
 # Helper Functions
 def save_upload_file(upload_file: UploadFile, destination: Path) -> None:
     """Save uploaded file to disk."""
@@ -92,34 +118,43 @@ def save_upload_file(upload_file: UploadFile, destination: Path) -> None:
         upload_file.file.close()
 
 
+def _update_status(document_id: str, **fields) -> None:
+    """Update a document's ingestion status and publish it to SSE subscribers."""
+    queue = get_ingestion_queue()
+    status = queue.get_status(document_id) or {}
+    status.update(fields)
+    queue.update_status(document_id, status)
+    get_progress_broker().publish(
+        f"ingest:{document_id}",
+        status,
+        final=status["status"] in ("completed", "failed")
+    )
+
+
+async def run_ingestion_job(job: Dict) -> None:
+    """Ingestion queue handler for uploaded documents."""
+    await ingest_document_with_progress(Path(job["file_path"]), job["job_id"], job["filename"])
+
+
 async def ingest_document_with_progress(file_path: Path, document_id: str, filename: str) -> None:
     """
-    Background task for document ingestion with progress tracking.
+    Queued job for document ingestion with progress tracking.
     
     Args:
         file_path: Path to uploaded file
         document_id: Unique document identifier
         filename: Original filename
     """
-    # Initialize status
-    _ingestion_status[document_id] = {
-        "document_id": document_id,
-        "filename": filename,
-        "status": "processing",
-        "progress": 0.0,
-        "current_step": "Initializing pipeline",
-        "chunks_created": None,
-        "entities_extracted": None,
-        "relationships_created": None,
-        "error": None,
-        "started_at": datetime.utcnow().isoformat(),
-        "completed_at": None,
-    }
+    _update_status(
+        document_id,
+        status="processing",
+        current_step="Initializing pipeline",
+        started_at=datetime.utcnow().isoformat(),
+    )
     
     try:
         # Create ingestion pipeline
-        _ingestion_status[document_id]["current_step"] = "Creating ingestion pipeline"
-        _ingestion_status[document_id]["progress"] = 0.1
+        _update_status(document_id, current_step="Creating ingestion pipeline", progress=0.1)
         
         config = IngestionConfig(
             chunk_size=512,
@@ -129,16 +164,15 @@ async def ingest_document_with_progress(file_path: Path, document_id: str, filen
             extract_knowledge_graph=True,
         )
         
-        pipeline = DocumentIngestionPipeline(config)
+        # Shared tokenizer/embedder/converter (loaded once at startup)
+        pipeline = DocumentIngestionPipeline(config, models=get_model_registry())
         
         # Initialize pipeline
-        _ingestion_status[document_id]["current_step"] = "Initializing services"
-        _ingestion_status[document_id]["progress"] = 0.2
+        _update_status(document_id, current_step="Initializing services", progress=0.2)
         await pipeline.initialize()
         
         # Process document
-        _ingestion_status[document_id]["current_step"] = "Extracting text and chunking"
-        _ingestion_status[document_id]["progress"] = 0.4
+        _update_status(document_id, current_step="Extracting text and chunking", progress=0.4)
         
         results = await pipeline.ingest_documents([str(file_path)])
         
@@ -146,13 +180,16 @@ async def ingest_document_with_progress(file_path: Path, document_id: str, filen
             result = results[0]
             
             # Update status with results
-            _ingestion_status[document_id]["current_step"] = "Completed"
-            _ingestion_status[document_id]["progress"] = 1.0
-            _ingestion_status[document_id]["status"] = "completed"
-            _ingestion_status[document_id]["chunks_created"] = result.chunks_created
-            _ingestion_status[document_id]["entities_extracted"] = result.entities_extracted
-            _ingestion_status[document_id]["relationships_created"] = result.relationships_created
-            _ingestion_status[document_id]["completed_at"] = datetime.utcnow().isoformat()
+            _update_status(
+                document_id,
+                current_step="Completed",
+                progress=1.0,
+                status="completed",
+                chunks_created=result.chunks_created,
+                entities_extracted=result.entities_extracted,
+                relationships_created=result.relationships_created,
+                completed_at=datetime.utcnow().isoformat(),
+            )
             
             print(f"✓ Document ingested: {document_id}")
             print(f"  - Chunks: {result.chunks_created}")
@@ -160,32 +197,38 @@ async def ingest_document_with_progress(file_path: Path, document_id: str, filen
             print(f"  - Relationships: {result.relationships_created}")
         else:
             # No results (unexpected)
-            _ingestion_status[document_id]["status"] = "failed"
-            _ingestion_status[document_id]["error"] = "No results returned from pipeline"
-            _ingestion_status[document_id]["completed_at"] = datetime.utcnow().isoformat()
+            _update_status(
+                document_id,
+                status="failed",
+                error="No results returned from pipeline",
+                completed_at=datetime.utcnow().isoformat(),
+            )
             print(f"⚠ No results returned for document {document_id}")
         
     except Exception as e:
         # Update status with error
-        _ingestion_status[document_id]["status"] = "failed"
-        _ingestion_status[document_id]["error"] = str(e)
-        _ingestion_status[document_id]["completed_at"] = datetime.utcnow().isoformat()
+        _update_status(
+            document_id,
+            status="failed",
+            error=str(e),
+            completed_at=datetime.utcnow().isoformat(),
+        )
         print(f"✗ Error ingesting document {document_id}: {e}")
     
-    finally:
-        # Clean up uploaded file
-        if file_path.exists():
-            file_path.unlink()
+    # Clean up uploaded file once the job has completed or failed for good
+    # (not on cancellation: the queue re-runs interrupted jobs on next start)
+    if file_path.exists():
+        file_path.unlink()
 
 
 # Endpoints
 @router.post("/ingest/document", response_model=UploadResponse)
 async def ingest_document(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     collection: Optional[str] = Form(None),
     language: Optional[str] = Form(None),
     category: Optional[str] = Form(None),
+    priority: int = Form(0),
 ):
     """
     Upload and ingest a document.
@@ -194,7 +237,8 @@ async def ingest_document(
     
     Can optionally specify target collection, language, or category for automatic routing.
     
-    The document is processed in the background:
+    The document is queued and processed by a fixed-size worker pool
+    (higher priority first); returns 429 when the queue is full:
     1. Text extraction with Docling
     2. Chunking with HybridChunker
     3. Embedding generation
@@ -204,13 +248,16 @@ async def ingest_document(
     
     Args:
         file: Uploaded file
-        background_tasks: FastAPI background tasks manager
         collection: Target collection name (optional)
         language: Programming language for auto-routing (optional)
         category: Collection category for auto-routing (optional)
+        priority: Queue priority (higher is processed first)
         
     Returns:
         Upload response with document ID and status
+        
+    Raises:
+        QueueFullError: If the ingestion queue is full (429)
     """
     # Generate unique document ID
     document_id = str(uuid4())
@@ -231,6 +278,10 @@ async def ingest_document(
                    f"Supported: {', '.join(supported_extensions)}",
         )
     
+    # Reject before saving the upload when there is no room in the queue
+    queue = get_ingestion_queue()
+    queue.ensure_capacity()
+    
     # Save uploaded file temporarily
     upload_dir = Path("uploads")
     upload_dir.mkdir(exist_ok=True)
@@ -238,14 +289,35 @@ async def ingest_document(
     file_path = upload_dir / f"{document_id}{file_extension}"
     save_upload_file(file, file_path)
     
-    # Schedule background ingestion with progress tracking
-    background_tasks.add_task(ingest_document_with_progress, file_path, document_id, filename)
+    # Queue ingestion with progress tracking
+    try:
+        queue.submit(
+            document_id,
+            {"file_path": str(file_path), "filename": filename},
+            priority=priority,
+            status={
+                "document_id": document_id,
+                "filename": filename,
+                "status": "queued",
+                "progress": 0.0,
+                "current_step": "Queued",
+                "chunks_created": None,
+                "entities_extracted": None,
+                "relationships_created": None,
+                "error": None,
+                "started_at": datetime.utcnow().isoformat(),
+                "completed_at": None,
+            },
+        )
+    except QueueFullError:
+        file_path.unlink(missing_ok=True)
+        raise
     
     return UploadResponse(
         document_id=document_id,
         filename=filename,
-        status="processing",
-        message="Document uploaded successfully. Processing in background. Use /api/v1/ingest/status/{document_id} to track progress.",
+        status="queued",
+        message="Document uploaded successfully. Queued for processing. Use /api/v1/ingest/status/{document_id} to track progress.",
     )
 
 
@@ -266,10 +338,11 @@ async def get_ingestion_status(document_id: str):
     Returns:
         Ingestion status with progress information
     """
-    if document_id not in _ingestion_status:
+    status = get_ingestion_queue().get_status(document_id)
+    if status is None:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    return IngestionStatus(**_ingestion_status[document_id])
+    return IngestionStatus(**status)
 
 
 @router.get("/ingest/stream/{document_id}")
@@ -277,7 +350,10 @@ async def stream_ingestion_progress(document_id: str):
     """
     Stream ingestion progress via Server-Sent Events (SSE).
     
-    Continuously streams progress updates until ingestion completes or fails.
+    Sends the current status, then each update as soon as the ingestion task
+    publishes it, until ingestion completes or fails. If the job runs in
+    another worker process, its status is polled instead, with heartbeat
+    comments keeping the connection alive.
     
     Args:
         document_id: Document identifier
@@ -285,33 +361,30 @@ async def stream_ingestion_progress(document_id: str):
     Returns:
         SSE stream with progress updates
     """
-    if document_id not in _ingestion_status:
+    status = get_ingestion_queue().get_status(document_id)
+    if status is None:
         raise HTTPException(status_code=404, detail="Document not found")
     
+    async def poll_status():
+        return get_ingestion_queue().get_status(document_id)
+    
     async def generate_progress():
         """Generate SSE progress events."""
-        last_progress = -1.0
+        yield f"data: {json.dumps(status)}\n\n"
+        if status["status"] not in ("completed", "failed"):
+            # Published updates arrive instantly; a job running in another
+            # worker process is followed by polling its persisted status
+            async for snapshot in get_progress_broker().follow(
+                f"ingest:{document_id}",
+                poll=poll_status,
+                is_final=lambda snapshot: snapshot.get("status") in ("completed", "failed"),
+            ):
+                if snapshot is None:
+                    yield ": heartbeat\n\n"
+                else:
+                    yield f"data: {json.dumps(snapshot)}\n\n"
         
-        while True:
-            if document_id not in _ingestion_status:
-                yield f"data: {json.dumps({'error': 'Document not found'})}\n\n"
-                break
-            
-            status = _ingestion_status[document_id]
-            current_progress = status["progress"]
-            
-            # Send update if progress changed
-            if current_progress != last_progress:
-                yield f"data: {json.dumps(status)}\n\n"
-                last_progress = current_progress
-            
-            # Stop streaming if completed or failed
-            if status["status"] in ("completed", "failed"):
-                yield f"data: {json.dumps({'done': True})}\n\n"
-                break
-            
-            # Poll every 0.5 seconds
-            await asyncio.sleep(0.5)
+        yield f"data: {json.dumps({'done': True})}\n\n"
     
     return StreamingResponse(
         generate_progress(),
@@ -333,6 +406,7 @@ async def query_rag(request: QueryRequest):
     
     Supports:
     - Streaming responses (default): Real-time token generation via SSE
+      (``stream_events=True`` adds typed tool-call and source events)
     - Non-streaming responses: Complete answer returned at once
     - Multi-collection search: Query across multiple collections
     - Category-based routing: Search specific collection categories
@@ -352,47 +426,145 @@ async def query_rag(request: QueryRequest):
         query_text = request.question
         
         if request.stream:
-            # Streaming response
-            async def generate_stream():
-                """Generate streaming response tokens."""
-                try:
-                    # Run agent and stream response
-                    result = await rag_agent.run(query_text, deps=deps)
-                    
-                    # Convert result to string and stream
-                    response_text = str(result)
-                    for i in range(0, len(response_text), 10):
-                        chunk = response_text[i:i+10]
-                        yield f"data: {json.dumps({'chunk': chunk})}\n\n"
-                        await asyncio.sleep(0.01)  # Small delay for smooth streaming
-                    
-                    yield f"data: {json.dumps({'done': True})}\n\n"
-                    
-                except Exception as e:
-                    yield f"data: {json.dumps({'error': str(e)})}\n\n"
-            
-            return StreamingResponse(
-                generate_stream(),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "X-Accel-Buffering": "no",
-                },
-            )
+            # Forward the agent's own stream as it happens (time-to-first-token
+            # is recorded); typed events with tool calls and sources are opt-in,
+            # the default keeps the {"chunk"}/{"done"} frames clients parse
+            events = stream_agent_run(rag_agent, query_text, deps)
+            if request.stream_events:
+                return await stream_events(events)
+            return await stream_chunk_frames(events)
         
         else:
             # Non-streaming response
             result = await rag_agent.run(query_text, deps=deps)
             
+            sources = [
+                source
+                for message in result.all_messages()
+                for part in getattr(message, "parts", [])
+                if getattr(part, "part_kind", None) == "tool-return"
+                for source in extract_sources(part.tool_name, part.content)
+            ]
+            
             return {
-                "answer": str(result),
-                "sources": [],  # TODO: Extract sources from agent result
+                "answer": str(result.output),
+                "sources": sources,
             }
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _format_batch_result(index: int, query: BatchSearchQuery, fan_out_result, position: int) -> Dict[str, Any]:
+    """Results of one batch query (position = its row in the group's batch)."""
+    results = {
+        collection_name: [
+            {
+                "chunk_id": r.id,
+                "document_id": r.document_id,
+                "content": r.content,
+                "score": r.score,
+                "document_title": r.document_title,
+                "document_source": r.document_source,
+            }
+            for r in per_query[position]
+        ]
+        for collection_name, per_query in fan_out_result.results.items()
+    }
+    return {
+        "index": index,
+        "query": query.query,
+        "results": results,
+        "total_results": sum(len(hits) for hits in results.values()),
+        "failed_collections": fan_out_result.failed,
+        "timed_out_collections": fan_out_result.timed_out,
+        "partial": fan_out_result.partial,
+    }
+
+
+@router.post("/search/batch")
+async def search_batch(request: BatchSearchRequest):
+    """
+    Run many vector searches in one request.
+    
+    All query texts are embedded in one batch. Queries sharing the same
+    filters, categories and n_results are searched together: one query per
+    collection for the whole group, with collections searched concurrently.
+    
+    Args:
+        request: Queries (up to SEARCH_BATCH_MAX_QUERIES) and response mode
+        
+    Returns:
+        JSON with one result entry per query in request order, or (stream=True)
+        an NDJSON stream with one line per query, in request order, each sent
+        as soon as its group finishes
+    """
+    queries = request.queries
+    embeddings = await get_query_embedding_service().embed_many([q.query for q in queries])
+    
+    # Group queries that can share one batched search per collection
+    groups: Dict[str, List[int]] = {}
+    for index, q in enumerate(queries):
+        key = json.dumps(
+            {
+                "filters": q.filters,
+                "categories": sorted(c.value for c in q.categories) if q.categories else None,
+                "n_results": q.n_results,
+            },
+            sort_keys=True,
+        )
+        groups.setdefault(key, []).append(index)
+    
+    manager = get_collection_manager()
+    
+    async def run_group(indices: List[int]):
+        first = queries[indices[0]]
+        return await manager.search_all_collections_batch(
+            query_embeddings=[embeddings[i] for i in indices],
+            n_results_per_collection=first.n_results,
+            categories=first.categories,
+            where=first.filters,
+        )
+    
+    tasks = {key: asyncio.create_task(run_group(indices)) for key, indices in groups.items()}
+    placement = {
+        index: (key, position)
+        for key, indices in groups.items()
+        for position, index in enumerate(indices)
+    }
+    
+    async def result_for(index: int) -> Dict[str, Any]:
+        # A failed group only fails its own queries
+        key, position = placement[index]
+        try:
+            return _format_batch_result(index, queries[index], await tasks[key], position)
+        except Exception as e:
+            return {"index": index, "query": queries[index].query, "error": str(e)}
+    
+    if not request.stream:
+        try:
+            results = [await result_for(index) for index in range(len(queries))]
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        return {"results": results, "total_queries": len(queries), "groups": len(groups)}
+    
+    async def generate_lines():
+        try:
+            for index in range(len(queries)):
+                yield json.dumps(await result_for(index)) + "\n"
+        finally:
+            # Client went away: stop outstanding searches
+            for task in tasks.values():
+                task.cancel()
+    
+    return StreamingResponse(
+        generate_lines(),
+        media_type="application/x-ndjson",
+        headers={"X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/documents", response_model=DocumentListResponse)
 async def list_documents():
     """
@@ -470,6 +642,37 @@ async def get_document(document_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/documents/{document_id}/export")
+async def export_document(
+    document_id: str,
+    with_vectors: bool = False,
+    batch_size: int = FastAPIQuery(256, ge=1, le=5000, description="Chunks read per page"),
+):
+    """
+    Export all chunks of a document as NDJSON, one chunk per line.
+    
+    Chunks are paged from every collection and written as they are read,
+    so memory stays constant regardless of document size.
+    
+    Args:
+        document_id: Document identifier
+        with_vectors: Include each chunk's vector
+        batch_size: Chunks read per page
+        
+    Returns:
+        application/x-ndjson stream
+    """
+    first, items = await peek_first(get_collection_manager().iter_document(
+        document_id,
+        batch_size=batch_size,
+        include_embeddings=with_vectors,
+    ))
+    if first is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    return stream_ndjson(items)
+
+
 @router.delete("/documents/{document_id}")
 async def delete_document(document_id: str):
     """
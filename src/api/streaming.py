@@ -6,12 +6,15 @@ Provides:
 - Progress tracking and streaming
 - Event types for different stages
 - Automatic cleanup and error handling
+- Native agent run streaming (model deltas, tool calls, sources)
+- NDJSON streaming for exports
 """
 
 import asyncio
 import json
 import logging
-from typing import AsyncGenerator, Dict, Any, Optional, List
+import time
+from typing import AsyncGenerator, AsyncIterator, Dict, Any, Optional, List, Tuple
 from enum import Enum
 from datetime import datetime
 from fastapi.responses import StreamingResponse
@@ -181,16 +184,23 @@ class ProgressTracker:
         return event
 
 
-async def stream_events(events: AsyncGenerator[SSEEvent, None]) -> StreamingResponse:
-    """Create StreamingResponse for SSE events."""
+async def stream_events(
+    events: AsyncGenerator[SSEEvent, None]
+) -> StreamingResponse:
+    """
+    Create StreamingResponse for SSE events.
+    
+    Events are forwarded as soon as they are produced.
+    
+    Args:
+        events: Event stream
+    """
     
     async def event_generator():
         """Generate SSE formatted events."""
         try:
             async for event in events:
                 yield event.format()
-                # Small delay to prevent overwhelming client
-                await asyncio.sleep(0.01)
         except Exception as e:
             # Send error event before closing
             error_event = SSEEvent(
@@ -214,6 +224,98 @@ async def stream_events(events: AsyncGenerator[SSEEvent, None]) -> StreamingResp
     )
 
 
+async def stream_chunk_frames(
+    events: AsyncGenerator[SSEEvent, None]
+) -> StreamingResponse:
+    """
+    Create StreamingResponse in the original ``/query`` frame shape.
+    
+    Only answer text is forwarded, as untyped ``data: {"chunk": ...}`` frames,
+    followed by ``data: {"done": true}`` (or ``data: {"error": ...}``).
+    Tool calls and sources are dropped; use ``stream_events`` for those.
+    
+    Args:
+        events: Event stream (e.g. from ``stream_agent_run``)
+    """
+    
+    async def frame_generator():
+        """Generate legacy SSE data frames."""
+        try:
+            async for event in events:
+                if event.event_type == EventType.AGENT_STREAMING:
+                    yield f"data: {json.dumps({'chunk': event.data['chunk']})}\n\n"
+            yield f"data: {json.dumps({'done': True})}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            logger.error(f"SSE streaming error: {e}", exc_info=True)
+    
+    return StreamingResponse(
+        frame_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
+async def peek_first(
+    items: AsyncIterator[Dict[str, Any]]
+) -> Tuple[Optional[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]:
+    """
+    Pull the first item before the response starts.
+    
+    Lets endpoints turn "not found" errors (raised by the first read) into a
+    proper status code instead of a broken stream.
+    
+    Returns:
+        (first item or None if empty, iterator over all items)
+    """
+    try:
+        first = await items.__anext__()
+    except StopAsyncIteration:
+        first = None
+    
+    async def chained():
+        if first is None:
+            return
+        yield first
+        async for item in items:
+            yield item
+    
+    return first, chained()
+
+
+def stream_ndjson(items: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """
+    Create StreamingResponse writing one JSON object per line (NDJSON).
+    
+    Items are serialized as they arrive, so memory stays constant however
+    many are streamed. A failure mid-stream is reported as a final
+    ``{"error": ...}`` line.
+    
+    Args:
+        items: Objects to stream
+    """
+    
+    async def line_generator():
+        try:
+            async for item in items:
+                yield json.dumps(item, default=str) + "\n"
+        except Exception as e:
+            logger.error(f"NDJSON streaming error: {e}", exc_info=True)
+            yield json.dumps({"error": str(e), "error_type": e.__class__.__name__}) + "\n"
+    
+    return StreamingResponse(
+        line_generator(),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
 async def stream_progress(
     tracker: ProgressTracker,
     operation_func,
@@ -417,3 +519,140 @@ async def stream_batch_progress(
             "success_rate": round((completed / total_files) * 100, 2)
         }
     )
+
+
+# Tools whose results are retrieved chunks (forwarded as sources)
+RETRIEVAL_TOOLS = {
+    "vector_search",
+    "multi_query_search",
+    "hybrid_search",
+    "get_chunk_context",
+}
+
+
+def extract_sources(tool_name: str, content: Any) -> List[Dict[str, Any]]:
+    """
+    Extract source references from a retrieval tool result.
+    
+    Args:
+        tool_name: Tool that produced the result
+        content: Tool return value (list of chunk dicts, or dict of lists)
+    
+    Returns:
+        Source entries (chunk id, document, score, collection)
+    """
+    if tool_name not in RETRIEVAL_TOOLS or not content:
+        return []
+    
+    items = content
+    if isinstance(content, dict):
+        items = [item for group in content.values() for item in (group or [])]
+    
+    sources = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        sources.append({
+            "chunk_id": item.get("chunk_id") or ",".join(item.get("hit_chunk_ids", [])),
+            "document_id": item.get("document_id"),
+            "document_title": item.get("document_title"),
+            "document_source": item.get("document_source"),
+            "score": item.get("score", item.get("combined_score")),
+            "collection": item.get("collection"),
+        })
+    return sources
+
+
+async def stream_agent_run(agent, prompt: str, deps: Any) -> AsyncGenerator[SSEEvent, None]:
+    """
+    Stream a pydantic-ai agent run as it happens.
+    
+    Forwards model text deltas, tool calls and tool results as they arrive
+    (no buffering of the final answer), emits retrieved sources as soon as a
+    retrieval tool returns, and records time-to-first-token.
+    
+    Args:
+        agent: pydantic-ai Agent
+        prompt: User prompt
+        deps: Agent dependencies
+    
+    Yields:
+        AGENT_STREAMING ({"chunk": delta}), AGENT_TOOL_USE, SEARCH_COMPLETED
+        ({"sources": [...]}) and a final AGENT_RESPONSE ({"done": True, ...})
+    """
+    from pydantic_ai import Agent
+    from pydantic_ai.messages import (
+        PartStartEvent,
+        PartDeltaEvent,
+        TextPart,
+        TextPartDelta,
+        FunctionToolCallEvent,
+        FunctionToolResultEvent,
+        ToolReturnPart,
+    )
+    from src.monitoring.metrics import get_metrics
+    
+    metrics = get_metrics()
+    started = time.perf_counter()
+    ttft_ms: Optional[float] = None
+    sources: List[Dict[str, Any]] = []
+    
+    def text_event(text: str) -> SSEEvent:
+        nonlocal ttft_ms
+        if ttft_ms is None:
+            ttft_ms = (time.perf_counter() - started) * 1000
+            metrics.timer("query_ttft", ttft_ms)
+        return SSEEvent(event_type=EventType.AGENT_STREAMING, data={"chunk": text})
+    
+    async with agent.iter(prompt, deps=deps) as run:
+        async for node in run:
+            if Agent.is_model_request_node(node):
+                async with node.stream(run.ctx) as request_stream:
+                    async for event in request_stream:
+                        if isinstance(event, PartStartEvent) and isinstance(event.part, TextPart):
+                            if event.part.content:
+                                yield text_event(event.part.content)
+                        elif isinstance(event, PartDeltaEvent) and isinstance(event.delta, TextPartDelta):
+                            if event.delta.content_delta:
+                                yield text_event(event.delta.content_delta)
+            
+            elif Agent.is_call_tools_node(node):
+                async with node.stream(run.ctx) as tool_stream:
+                    async for event in tool_stream:
+                        if isinstance(event, FunctionToolCallEvent):
+                            yield SSEEvent(
+                                event_type=EventType.AGENT_TOOL_USE,
+                                data={
+                                    "tool": event.part.tool_name,
+                                    "args": event.part.args_as_dict(),
+                                    "tool_call_id": event.part.tool_call_id,
+                                }
+                            )
+                        elif isinstance(event, FunctionToolResultEvent):
+                            # RetryPromptPart results (failed/retried tool calls) carry no sources
+                            if not isinstance(event.result, ToolReturnPart):
+                                continue
+                            new_sources = extract_sources(event.result.tool_name, event.result.content)
+                            if new_sources:
+                                sources.extend(new_sources)
+                                yield SSEEvent(
+                                    event_type=EventType.SEARCH_COMPLETED,
+                                    data={
+                                        "tool": event.result.tool_name,
+                                        "sources": new_sources,
+                                    }
+                                )
+    
+    total_ms = (time.perf_counter() - started) * 1000
+    metrics.timer("query_duration", total_ms, tags={"stream": "true"})
+    
+    yield SSEEvent(
+        event_type=EventType.AGENT_RESPONSE,
+        data={
+            "done": True,
+            "answer": str(run.result.output) if run.result else "",
+            "source_count": len(sources),
+            "ttft_ms": round(ttft_ms, 1) if ttft_ms is not None else None,
+            "duration_ms": round(total_ms, 1),
+        }
+    )
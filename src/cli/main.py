@@ -12,6 +12,9 @@ Usage:
     python -m src.cli ingest batch <directory>
     python -m src.cli query "<question>"
     python -m src.cli collections list
+    python -m src.cli collections tune <collection>
+    python -m src.cli collections advise-indexes <collection>
+    python -m src.cli collections export <collection> -o <file.ndjson>
     python -m src.cli health
 """
 
@@ -186,13 +189,23 @@ def ingest_batch(
     pattern: str = typer.Option("*", "--pattern", "-p", help="File pattern (e.g., '*.pdf')"),
     collection: Optional[str] = typer.Option(None, "--collection", "-c", help="Target collection"),
     max_files: int = typer.Option(100, "--max", "-m", help="Maximum files to process"),
+    jobs: int = typer.Option(4, "--jobs", "-j", min=1, help="Files converted in parallel"),
+    resume: bool = typer.Option(False, "--resume", help="Skip files already ingested by a previous run"),
+    manifest: Optional[str] = typer.Option(
+        None, "--manifest", help="Ingest manifest path (default: <directory>/.ingest_manifest.json)"
+    ),
 ):
     """
     Batch ingest multiple documents from a directory.
     
+    Files are converted in parallel (--jobs) while their chunks share
+    embedding batches. Every ingested file is recorded in a manifest, so an
+    interrupted run can be continued with --resume.
+    
     Example:
         python -m src.cli ingest batch ./documents
         python -m src.cli ingest batch ./pdfs --pattern "*.pdf" --collection research
+        python -m src.cli ingest batch ./pdfs --jobs 8 --resume
     """
     dir_path = Path(directory)
     
@@ -201,44 +214,79 @@ def ingest_batch(
         raise typer.Exit(code=1)
     
     # Find files
-    files = list(dir_path.glob(pattern))[:max_files]
+    files = [f for f in sorted(dir_path.glob(pattern)) if f.is_file()][:max_files]
     
     if not files:
         console.print(f"[yellow]No files found matching pattern: {pattern}[/yellow]")
         raise typer.Exit(code=0)
     
+    manifest_path = Path(manifest) if manifest else dir_path / ".ingest_manifest.json"
+    
     console.print(Panel(
         f"[bold]Batch Ingestion[/bold]\n"
         f"Directory: [cyan]{directory}[/cyan]\n"
         f"Pattern: [yellow]{pattern}[/yellow]\n"
         f"Files found: [green]{len(files)}[/green]\n"
-        f"Collection: [green]{collection or 'auto-detect'}[/green]",
+        f"Collection: [green]{collection or 'auto-detect'}[/green]\n"
+        f"Jobs: [green]{jobs}[/green]"
+        + (f"\nResuming from: [cyan]{manifest_path}[/cyan]" if resume else ""),
         title="RAG System",
         border_style="blue"
     ))
     
     # Run batch ingestion
-    asyncio.run(_ingest_batch_async(files, collection))
+    asyncio.run(_ingest_batch_async(files, collection, jobs, resume, manifest_path, dir_path))
 
 
-async def _ingest_batch_async(files: List[Path], collection: Optional[str]):
+async def _ingest_batch_async(
+    files: List[Path],
+    collection: Optional[str],
+    jobs: int = 4,
+    resume: bool = False,
+    manifest_path: Optional[Path] = None,
+    directory: Optional[Path] = None
+):
     """Async implementation of batch ingestion."""
     
     try:
-        from src.ingestion.ingest import DocumentIngestionPipeline
-        from src.storage import initialize_chroma, close_chroma
-        import os
+        import time
+        from src.ingestion.ingest import DocumentIngestionPipeline, IngestionConfig
+        from src.ingestion.model_registry import get_model_registry
+        from src.ingestion.parallel import IngestManifest, ParallelIngestor, get_stage_timings
+        
+        manifest = IngestManifest(manifest_path, resume=resume) if manifest_path else None
+        skipped = 0
+        if resume and manifest is not None:
+            pending = [f for f in files if not manifest.is_done(f)]
+            skipped = len(files) - len(pending)
+            files = pending
+            if skipped:
+                console.print(f"[dim]Skipping {skipped} already ingested files[/dim]")
+        
+        if not files:
+            console.print("[green]All files already ingested[/green]")
+            return
         
-        # Initialize services
+        # Initialize services (one pipeline shared by all workers)
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
             task = progress.add_task("Initializing services...", total=None)
-            await initialize_chroma()
+            pipeline = DocumentIngestionPipeline(
+                IngestionConfig(),
+                documents_folder=str(directory or files[0].parent),
+                clean_before_ingest=False,
+                models=get_model_registry()
+            )
+            await pipeline.initialize()
         
-        # Process files
-        pipeline = DocumentIngestionPipeline()
+        ingestor = ParallelIngestor(pipeline, jobs=jobs, manifest=manifest, collection_name=collection)
+        metadata = {"source": "cli_batch"}
+        if collection:
+            metadata["collection"] = collection
         
         completed = 0
         failed = 0
+        total_chunks = 0
+        start = time.perf_counter()
         
         with Progress(
             SpinnerColumn(),
@@ -249,23 +297,19 @@ async def _ingest_batch_async(files: List[Path], collection: Optional[str]):
             
             batch_task = progress.add_task("[cyan]Processing files...", total=len(files))
             
-            for file_path in files:
-                try:
-                    progress.update(batch_task, description=f"[cyan]Processing {file_path.name}")
-                    
-                    await pipeline.process_document(
-                        file_path=str(file_path),
-                        collection_name=collection,
-                        metadata={"source": "cli_batch"}
-                    )
-                    
-                    completed += 1
-                    progress.update(batch_task, advance=1)
-                    
-                except Exception as e:
-                    console.print(f"  [red]✗ Failed: {file_path.name} - {e}[/red]")
+            def on_result(file_path, result, error):
+                nonlocal completed, failed, total_chunks
+                if error is not None:
+                    console.print(f"  [red]✗ Failed: {file_path.name} - {error}[/red]")
                     failed += 1
-                    progress.update(batch_task, advance=1)
+                else:
+                    completed += 1
+                    total_chunks += result.chunks_created
+                progress.update(batch_task, advance=1, description=f"[cyan]Processed {file_path.name}")
+            
+            await ingestor.run(files, metadata=metadata, on_result=on_result)
+        
+        elapsed = time.perf_counter() - start
         
         # Show summary
         console.print("\n[bold]Batch Ingestion Complete[/bold]\n")
@@ -276,13 +320,38 @@ async def _ingest_batch_async(files: List[Path], collection: Optional[str]):
         
         summary_table.add_row("✓ Completed", f"[green]{completed}[/green]")
         summary_table.add_row("✗ Failed", f"[red]{failed}[/red]")
+        if skipped:
+            summary_table.add_row("↷ Skipped", f"[dim]{skipped}[/dim]")
         summary_table.add_row("Total", str(len(files)))
         summary_table.add_row("Success Rate", f"{(completed/len(files)*100):.1f}%")
+        summary_table.add_row("Chunks", str(total_chunks))
+        summary_table.add_row("Elapsed", f"{elapsed:.1f}s")
+        summary_table.add_row("Throughput", f"{completed/elapsed:.2f} files/s, {total_chunks/elapsed:.1f} chunks/s")
+        summary_table.add_row("Embedding Batches", str(ingestor.batcher.flushes))
         
         console.print(summary_table)
         
+        # Per-stage timings (stages overlap across files, so totals can exceed elapsed time)
+        stage_table = Table(title="Stage Timings", show_header=True, header_style="bold cyan")
+        stage_table.add_column("Stage", style="cyan")
+        stage_table.add_column("Calls", justify="right")
+        stage_table.add_column("Total", justify="right")
+        stage_table.add_column("Avg", justify="right")
+        stage_table.add_column("p95", justify="right")
+        
+        for stage, stats in get_stage_timings().items():
+            stage_table.add_row(
+                stage,
+                str(stats["count"]),
+                f"{stats['total_ms'] / 1000:.1f}s",
+                f"{stats['avg_ms']:.0f}ms",
+                f"{stats['p95_ms']:.0f}ms",
+            )
+        
+        console.print(stage_table)
+        
         # Cleanup
-        await close_chroma()
+        await pipeline.close()
         
     except Exception as e:
         console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
@@ -423,6 +492,187 @@ async def _list_collections_async():
         raise typer.Exit(code=1)
 
 
+@collections_app.command("tune")
+def tune_collection(
+    collection: str = typer.Argument(..., help="Qdrant collection to tune"),
+    target_recall: float = typer.Option(0.95, "--target-recall", "-r", help="Required recall@k (0-1)"),
+    k: int = typer.Option(10, "--k", "-k", help="Result count for recall@k"),
+    samples: int = typer.Option(100, "--samples", "-s", help="Stored vectors used as queries"),
+    host: str = typer.Option("localhost", "--host", help="Qdrant host"),
+    port: int = typer.Option(6333, "--port", help="Qdrant port"),
+    tuning_file: str = typer.Option("configs/qdrant_tuning.json", "--tuning-file", help="Where to persist the result"),
+):
+    """
+    Find the smallest hnsw_ef meeting a target recall and save it as the collection default.
+    
+    Example:
+        python -m src.cli collections tune agent_kit --target-recall 0.98
+    """
+    try:
+        from src.storage.qdrant_store import QdrantStore, QdrantStoreConfig
+        from src.storage.search_tuner import tune_hnsw_ef, save_tuning
+        
+        store = QdrantStore(QdrantStoreConfig(
+            host=host,
+            port=port,
+            collection_name=collection,
+            tuning_file=None,  # Tune from scratch
+            create_if_missing=False,  # Read-only: fail on a mistyped name
+            reconcile_indexes=False
+        ))
+        
+        with console.status(f"Tuning hnsw_ef for {collection}..."):
+            result = tune_hnsw_ef(store, target_recall=target_recall, k=k, samples=samples)
+        
+        table = Table(show_header=True, header_style="bold cyan")
+        table.add_column("hnsw_ef", justify="right", style="cyan")
+        table.add_column(f"Recall@{k}", justify="right", style="yellow")
+        table.add_column("p50 (ms)", justify="right")
+        table.add_column("p95 (ms)", justify="right")
+        for row in result.evaluated:
+            table.add_row(
+                str(int(row["hnsw_ef"])),
+                f"{row['recall']:.3f}",
+                f"{row['p50_ms']:.2f}",
+                f"{row['p95_ms']:.2f}"
+            )
+        console.print(table)
+        
+        save_tuning(tuning_file, result)
+        
+        if result.met_target:
+            console.print(f"\n[bold green]✓[/bold green] hnsw_ef={result.hnsw_ef} meets recall {target_recall} (saved to {tuning_file})")
+        else:
+            console.print(f"\n[yellow]⚠ No candidate met recall {target_recall}; saved best hnsw_ef={result.hnsw_ef}[/yellow]")
+        
+    except Exception as e:
+        console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+
+@collections_app.command("advise-indexes")
+def advise_indexes(
+    collection: str = typer.Argument(..., help="Qdrant collection to inspect"),
+    min_count: int = typer.Option(10, "--min-count", "-m", help="Minimum filtered searches to recommend an index"),
+    apply: bool = typer.Option(False, "--apply", help="Create the recommended indexes"),
+    host: str = typer.Option("localhost", "--host", help="Qdrant host"),
+    port: int = typer.Option(6333, "--port", help="Qdrant port"),
+):
+    """
+    Recommend payload indexes for frequently filtered fields (from recorded filter usage).
+    
+    Example:
+        python -m src.cli collections advise-indexes agent_kit --apply
+    """
+    try:
+        from src.storage.qdrant_store import QdrantStore, QdrantStoreConfig
+        from src.storage.index_advisor import recommend_indexes, apply_recommendations
+        
+        store = QdrantStore(QdrantStoreConfig(
+            host=host,
+            port=port,
+            collection_name=collection,
+            track_filter_usage=False,  # Don't count the advisor's own queries
+            create_if_missing=False,  # Read-only: fail on a mistyped name
+            reconcile_indexes=False
+        ))
+        
+        recommendations = recommend_indexes(store, min_count=min_count)
+        if not recommendations:
+            console.print(f"[green]✓[/green] No unindexed fields filtered at least {min_count} times in {collection}")
+            return
+        
+        if apply:
+            apply_recommendations(store, recommendations)
+        
+        table = Table(show_header=True, header_style="bold cyan")
+        table.add_column("Field", style="cyan")
+        table.add_column("Filtered", justify="right", style="yellow")
+        table.add_column("Schema")
+        table.add_column("Status")
+        for rec in recommendations:
+            if rec.schema is None:
+                status = "[yellow]type unknown[/yellow]"
+            elif rec.created:
+                status = "[green]created[/green]"
+            else:
+                status = "recommended" if not apply else "[red]failed[/red]"
+            table.add_row(
+                rec.field_name,
+                str(rec.filter_count),
+                rec.schema.value if rec.schema else "-",
+                status
+            )
+        console.print(table)
+        
+        if not apply:
+            console.print("\nRun with [cyan]--apply[/cyan] to create these indexes")
+        
+    except Exception as e:
+        console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+
+@collections_app.command("export")
+def export_collection(
+    collection: str = typer.Argument(..., help="Qdrant collection to export"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="NDJSON file to write (default: stdout)"),
+    document_id: Optional[str] = typer.Option(None, "--document", "-d", help="Only export this document's chunks"),
+    with_vectors: bool = typer.Option(False, "--with-vectors", help="Include stored vectors"),
+    batch_size: int = typer.Option(256, "--batch-size", "-b", help="Points fetched per scroll page"),
+    host: str = typer.Option("localhost", "--host", help="Qdrant host"),
+    port: int = typer.Option(6333, "--port", help="Qdrant port"),
+):
+    """
+    Export a collection as NDJSON (one chunk per line) using scroll pagination.
+    
+    Memory stays constant regardless of collection size.
+    
+    Example:
+        python -m src.cli collections export agent_kit -o agent_kit.ndjson --with-vectors
+    """
+    import json
+    
+    try:
+        from src.storage.qdrant_store import QdrantStore, QdrantStoreConfig
+        
+        store = QdrantStore(QdrantStoreConfig(
+            host=host,
+            port=port,
+            collection_name=collection,
+            track_filter_usage=False,  # Exports are not search traffic
+            create_if_missing=False,  # Read-only: fail on a mistyped name
+            reconcile_indexes=False
+        ))
+        
+        points = store.iter_points(
+            filter_conditions={"document_id": document_id} if document_id else None,
+            batch_size=batch_size,
+            with_vectors=with_vectors
+        )
+        
+        count = 0
+        if output is None:
+            for point in points:
+                sys.stdout.write(json.dumps(point, default=str) + "\n")
+                count += 1
+            sys.stdout.flush()
+            return
+        
+        with open(output, "w", encoding="utf-8") as f, console.status(f"Exporting {collection}...") as status:
+            for point in points:
+                f.write(json.dumps(point, default=str) + "\n")
+                count += 1
+                if count % 1000 == 0:
+                    status.update(f"Exporting {collection}... {count:,} points")
+        
+        console.print(f"[bold green]✓[/bold green] Exported {count:,} points from {collection} to {output}")
+        
+    except Exception as e:
+        console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+
 # ============================================================================
 # HEALTH COMMAND
 # ============================================================================
@@ -0,0 +1,499 @@
+"""
+Shared embedding/rerank sidecar for multi-process deployments.
+
+Large embedding models (e.g. the 7B nomic-embed-code) cannot be loaded once
+per process when the API runs several uvicorn workers next to the ingestion
+worker and MCP servers. The sidecar loads the embedder (and reranker) once
+and serves every local process over a Unix socket:
+
+- Requests from all clients arriving within a short window are merged into
+  one ``encode`` call per task (cross-process batching)
+- Rerank requests go through the reranker's own request coalescing
+- Latency is recorded per client and operation (``sidecar_request_duration``)
+  and returned by the ``stats`` operation
+
+Protocol: length-prefixed (4-byte big-endian) JSON frames. Embeddings are
+returned as base64-encoded float32 arrays to keep frames small.
+
+When ``EMBEDDING_SIDECAR_SOCKET`` points to a running sidecar,
+``SentenceTransformerEmbedder`` and ``SentenceTransformerReranker`` become
+thin clients instead of loading their models.
+
+Usage:
+    python -m src.config.embedding_sidecar --socket /run/rag/embed.sock
+"""
+
+import argparse
+import asyncio
+import base64
+import itertools
+import json
+import logging
+import os
+import socket
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.monitoring.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = "/tmp/rag-embedding-sidecar.sock"
+
+# Frames above this size are rejected (protects the sidecar from bad clients)
+MAX_FRAME_BYTES = 256 * 1024 * 1024
+
+
+def _encode_frame(message: Dict[str, Any]) -> bytes:
+    data = json.dumps(message).encode("utf-8")
+    return len(data).to_bytes(4, "big") + data
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    size = int.from_bytes(await reader.readexactly(4), "big")
+    if size > MAX_FRAME_BYTES:
+        raise ValueError(f"Frame too large: {size} bytes")
+    return json.loads(await reader.readexactly(size))
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Embedding sidecar closed the connection")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _pack_vectors(vectors: List[List[float]]) -> Dict[str, Any]:
+    """Encode vectors as base64 float32."""
+    flat = array("f", (value for vector in vectors for value in vector))
+    return {
+        "count": len(vectors),
+        "dim": len(vectors[0]) if vectors else 0,
+        "data": base64.b64encode(flat.tobytes()).decode("ascii"),
+    }
+
+
+def _unpack_vectors(packed: Dict[str, Any]) -> List[List[float]]:
+    """Decode vectors packed by _pack_vectors()."""
+    flat = array("f")
+    flat.frombytes(base64.b64decode(packed["data"]))
+    dim = packed["dim"]
+    values = flat.tolist()
+    return [values[i * dim:(i + 1) * dim] for i in range(packed["count"])]
+
+
+class EmbeddingSidecarServer:
+    """
+    Unix-socket server holding one embedder and reranker for all local processes.
+
+    Example:
+        >>> server = EmbeddingSidecarServer("/tmp/embed.sock")
+        >>> await server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        embedder_config: Optional[Any] = None,
+        batch_window_ms: float = 5.0,
+        max_batch_texts: int = 256,
+        enable_reranker: bool = True
+    ):
+        """
+        Initialize sidecar (models load in serve_forever()).
+
+        Args:
+            socket_path: Unix socket to listen on
+            embedder_config: EmbedderConfig (default: from environment)
+            batch_window_ms: How long to wait for other requests to join a batch
+            max_batch_texts: Flush a batch early once it holds this many texts
+            enable_reranker: Also serve rerank requests
+        """
+        self.socket_path = socket_path
+        self.embedder_config = embedder_config
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_texts = max_batch_texts
+        self.enable_reranker = enable_reranker
+
+        self.embedder = None
+        self.reranker = None
+
+        # task -> [(texts, future)] waiting to be encoded together
+        self._pending: Dict[str, List[Tuple[List[str], "asyncio.Future[List[List[float]]]"]]] = {}
+        self._pending_texts: Dict[str, int] = {}
+        self._flush_handles: Dict[str, asyncio.TimerHandle] = {}
+
+        self._clients: Set[Tuple[str, str]] = set()
+        self.batches = 0
+        self.batched_texts = 0
+        self.started_at = time.time()
+
+    def _load_models(self) -> None:
+        """Load the embedder and reranker (never through another sidecar)."""
+        from src.config.jina_provider import SentenceTransformerEmbedder, EmbedderConfig
+
+        config = self.embedder_config or EmbedderConfig.from_env()
+        config.sidecar_socket = None
+        self.embedder = SentenceTransformerEmbedder(config)
+
+        if self.enable_reranker:
+            from src.config.reranker import SentenceTransformerReranker, RerankerConfig
+            self.reranker = SentenceTransformerReranker(RerankerConfig(sidecar_socket=None))
+
+    def _info(self) -> Dict[str, Any]:
+        return {
+            "model_name": self.embedder.config.model_name,
+            "dimension": self.embedder.get_dimension(),
+            "reranker_model": self.reranker.config.model_name if self.reranker else None,
+        }
+
+    async def _embed(self, texts: List[str], task: str) -> List[List[float]]:
+        """Queue texts for the next batch of their task and wait for the result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(task, []).append((texts, future))
+        self._pending_texts[task] = self._pending_texts.get(task, 0) + len(texts)
+
+        if self._pending_texts[task] >= self.max_batch_texts:
+            self._schedule_flush(task, immediate=True)
+        elif task not in self._flush_handles:
+            self._schedule_flush(task)
+
+        return await future
+
+    def _schedule_flush(self, task: str, immediate: bool = False) -> None:
+        handle = self._flush_handles.pop(task, None)
+        if handle is not None:
+            handle.cancel()
+        loop = asyncio.get_running_loop()
+        if immediate:
+            loop.create_task(self._flush(task))
+        else:
+            self._flush_handles[task] = loop.call_later(
+                self.batch_window_ms / 1000, lambda: loop.create_task(self._flush(task))
+            )
+
+    async def _flush(self, task: str) -> None:
+        """Encode every pending request of a task in one call."""
+        self._flush_handles.pop(task, None)
+        batch = self._pending.pop(task, [])
+        self._pending_texts.pop(task, None)
+        if not batch:
+            return
+
+        texts = [text for request_texts, _ in batch for text in request_texts]
+        self.batches += 1
+        self.batched_texts += len(texts)
+        get_metrics().histogram("sidecar_batch_texts", len(texts), tags={"task": task})
+
+        try:
+            vectors = await self.embedder.embed_texts(texts, task=task)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        start = 0
+        for request_texts, future in batch:
+            if not future.done():
+                future.set_result(vectors[start:start + len(request_texts)])
+            start += len(request_texts)
+
+    async def _rerank(self, pairs: List[List[str]]) -> List[float]:
+        """Score pairs; per-query requests are coalesced by the reranker."""
+        if self.reranker is None:
+            raise RuntimeError("Reranking is disabled on this sidecar")
+
+        by_query: Dict[str, List[int]] = {}
+        for index, (query, _) in enumerate(pairs):
+            by_query.setdefault(query, []).append(index)
+
+        scores = [0.0] * len(pairs)
+        results = await asyncio.gather(*(
+            self.reranker.score_pairs(query, [pairs[i][1] for i in indices])
+            for query, indices in by_query.items()
+        ))
+        for indices, query_scores in zip(by_query.values(), results):
+            for index, score in zip(indices, query_scores):
+                scores[index] = score
+        return scores
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batching statistics and latency per client and operation."""
+        metrics = get_metrics()
+        clients: Dict[str, Dict[str, Any]] = {}
+        for client, op in sorted(self._clients):
+            clients.setdefault(client, {})[op] = metrics.get_timer_stats(
+                "sidecar_request_duration", tags={"client": client, "op": op}
+            )
+        return {
+            "uptime_seconds": time.time() - self.started_at,
+            "batches": self.batches,
+            "avg_batch_texts": self.batched_texts / self.batches if self.batches else 0.0,
+            "clients": clients,
+        }
+
+    async def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        if op == "embed":
+            vectors = await self._embed(request["texts"], request.get("task", "search_document"))
+            return {"vectors": _pack_vectors(vectors)}
+        if op == "rerank":
+            return {"scores": await self._rerank(request["pairs"])}
+        if op == "info":
+            return self._info()
+        if op == "stats":
+            return self.get_stats()
+        raise ValueError(f"Unknown operation: {op}")
+
+    async def _respond(
+        self,
+        request: Dict[str, Any],
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock
+    ) -> None:
+        start = time.perf_counter()
+        client = str(request.get("client", "unknown"))
+        op = str(request.get("op"))
+        try:
+            response = await self._dispatch(request)
+        except Exception as e:
+            logger.error(f"Sidecar {op} request from {client} failed: {e}")
+            response = {"error": str(e)}
+        response["id"] = request.get("id")
+
+        if op in ("embed", "rerank"):
+            self._clients.add((client, op))
+            get_metrics().timer(
+                "sidecar_request_duration",
+                (time.perf_counter() - start) * 1000,
+                tags={"client": client, "op": op}
+            )
+
+        async with write_lock:
+            writer.write(_encode_frame(response))
+            await writer.drain()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection; requests on it are handled concurrently."""
+        write_lock = asyncio.Lock()
+        tasks: Set[asyncio.Task] = set()
+        try:
+            while True:
+                request = await _read_frame(reader)
+                task = asyncio.create_task(self._respond(request, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # Client disconnected
+        except Exception as e:
+            logger.warning(f"Dropping sidecar connection: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def serve_forever(self) -> None:
+        """Load models and serve until cancelled."""
+        await asyncio.to_thread(self._load_models)
+
+        path = Path(self.socket_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()
+
+        server = await asyncio.start_unix_server(self._handle_connection, path=str(path))
+        os.chmod(path, 0o660)
+        info = self._info()
+        logger.info(
+            f"Embedding sidecar listening on {path} "
+            f"(model={info['model_name']}, dim={info['dimension']}, reranker={info['reranker_model']})"
+        )
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if path.exists():
+                path.unlink()
+            if self.reranker:
+                self.reranker.close()
+
+
+class EmbeddingSidecarClient:
+    """
+    Client for a running embedding sidecar.
+
+    Async requests share one connection and are matched to responses by id,
+    so concurrent callers in a process are batched together by the sidecar.
+    ``request_sync`` is for callers on worker threads (e.g. reranker inference).
+
+    Raises:
+        OSError: On construction, if no sidecar is listening on the socket
+    """
+
+    def __init__(self, socket_path: str, client_name: Optional[str] = None, timeout: float = 120.0):
+        self.socket_path = socket_path
+        self.client_name = client_name or os.getenv(
+            "EMBEDDING_SIDECAR_CLIENT", f"{Path(sys.argv[0]).stem or 'python'}-{os.getpid()}"
+        )
+        self.timeout = timeout
+
+        self._ids = itertools.count(1)
+        self._waiters: Dict[int, "asyncio.Future[Dict[str, Any]]"] = {}
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._read_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+        # Fails fast if the sidecar is not running
+        self.info = self.request_sync({"op": "info"})
+
+    def request_sync(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Blocking request over a short-lived connection."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(_encode_frame({"id": 0, "client": self.client_name, **message}))
+            size = int.from_bytes(_recv_exactly(sock, 4), "big")
+            response = json.loads(_recv_exactly(sock, size))
+        if "error" in response:
+            raise RuntimeError(f"Embedding sidecar error: {response['error']}")
+        return response
+
+    async def _ensure_connected(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or a new event loop (e.g. successive asyncio.run calls)
+            self._loop = loop
+            self._connect_lock = asyncio.Lock()
+            self._writer = None
+            self._waiters = {}
+
+        async with self._connect_lock:
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_unix_connection(self.socket_path)
+                self._read_task = asyncio.create_task(self._read_loop(self._reader))
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        """Route responses to their waiting requests."""
+        try:
+            while True:
+                response = await _read_frame(reader)
+                future = self._waiters.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            # Connection lost: fail in-flight requests and reconnect on next use
+            self._writer = None
+            waiters, self._waiters = self._waiters, {}
+            for future in waiters.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"Embedding sidecar connection lost: {e}"))
+
+    async def request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request and wait for its response."""
+        await self._ensure_connected()
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[request_id] = future
+
+        self._writer.write(_encode_frame({"id": request_id, "client": self.client_name, **message}))
+        await self._writer.drain()
+
+        try:
+            response = await asyncio.wait_for(future, self.timeout)
+        finally:
+            self._waiters.pop(request_id, None)
+        if "error" in response:
+            raise RuntimeError(f"Embedding sidecar error: {response['error']}")
+        return response
+
+    async def embed(self, texts: List[str], task: str = "search_document") -> List[List[float]]:
+        """Embed texts on the sidecar."""
+        response = await self.request({"op": "embed", "texts": texts, "task": task})
+        return _unpack_vectors(response["vectors"])
+
+    def score_pairs_sync(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """Score (query, document) pairs on the sidecar (blocking)."""
+        return self.request_sync({"op": "rerank", "pairs": [list(pair) for pair in pairs]})["scores"]
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Sidecar batching and per-client latency statistics."""
+        return await self.request({"op": "stats"})
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._read_task is not None:
+            self._read_task.cancel()
+            self._read_task = None
+
+
+def connect_sidecar(socket_path: Optional[str], purpose: str) -> Optional[EmbeddingSidecarClient]:
+    """
+    Connect to the sidecar if one is configured and running.
+
+    Args:
+        socket_path: Configured socket (None = sidecar disabled)
+        purpose: What the connection is for (logging)
+
+    Returns:
+        Client, or None to fall back to loading the model in-process
+    """
+    if not socket_path:
+        return None
+    try:
+        client = EmbeddingSidecarClient(socket_path)
+        logger.info(f"Using embedding sidecar at {socket_path} for {purpose}")
+        return client
+    except OSError as e:
+        logger.warning(f"Embedding sidecar at {socket_path} unavailable ({e}); loading {purpose} in-process")
+        return None
+
+
+def main() -> None:
+    """Run the sidecar from the command line."""
+    parser = argparse.ArgumentParser(description="Shared embedding/rerank sidecar")
+    parser.add_argument("--socket", default=os.getenv("EMBEDDING_SIDECAR_SOCKET", DEFAULT_SOCKET_PATH))
+    parser.add_argument("--model", default=None, help="Embedding model (default: EMBEDDING_MODEL)")
+    parser.add_argument("--device", default=None, help="cpu/cuda/mps/auto (default: EMBEDDING_DEVICE)")
+    parser.add_argument("--batch-window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--no-reranker", action="store_true", help="Do not load or serve the reranker")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    from src.config.jina_provider import EmbedderConfig
+    config = EmbedderConfig.from_env()
+    if args.model:
+        config.model_name = args.model
+    if args.device:
+        config.device = args.device
+
+    server = EmbeddingSidecarServer(
+        socket_path=args.socket,
+        embedder_config=config,
+        batch_window_ms=args.batch_window_ms,
+        max_batch_texts=args.max_batch,
+        enable_reranker=not args.no_reranker,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,11 @@ Recommended Models for Code/Documentation:
 - codellama/CodeLlama-7b-Instruct-hf (4096 dim, very specialized)
 
 For your use case (code/docs/workflows): nomic-ai/nomic-embed-code
+
+Multi-process deployments: set EMBEDDING_SIDECAR_SOCKET to the socket of a
+running embedding sidecar (``python -m src.config.embedding_sidecar``) and the
+embedder forwards requests there instead of loading its own copy of the model.
+torch and sentence-transformers are only imported when a model is loaded locally.
 """
 
 import logging
@@ -18,9 +23,7 @@ import os
 from typing import List, Optional
 import asyncio
 
-from sentence_transformers import SentenceTransformer
 from pydantic import BaseModel, Field
-import torch
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +53,10 @@ class EmbedderConfig(BaseModel):
         default=False,
         description="Show progress bar during encoding"
     )
+    sidecar_socket: Optional[str] = Field(
+        default_factory=lambda: os.getenv("EMBEDDING_SIDECAR_SOCKET") or None,
+        description="Unix socket of a shared embedding sidecar (None = load model in-process)"
+    )
     
     @classmethod
     def from_env(cls) -> "EmbedderConfig":
@@ -70,6 +77,7 @@ class SentenceTransformerEmbedder:
     - Automatic batching for efficiency
     - GPU support (CUDA/MPS)
     - Multiple model options
+    - Optional shared sidecar (one model copy for all local processes)
     
     Usage:
         embedder = SentenceTransformerEmbedder(config)
@@ -84,6 +92,13 @@ class SentenceTransformerEmbedder:
             config: Optional config, defaults to env-based config
         """
         self.config = config or EmbedderConfig.from_env()
+        self.model = None
+        self.sidecar = self._connect_sidecar()
+        if self.sidecar is not None:
+            return
+        
+        import torch
+        from sentence_transformers import SentenceTransformer
         
         # Auto-detect device if not specified
         if self.config.device == "auto":
@@ -115,6 +130,19 @@ class SentenceTransformerEmbedder:
             f"device={self.config.device}, dim={self.get_dimension()})"
         )
     
+    def _connect_sidecar(self):
+        """Use the configured sidecar if it is running and serves the same model."""
+        from src.config.embedding_sidecar import connect_sidecar
+        
+        sidecar = connect_sidecar(self.config.sidecar_socket, f"embeddings ({self.config.model_name})")
+        if sidecar is not None and sidecar.info["model_name"] != self.config.model_name:
+            logger.warning(
+                f"Embedding sidecar serves {sidecar.info['model_name']}, not {self.config.model_name}; "
+                f"loading model in-process"
+            )
+            return None
+        return sidecar
+    
     async def embed_texts(
         self,
         texts: List[str],
@@ -137,6 +165,9 @@ class SentenceTransformerEmbedder:
         if not texts:
             return []
         
+        if self.sidecar is not None:
+            return await self.sidecar.embed(texts, task=task)
+        
         # Run encoding in thread pool to avoid blocking event loop
         loop = asyncio.get_event_loop()
         
@@ -212,13 +243,17 @@ class SentenceTransformerEmbedder:
     
     def get_dimension(self) -> int:
         """Get embedding dimension for the current model."""
+        if self.sidecar is not None:
+            return int(self.sidecar.info["dimension"])
+        
         # Get dimension from loaded model
         dimension = self.model.get_sentence_embedding_dimension()
         return int(dimension) if dimension is not None else 0
     
     async def close(self):
-        """Cleanup resources (no-op for local models)."""
-        pass
+        """Cleanup resources (closes the sidecar connection, no-op for local models)."""
+        if self.sidecar is not None:
+            await self.sidecar.close()
     
     async def __aenter__(self):
         return self
@@ -6,19 +6,22 @@ Provides multiple optimization strategies:
 2. Quantized models (4x smaller, 2-3x faster)
 3. Distilled models (smaller, faster, 95% quality)
 4. Multi-processing (parallel batch processing)
+
+torch, numpy and sentence-transformers are imported by the embedder that
+needs them, so importing this module is cheap.
 """
 
 import logging
 import os
-from typing import List, Optional, Literal
+from typing import TYPE_CHECKING, List, Optional, Literal
 import asyncio
 from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 
-from sentence_transformers import SentenceTransformer
 from pydantic import BaseModel, Field
-import torch
-import numpy as np
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +107,8 @@ class ONNXEmbedder:
     
     def _mean_pooling(self, model_output, attention_mask):
         """Mean pooling to get sentence embeddings."""
+        import torch
+        
         token_embeddings = model_output[0]
         input_mask_expanded = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
         return torch.sum(token_embeddings * input_mask_expanded, 1) / torch.clamp(
@@ -118,6 +123,8 @@ class ONNXEmbedder:
         loop = asyncio.get_event_loop()
         
         def _encode():
+            import torch
+            
             # Tokenize
             encoded_input = self.tokenizer(
                 texts,
@@ -188,6 +195,8 @@ class QuantizedEmbedder:
         
         logger.info(f"Loading quantized model: {model_name}")
         
+        from sentence_transformers import SentenceTransformer
+        
         # Load model
         self.model = SentenceTransformer(model_name)
         
@@ -254,8 +263,10 @@ class MultiProcessEmbedder:
         logger.info(f"Multi-process embedder ({num_workers} workers)")
     
     @staticmethod
-    def _encode_batch(model_name: str, texts: List[str]) -> np.ndarray:
+    def _encode_batch(model_name: str, texts: List[str]) -> "np.ndarray":
         """Encode batch in separate process."""
+        from sentence_transformers import SentenceTransformer
+        
         model = SentenceTransformer(model_name)
         return model.encode(texts, normalize_embeddings=True, convert_to_numpy=True)
     
@@ -278,6 +289,8 @@ class MultiProcessEmbedder:
                 lambda: list(executor.map(encode_fn, chunks))
             )
         
+        import numpy as np
+        
         # Combine results
         embeddings = np.vstack(results)
         
@@ -299,6 +312,8 @@ class MultiProcessEmbedder:
     
     def get_dimension(self) -> int:
         """Get embedding dimension."""
+        from sentence_transformers import SentenceTransformer
+        
         model = SentenceTransformer(self.model_name)
         return model.get_sentence_embedding_dimension()
 
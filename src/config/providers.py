@@ -4,16 +4,20 @@ Simplified provider configuration for OpenAI models.
 COPIED AND REFACTORED FROM: ottomator-agents/docling-rag-agent/utils/providers.py
 
 Provides flexible LLM and embedding client creation with environment-based configuration.
+
+pydantic_ai and openai are imported inside the factory functions, so importing
+this module (and the src.config package) stays cheap.
 """
 
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pydantic import BaseModel, Field
-from pydantic_ai.models.openai import OpenAIModel
-from pydantic_ai.providers.openai import OpenAIProvider
-import openai
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    import openai
+    from pydantic_ai.models.openai import OpenAIModel
+
 # Load environment variables
 load_dotenv()
 
@@ -47,7 +51,7 @@ class ProviderConfig(BaseModel):
         )
 
 
-def get_llm_model() -> OpenAIModel:
+def get_llm_model() -> "OpenAIModel":
     """
     Get LLM model configuration for OpenAI.
     
@@ -59,13 +63,16 @@ def get_llm_model() -> OpenAIModel:
     if not config.openai_api_key:
         raise ValueError("OPENAI_API_KEY environment variable is required")
     
+    from pydantic_ai.models.openai import OpenAIModel
+    from pydantic_ai.providers.openai import OpenAIProvider
+    
     return OpenAIModel(
         config.llm_model, 
         provider=OpenAIProvider(api_key=config.openai_api_key)
     )
 
 
-def get_embedding_client() -> openai.AsyncOpenAI:
+def get_embedding_client() -> "openai.AsyncOpenAI":
     """
     Get OpenAI client for embeddings.
     
@@ -77,6 +84,8 @@ def get_embedding_client() -> openai.AsyncOpenAI:
     if not config.openai_api_key:
         raise ValueError("OPENAI_API_KEY environment variable is required")
     
+    import openai
+    
     return openai.AsyncOpenAI(api_key=config.openai_api_key)
 
 
@@ -91,7 +100,7 @@ def get_embedding_model() -> str:
     return config.embedding_model
 
 
-def get_ingestion_model() -> OpenAIModel:
+def get_ingestion_model() -> "OpenAIModel":
     """
     Get model for ingestion tasks (uses same model as main LLM).
     
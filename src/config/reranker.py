@@ -14,13 +14,28 @@ Benefits:
 - Works with existing embeddings (no reindexing)
 - Fast (only reranks small candidate set)
 - Easy to integrate (drop-in enhancement)
+
+Serving:
+- Model calls run on a dedicated executor, never on the event loop
+- Concurrent rerank requests are coalesced into shared, length-sorted batches
+- Optional ONNX backend (e.g. an int8-quantized export) for faster CPU inference
+- Latency is recorded as the ``reranker_duration`` timer (p50/p95/p99)
+- Scores are cached per (query, chunk, model), so reformulated queries with
+  overlapping candidates only score the new pairs
+- With EMBEDDING_SIDECAR_SOCKET set, inference is forwarded to the shared
+  embedding sidecar instead of loading a CrossEncoder per process
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
 
-from sentence_transformers import CrossEncoder
+from src.monitoring.metrics import Timer, get_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +60,35 @@ class RerankerConfig:
     
     activation_function: Optional[str] = None
     """Activation function (None = model default, 'sigmoid' for probabilities)"""
+    
+    max_length: int = 512
+    """Maximum tokens per query-document pair"""
+    
+    backend: str = "torch"
+    """Inference backend: 'torch' or 'onnx' (requires sentence-transformers[onnx])"""
+    
+    onnx_file_name: Optional[str] = None
+    """
+    ONNX export to load, e.g. 'onnx/model_qint8_avx512_vnni.onnx' for an int8
+    model (None = the default 'onnx/model.onnx'; exported on first load if missing)
+    """
+    
+    max_workers: int = 1
+    """Threads in the dedicated inference executor"""
+    
+    coalesce_window_ms: float = 2.0
+    """How long to wait for concurrent requests to join a batch"""
+    
+    max_batch_pairs: int = 256
+    """Flush a coalesced batch early once it holds this many pairs"""
+    
+    score_cache_size: int = 50000
+    """Cached (query, chunk) scores (0 = disabled)"""
+    
+    sidecar_socket: Optional[str] = field(
+        default_factory=lambda: os.getenv("EMBEDDING_SIDECAR_SOCKET") or None
+    )
+    """Unix socket of a shared embedding sidecar (None = load CrossEncoder in-process)"""
 
 
 class SentenceTransformerReranker:
@@ -75,19 +119,201 @@ class SentenceTransformerReranker:
             config: Reranker configuration (uses defaults if None)
         """
         self.config = config or RerankerConfig()
+        self.model = None
+        self.sidecar = self._connect_sidecar()
+        
+        if self.sidecar is None:
+            self._load_model()
+        
+        # Inference must never run on the event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.max_workers,
+            thread_name_prefix="reranker"
+        )
+        # Requests waiting to be coalesced: (pairs, future for their scores)
+        self._pending: List[Tuple[List[Tuple[str, str]], "asyncio.Future[List[float]]"]] = []
+        self._pending_pairs = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        
+        # (query hash, chunk key, model) -> score
+        self._score_cache: "OrderedDict[Tuple[str, str, str], float]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def _connect_sidecar(self):
+        """Use the configured sidecar if it is running and serves the same model."""
+        from src.config.embedding_sidecar import connect_sidecar
         
-        logger.info(f"Loading CrossEncoder model: {self.config.model_name}")
+        sidecar = connect_sidecar(self.config.sidecar_socket, f"reranking ({self.config.model_name})")
+        if sidecar is not None and sidecar.info.get("reranker_model") != self.config.model_name:
+            logger.warning(
+                f"Embedding sidecar reranks with {sidecar.info.get('reranker_model')}, "
+                f"not {self.config.model_name}; loading CrossEncoder in-process"
+            )
+            return None
+        return sidecar
+    
+    def _load_model(self) -> None:
+        """Load the CrossEncoder in-process."""
+        from sentence_transformers import CrossEncoder
+        
+        logger.info(f"Loading CrossEncoder model: {self.config.model_name} ({self.config.backend})")
         try:
+            model_kwargs: Dict[str, Any] = {}
+            if self.config.backend == "onnx":
+                model_kwargs["backend"] = "onnx"
+                if self.config.onnx_file_name:
+                    model_kwargs["model_kwargs"] = {"file_name": self.config.onnx_file_name}
+            
             self.model = CrossEncoder(
                 self.config.model_name,
-                max_length=512,  # Standard max length for most models
-                device=None  # Auto-detect (CUDA if available)
+                max_length=self.config.max_length,
+                device=None,  # Auto-detect (CUDA if available)
+                **model_kwargs
             )
             logger.info(f"CrossEncoder loaded successfully on device: {self.model.device}")
         except Exception as e:
             logger.error(f"Failed to load CrossEncoder: {e}")
             raise
     
+    def _predict(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """Blocking model call (runs on the reranker executor)."""
+        if self.sidecar is not None:
+            return self.sidecar.score_pairs_sync(pairs)
+        
+        scores = self.model.predict(
+            pairs,
+            batch_size=self.config.batch_size,
+            show_progress_bar=self.config.show_progress,
+            activation_fct=self.config.activation_function
+        )
+        return scores.tolist() if hasattr(scores, 'tolist') else list(scores)
+    
+    def _schedule_flush(self) -> None:
+        """Flush now if the batch is full, otherwise after the coalescing window."""
+        loop = asyncio.get_running_loop()
+        if self._pending_pairs >= self.config.max_batch_pairs:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self._flush_handle = None
+            loop.create_task(self._flush())
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.config.coalesce_window_ms / 1000,
+                lambda: loop.create_task(self._flush())
+            )
+    
+    async def _flush(self) -> None:
+        """Score all pending requests as one length-sorted batch."""
+        self._flush_handle = None
+        pending, self._pending, self._pending_pairs = self._pending, [], 0
+        if not pending:
+            return
+        
+        pairs = [pair for request_pairs, _ in pending for pair in request_pairs]
+        # Similar lengths in a batch means less padding per forward pass
+        order = sorted(range(len(pairs)), key=lambda i: len(pairs[i][0]) + len(pairs[i][1]))
+        
+        try:
+            sorted_scores = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._predict, [pairs[i] for i in order]
+            )
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        scores = [0.0] * len(pairs)
+        for position, index in enumerate(order):
+            scores[index] = float(sorted_scores[position])
+        
+        get_metrics().histogram("reranker_batch_pairs", len(pairs))
+        get_metrics().histogram("reranker_batch_requests", len(pending))
+        
+        offset = 0
+        for request_pairs, future in pending:
+            if not future.done():
+                future.set_result(scores[offset:offset + len(request_pairs)])
+            offset += len(request_pairs)
+    
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+    
+    async def _score_cached(
+        self,
+        query: str,
+        documents: List[str],
+        chunk_keys: Optional[List[Optional[str]]] = None
+    ) -> List[float]:
+        """
+        Score pairs, reusing cached scores and sending only misses to the model.
+        
+        Args:
+            query: Search query
+            documents: Document texts
+            chunk_keys: Stable chunk ids (None entries fall back to a content hash)
+        """
+        if self.config.score_cache_size <= 0:
+            return await self._score(query, documents)
+        
+        query_hash = self._hash(" ".join(query.split()))
+        keys = [
+            (
+                query_hash,
+                chunk_keys[i] if chunk_keys and chunk_keys[i] else self._hash(doc),
+                self.config.model_name
+            )
+            for i, doc in enumerate(documents)
+        ]
+        
+        scores: List[Optional[float]] = []
+        miss_positions: List[int] = []
+        for i, key in enumerate(keys):
+            cached = self._score_cache.get(key)
+            if cached is None:
+                miss_positions.append(i)
+            else:
+                self._score_cache.move_to_end(key)
+            scores.append(cached)
+        
+        hits = len(documents) - len(miss_positions)
+        self.cache_hits += hits
+        self.cache_misses += len(miss_positions)
+        metrics = get_metrics()
+        metrics.increment("cache_hits_total", hits, tags={"operation": "rerank"})
+        metrics.increment("cache_misses_total", len(miss_positions), tags={"operation": "rerank"})
+        
+        if miss_positions:
+            fresh = await self._score(query, [documents[i] for i in miss_positions])
+            for i, score in zip(miss_positions, fresh):
+                scores[i] = score
+                self._score_cache[keys[i]] = score
+            while len(self._score_cache) > self.config.score_cache_size:
+                self._score_cache.popitem(last=False)
+        
+        return scores
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Score cache statistics."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "size": len(self._score_cache),
+            "max_size": self.config.score_cache_size,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+        }
+    
+    async def _score(self, query: str, documents: List[str]) -> List[float]:
+        """Score pairs through the coalescing batcher."""
+        future: "asyncio.Future[List[float]]" = asyncio.get_running_loop().create_future()
+        self._pending.append(([(query, doc) for doc in documents], future))
+        self._pending_pairs += len(documents)
+        self._schedule_flush()
+        return await future
+    
     async def rerank(
         self,
         query: str,
@@ -139,29 +365,26 @@ class SentenceTransformerReranker:
             )
             documents.append(text)
         
+        chunk_keys = [
+            str(candidate.get("id") or candidate.get("chunk_id") or "") or None
+            for candidate in candidates
+        ]
+        
         try:
-            # Use CrossEncoder.rank() for efficient reranking
-            # This method handles batching and returns sorted results
             if top_k is None:
                 top_k = len(documents)
             
             logger.debug(f"Reranking {len(documents)} candidates for query: {query[:50]}...")
             
-            ranked_results = self.model.rank(
-                query=query,
-                documents=documents,
-                top_k=min(top_k, len(documents)),
-                return_documents=False,  # We'll merge with original candidates
-                batch_size=self.config.batch_size,
-                show_progress_bar=self.config.show_progress,
-                activation_fct=self.config.activation_function
-            )
+            with Timer("reranker_duration", tags={"backend": self.config.backend}):
+                scores = await self._score_cached(query, documents, chunk_keys)
+            
+            ranked_ids = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
             
             # Merge reranking scores with original candidates
             reranked_candidates = []
-            for ranked in ranked_results:
-                corpus_id = ranked['corpus_id']
-                score = ranked['score']
+            for corpus_id in ranked_ids[:min(top_k, len(documents))]:
+                score = scores[corpus_id]
                 
                 # Get original candidate
                 original = candidates[corpus_id].copy()
@@ -213,22 +436,16 @@ class SentenceTransformerReranker:
             return []
         
         try:
-            # Create query-document pairs
-            pairs = [[query, doc] for doc in documents]
-            
-            # Score pairs
-            scores = self.model.predict(
-                pairs,
-                batch_size=self.config.batch_size,
-                show_progress_bar=self.config.show_progress,
-                activation_fct=self.config.activation_function
-            )
-            
-            return scores.tolist() if hasattr(scores, 'tolist') else list(scores)
+            with Timer("reranker_duration", tags={"backend": self.config.backend}):
+                return await self._score_cached(query, documents)
             
         except Exception as e:
             logger.error(f"Scoring failed: {e}")
             return [0.0] * len(documents)
+    
+    def close(self) -> None:
+        """Shut down the inference executor."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 # Singleton instance for easy import
@@ -27,6 +27,10 @@ from src.ingestion.chunker import DoclingHybridChunker, ChunkingConfig, Document
 from src.config.jina_provider import SentenceTransformerEmbedder, EmbedderConfig
 from src.config.reranker import SentenceTransformerReranker, RerankerConfig
 from src.storage.qdrant_store import QdrantStore, QdrantStoreConfig
+from src.storage.local_index import LocalVectorIndex, LocalIndexConfig
+from src.storage.reindex import CollectionReindexer, ReindexReport
+from src.exceptions import VectorStoreError
+from src.monitoring.metrics import Timer, get_metrics
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -64,7 +68,13 @@ class DocumentConverter:
         qdrant_collection: str = "documents",
         enable_quantization: bool = True,
         enable_reranking: bool = True,
-        reranker_model: str = "cross-encoder/ms-marco-MiniLM-L6-v2"
+        reranker_model: str = "cross-encoder/ms-marco-MiniLM-L6-v2",
+        reranker_backend: str = "torch",  # "torch" or "onnx"
+        cascade_model: Optional[str] = None,
+        cascade_top_n: int = 20,
+        candidate_multiplier: int = 10,
+        rerank_skip_gap: Optional[float] = None,
+        vector_backend: Optional[str] = None  # "qdrant" or "local"
     ):
         """
         Initialize converter with Qdrant vector database.
@@ -84,6 +94,18 @@ class DocumentConverter:
             enable_quantization: Enable int8 quantization for 4x memory savings
             enable_reranking: Whether to enable CrossEncoder reranking
             reranker_model: CrossEncoder model name
+            reranker_backend: CrossEncoder backend; "onnx" loads the ONNX export
+                (set RERANKER_ONNX_FILE to pick an int8-quantized file)
+            cascade_model: Optional tiny CrossEncoder (e.g.
+                "cross-encoder/ms-marco-TinyBERT-L-2-v2") that prunes candidates
+                to ``cascade_top_n`` before the main reranker runs
+            cascade_top_n: Candidates kept by the cascade stage
+            candidate_multiplier: First-stage candidates per requested result
+                when reranking
+            rerank_skip_gap: Skip reranking when the top first-stage score
+                leads the runner-up by more than this (None = never skip)
+            vector_backend: "qdrant" (default) or "local" for a read-only
+                embedded index over output/embeddings/<collection> (search only)
         """
         # Initialize components
         self.processor = DocumentProcessor()
@@ -112,22 +134,29 @@ class DocumentConverter:
             self.embedder_config = EmbedderConfig(model_name=model_name)
             self.embedder = SentenceTransformerEmbedder(self.embedder_config)
         
-        # Initialize Qdrant vector store
-        try:
-            qdrant_config = QdrantStoreConfig(
-                host=qdrant_host,
-                port=qdrant_port,
-                collection_name=qdrant_collection,
-                vector_size=self.embedder.get_dimension(),  # Auto-detect from model
-                enable_quantization=enable_quantization
-            )
-            self.vector_store = QdrantStore(qdrant_config)
-            quant_msg = " (with int8 quantization)" if enable_quantization else ""
-            console.print(f"[green]✓[/green] Qdrant vector database enabled{quant_msg}")
-        except Exception as e:
-            console.print(f"[red]✗[/red] Qdrant not available: {e}")
-            console.print("[yellow]Tip:[/yellow] Start Qdrant with: docker-compose up -d")
-            raise
+        backend = (vector_backend or os.getenv("VECTOR_BACKEND", "qdrant")).lower()
+        
+        # Initialize vector store
+        if backend == "local":
+            self.vector_store = LocalVectorIndex(LocalIndexConfig.from_env(qdrant_collection))
+            console.print(f"[green]✓[/green] Local vector index enabled (read-only, {self.vector_store.count} vectors)")
+        else:
+            try:
+                qdrant_config = QdrantStoreConfig(
+                    host=qdrant_host,
+                    port=qdrant_port,
+                    collection_name=qdrant_collection,
+                    vector_size=self.embedder.get_dimension(),  # Auto-detect from model
+                    enable_quantization=enable_quantization
+                )
+                self.vector_store = QdrantStore(qdrant_config)
+                quant_msg = " (with int8 quantization)" if enable_quantization else ""
+                console.print(f"[green]✓[/green] Qdrant vector database enabled{quant_msg}")
+            except Exception as e:
+                console.print(f"[red]✗[/red] Qdrant not available: {e}")
+                console.print("[yellow]Tip:[/yellow] Start Qdrant with: docker-compose up -d")
+                console.print("[yellow]Tip:[/yellow] Or search exported embeddings with VECTOR_BACKEND=local")
+                raise
         
         # Initialize reranker (optional)
         self.enable_reranking = enable_reranking
@@ -135,13 +164,34 @@ class DocumentConverter:
         
         if enable_reranking:
             try:
-                reranker_config = RerankerConfig(model_name=reranker_model)
+                reranker_config = RerankerConfig(
+                    model_name=reranker_model,
+                    backend=reranker_backend,
+                    onnx_file_name=os.getenv("RERANKER_ONNX_FILE")
+                )
                 self.reranker = SentenceTransformerReranker(reranker_config)
-                console.print(f"[green]✓[/green] Reranking enabled ({reranker_model})")
+                console.print(f"[green]✓[/green] Reranking enabled ({reranker_model}, {reranker_backend})")
             except Exception as e:
                 console.print(f"[yellow]⚠[/yellow] Reranker not available: {e}")
                 self.enable_reranking = False
         
+        # Cascade: cheap CrossEncoder prunes candidates for the main reranker
+        self.cascade_reranker = None
+        self.cascade_top_n = cascade_top_n
+        self.candidate_multiplier = candidate_multiplier
+        self.rerank_skip_gap = rerank_skip_gap
+        self.rerank_skips = 0
+        self.reranked_searches = 0
+        
+        if self.enable_reranking and cascade_model:
+            try:
+                self.cascade_reranker = SentenceTransformerReranker(
+                    RerankerConfig(model_name=cascade_model, backend=reranker_backend)
+                )
+                console.print(f"[green]✓[/green] Cascade enabled ({cascade_model} → top {cascade_top_n})")
+            except Exception as e:
+                console.print(f"[yellow]⚠[/yellow] Cascade reranker not available: {e}")
+        
         console.print(f"[green]✓[/green] Converter initialized")
         console.print(f"  Embeddings: {self.embedder_config.model_name} ({self.embedder.get_dimension()}D)")
         console.print(f"  Chunking: {chunk_size} tokens")
@@ -151,7 +201,8 @@ class DocumentConverter:
     async def convert_file(
         self,
         file_path: str,
-        output_format: str = "json"
+        output_format: str = "json",
+        vector_store: Optional[Any] = None
     ) -> Dict[str, Any]:
         """
         Convert a single file to embeddings.
@@ -159,6 +210,7 @@ class DocumentConverter:
         Args:
             file_path: Path to file
             output_format: Output format (json, dict)
+            vector_store: Store to write to (default: the converter's store)
         
         Returns:
             Dictionary with chunks and embeddings
@@ -192,7 +244,8 @@ class DocumentConverter:
             
             # Step 4: Store in Qdrant vector database
             stored_ids = []
-            if self.vector_store:
+            store = vector_store or self.vector_store
+            if store:
                 console.print(f"[cyan]Storing in Qdrant...[/cyan]")
                 
                 # Prepare metadata
@@ -203,15 +256,17 @@ class DocumentConverter:
                         "file_type": Path(file_path).suffix.lstrip('.'),
                         "chunk_index": chunk.index,
                         "title": processed_doc.metadata.title or Path(file_path).stem,
-                        **chunk.metadata
+                        **chunk.metadata,
+                        "content": chunk.content
                     }
                     for chunk in chunks
                 ]
                 
-                stored_ids = self.vector_store.add_documents(
-                    documents=chunk_texts,
+                # documents= also feeds the sparse (BM25) vectors of hybrid collections
+                stored_ids = store.add_embeddings(
                     embeddings=embeddings,
-                    metadatas=metadatas
+                    metadatas=metadatas,
+                    documents=chunk_texts
                 )
                 
                 console.print(f"[green]✓[/green] Stored {len(stored_ids)} chunks in Qdrant")
@@ -270,7 +325,8 @@ class DocumentConverter:
         self,
         directory_path: str,
         recursive: bool = True,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        vector_store: Optional[Any] = None
     ) -> List[Dict[str, Any]]:
         """
         Convert all supported files in a directory.
@@ -279,6 +335,7 @@ class DocumentConverter:
             directory_path: Path to directory
             recursive: Search recursively
             output_dir: Optional output directory for results
+            vector_store: Store to write to (default: the converter's store)
         
         Returns:
             List of conversion results
@@ -306,7 +363,7 @@ class DocumentConverter:
             task = progress.add_task("Converting files...", total=len(supported_files))
             
             for file_path in supported_files:
-                result = await self.convert_file(str(file_path))
+                result = await self.convert_file(str(file_path), vector_store=vector_store)
                 results.append(result)
                 progress.advance(task)
         
@@ -322,6 +379,78 @@ class DocumentConverter:
         
         return results
     
+    async def reindex_directory(
+        self,
+        directory_path: str,
+        recursive: bool = True,
+        sample_queries: Optional[List[str]] = None,
+        keep_previous: int = 0,
+        migrate_legacy: bool = False
+    ) -> ReindexReport:
+        """
+        Rebuild the collection from a directory without taking search offline.
+        
+        Files are converted into a new versioned collection while searches keep
+        using the live one. The alias is switched only after validation passes.
+        
+        Args:
+            directory_path: Path to directory
+            recursive: Search recursively
+            sample_queries: Queries that must return results from the new version
+            keep_previous: Superseded versions to keep for rollback
+            migrate_legacy: One-time migration of a plain collection to an
+                alias (search is briefly unavailable during the swap)
+        
+        Returns:
+            ReindexReport describing the swap
+        
+        Raises:
+            ConfigurationError: If the collection is a plain (legacy) collection
+                and ``migrate_legacy`` is not set
+        """
+        if not isinstance(self.vector_store, QdrantStore):
+            raise VectorStoreError(
+                "Reindexing requires the Qdrant backend",
+                operation="reindex",
+                remediation="Unset VECTOR_BACKEND=local"
+            )
+        
+        live_store = self.vector_store
+        reindexer = CollectionReindexer(live_store.config)
+        
+        query_vectors = None
+        if sample_queries:
+            query_vectors = [await self.embedder.embed_query(q) for q in sample_queries]
+        
+        async def build(target: QdrantStore):
+            # Write to the new version only; searches keep using the live store
+            results = await self.convert_directory(directory_path, recursive=recursive, vector_store=target)
+            if results and all("error" in r for r in results):
+                raise RuntimeError("Every file failed to convert")
+        
+        console.print(f"\n[cyan]Reindexing {reindexer.alias} (live collection stays searchable)...[/cyan]")
+        report = await reindexer.reindex(
+            build,
+            sample_queries=query_vectors,
+            keep_previous=keep_previous,
+            migrate_legacy=migrate_legacy,
+            vector_size=self.embedder.get_dimension()
+        )
+        
+        if report.swapped:
+            # The new version may have a different vector layout
+            live_store.refresh_vector_layout()
+            console.print(
+                f"[green]✓[/green] {report.alias} now serves {report.new_collection} "
+                f"({report.validation.points_count} points)"
+            )
+            if report.deleted_collections:
+                console.print(f"  Removed: {', '.join(report.deleted_collections)}")
+        else:
+            console.print(f"[red]✗ Validation failed, {report.alias} unchanged:[/red] {report.validation.errors}")
+        
+        return report
+    
     async def search(
         self,
         query: str,
@@ -367,64 +496,128 @@ class DocumentConverter:
             console.print(f"[cyan]Filters:[/cyan] {filters}")
         
         # Step 1: Initial retrieval with Jina AI embeddings
-        # If reranking, retrieve more candidates (10x final limit)
-        num_candidates = limit * 10 if use_reranking else limit
-        
-        query_embedding = await self.embedder.embed_query(query)
-        
-        initial_results = self.vector_store.search(
-            query_embedding=query_embedding,
-            limit=num_candidates,
-            filters=filters
-        )
+        # If reranking, retrieve more candidates (candidate_multiplier x final limit)
+        num_candidates = limit * self.candidate_multiplier if use_reranking else limit
+        stage_ms: Dict[str, float] = {}
+        
+        with Timer("search_stage_duration", tags={"stage": "retrieve"}) as timer:
+            query_embedding = await self.embedder.embed_query(query)
+            initial_results = self.vector_store.search(
+                query_embedding=query_embedding,
+                limit=num_candidates,
+                filters=filters
+            )
+        stage_ms["retrieve"] = timer.duration_ms
         
-        # Format initial results
-        formatted_results = []
-        for i, (doc_id, document, distance, metadata) in enumerate(zip(
-            initial_results["ids"],
-            initial_results["documents"],
-            initial_results["distances"],
-            initial_results["metadatas"]
-        )):
-            formatted_results.append({
+        # Format initial results (already sorted by similarity)
+        formatted_results = [
+            {
                 "rank": i + 1,
-                "id": doc_id,
-                "content": document,
-                "initial_score": 1 - distance,  # Convert distance to similarity
-                "score": 1 - distance,
-                "metadata": metadata
-            })
+                "id": result["id"],
+                "content": result["content"],
+                "initial_score": result["score"],
+                "score": result["score"],
+                "metadata": result["metadata"]
+            }
+            for i, result in enumerate(initial_results)
+        ]
         
         console.print(f"[green]✓[/green] Initial retrieval: {len(formatted_results)} candidates")
         
-        # Step 2: Rerank with CrossEncoder (if enabled)
-        if use_reranking and self.reranker and len(formatted_results) > 0:
-            console.print(f"[cyan]Reranking with CrossEncoder...[/cyan]")
-            
+        if not (use_reranking and self.reranker and formatted_results):
+            # No reranking, return initial results
+            final_results = formatted_results[:limit]
+            console.print(f"[green]✓[/green] Found {len(final_results)} results\n")
+            return final_results
+        
+        self.reranked_searches += 1
+        metrics = get_metrics()
+        
+        # Adaptive skip: a clear first-stage winner doesn't need reranking
+        if self.rerank_skip_gap is not None and len(formatted_results) > 1:
+            gap = formatted_results[0]["score"] - formatted_results[1]["score"]
+            if gap > self.rerank_skip_gap:
+                self.rerank_skips += 1
+                metrics.increment("rerank_skipped_total")
+                final_results = formatted_results[:limit]
+                console.print(
+                    f"[green]✓[/green] Rerank skipped (score gap {gap:.3f} > {self.rerank_skip_gap}) "
+                    f"→ {len(final_results)} results"
+                )
+                self._print_stage_timings(stage_ms)
+                return final_results
+        
+        candidates = formatted_results
+        
+        # Step 2a: Cascade prune with the tiny CrossEncoder
+        if self.cascade_reranker and len(candidates) > self.cascade_top_n:
+            with Timer("search_stage_duration", tags={"stage": "cascade"}) as timer:
+                candidates = await self.cascade_reranker.rerank(
+                    query=query,
+                    candidates=candidates,
+                    top_k=self.cascade_top_n,
+                    return_scores=False
+                )
+            stage_ms["cascade"] = timer.duration_ms
+        
+        # Step 2b: Rerank with the main CrossEncoder
+        console.print(f"[cyan]Reranking {len(candidates)} candidates with CrossEncoder...[/cyan]")
+        with Timer("search_stage_duration", tags={"stage": "rerank"}) as timer:
             reranked_results = await self.reranker.rerank(
                 query=query,
-                candidates=formatted_results,
+                candidates=candidates,
                 top_k=limit,
                 return_scores=True
             )
-            
-            # Update ranks
-            for i, result in enumerate(reranked_results):
-                result["rank"] = i + 1
-            
-            console.print(f"[green]✓[/green] Reranked → {len(reranked_results)} results")
-            console.print(f"  Quality boost: ~20-30% better relevance\n")
-            
-            return reranked_results
-        else:
-            # No reranking, return initial results
-            final_results = formatted_results[:limit]
-            console.print(f"[green]✓[/green] Found {len(final_results)} results\n")
-            return final_results
+        stage_ms["rerank"] = timer.duration_ms
+        
+        # Update ranks
+        for i, result in enumerate(reranked_results):
+            result["rank"] = i + 1
+        
+        console.print(f"[green]✓[/green] Reranked → {len(reranked_results)} results")
+        cache_stats = self.reranker.get_cache_stats()
+        console.print(
+            f"  Score cache: {cache_stats['hit_rate']:.0%} hit rate "
+            f"({cache_stats['hits']} hits, {cache_stats['size']} cached)"
+        )
+        self._print_stage_timings(stage_ms)
+        
+        return reranked_results
+    
+    def _print_stage_timings(self, stage_ms: Dict[str, float]) -> None:
+        """Print per-stage timings for the last search and the running skip rate."""
+        timings = ", ".join(f"{stage} {ms:.0f}ms" for stage, ms in stage_ms.items())
+        console.print(f"  Stages: {timings}")
+        console.print(f"  Rerank skip rate: {self.get_search_stats()['rerank_skip_rate']:.0%}\n")
+    
+    def get_search_stats(self) -> Dict[str, Any]:
+        """
+        Cascade tuning statistics.
+        
+        Returns:
+            Skip rate plus p50/p95 timings per search stage (retrieve, cascade, rerank)
+        """
+        metrics = get_metrics()
+        return {
+            "reranked_searches": self.reranked_searches,
+            "rerank_skips": self.rerank_skips,
+            "rerank_skip_rate": (
+                self.rerank_skips / self.reranked_searches if self.reranked_searches else 0.0
+            ),
+            "stages": {
+                stage: metrics.get_timer_stats("search_stage_duration", tags={"stage": stage})
+                for stage in ("retrieve", "cascade", "rerank")
+            },
+        }
     
     async def close(self):
         """Clean up resources."""
         await self.embedder.close()
+        if self.reranker:
+            self.reranker.close()
+        if self.cascade_reranker:
+            self.cascade_reranker.close()
 
 
 async def main():
@@ -450,6 +643,22 @@ async def main():
         action="store_true",
         help="Process directories recursively"
     )
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Rebuild the collection blue/green and swap its alias (directories only)"
+    )
+    parser.add_argument(
+        "--validate-query",
+        action="append",
+        default=[],
+        help="Query that must return results before a reindex is swapped in (repeatable)"
+    )
+    parser.add_argument(
+        "--migrate-legacy",
+        action="store_true",
+        help="With --reindex: replace a plain collection with an alias (one-time, brief search outage)"
+    )
     
     args = parser.parse_args()
     
@@ -463,6 +672,15 @@ async def main():
             # Convert single file
             result = await converter.convert_file(str(path), output_format=args.output)
             
+        elif path.is_dir() and args.reindex:
+            # Rebuild into a new version and swap the alias
+            await converter.reindex_directory(
+                str(path),
+                recursive=args.recursive,
+                sample_queries=args.validate_query,
+                migrate_legacy=args.migrate_legacy
+            )
+            
         elif path.is_dir():
             # Convert directory
             results = await converter.convert_directory(
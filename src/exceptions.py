@@ -185,3 +185,18 @@ class MemoryLimitError(RAGException):
         }
         
         super().__init__(message, remediation, details)
+
+
+class QueueFullError(RAGException):
+    """Raised when the ingestion queue is at capacity."""
+    
+    def __init__(self, pending: int, max_pending: int, retry_after: int = 30):
+        message = f"Ingestion queue is full ({pending}/{max_pending} jobs pending)"
+        remediation = f"Retry after {retry_after} seconds"
+        details = {
+            "pending": pending,
+            "max_pending": max_pending,
+            "retry_after": retry_after
+        }
+        
+        super().__init__(message, remediation, details)
@@ -2,35 +2,48 @@
 Ingestion package for document processing pipeline.
 
 Provides Docling-based chunking, embedding generation, and document ingestion orchestration.
+
+Exports are resolved on first attribute access, so importing one ingestion
+module (e.g. ``src.ingestion.job_queue``) does not load the whole pipeline.
 """
 
-from src.ingestion.processor import (
-    DocumentProcessor,
-    DocumentMetadata,
-    ProcessedDocument,
-)
-from src.ingestion.chunker import (
-    ChunkingConfig,
-    DocumentChunk,
-    DoclingHybridChunker,
-    create_chunker,
-)
-from src.ingestion.embedder import (
-    EmbeddingConfig,
-    EmbeddingGenerator,
-    EmbeddingCache,
-    create_embedder,
-)
-try:
-    from src.ingestion.ingest import (  # type: ignore
-        IngestionConfig,
-        IngestionResult,
-        DocumentIngestionPipeline,
-    )
-except Exception:  # pragma: no cover - optional ingestion extras
-    IngestionConfig = None  # type: ignore
-    IngestionResult = None  # type: ignore
-    DocumentIngestionPipeline = None  # type: ignore
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "DocumentProcessor": "src.ingestion.processor",
+    "DocumentMetadata": "src.ingestion.processor",
+    "ProcessedDocument": "src.ingestion.processor",
+    "ChunkingConfig": "src.ingestion.chunker",
+    "DocumentChunk": "src.ingestion.chunker",
+    "DoclingHybridChunker": "src.ingestion.chunker",
+    "create_chunker": "src.ingestion.chunker",
+    "EmbeddingConfig": "src.ingestion.embedder",
+    "EmbeddingGenerator": "src.ingestion.embedder",
+    "EmbeddingCache": "src.ingestion.embedder",
+    "create_embedder": "src.ingestion.embedder",
+    "IngestionConfig": "src.ingestion.ingest",
+    "IngestionResult": "src.ingestion.ingest",
+    "DocumentIngestionPipeline": "src.ingestion.ingest",
+}
+
+# Optional ingestion extras: these resolve to None if their module fails to import
+_OPTIONAL_MODULES = {"src.ingestion.ingest"}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(import_module(module_name), name)
+    except Exception:  # pragma: no cover - optional ingestion extras
+        if module_name not in _OPTIONAL_MODULES:
+            raise
+        value = None
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "DocumentProcessor",
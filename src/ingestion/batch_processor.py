@@ -4,7 +4,7 @@ Batch document processing for directory ingestion.
 Provides functionality for:
 - Directory scanning with format filtering
 - Parallel document processing with concurrency limits
-- Progress tracking and SSE streaming
+- Progress tracking and SSE streaming (published to the progress broker)
 - Resumable ingestion with state persistence
 - Error recovery and retry logic
 
@@ -23,6 +23,8 @@ from enum import Enum
 from pydantic import BaseModel, Field
 
 from .ingest import DocumentIngestionPipeline, IngestionConfig, IngestionResult
+from .progress import get_progress_broker
+from .model_registry import get_model_registry
 
 logger = logging.getLogger(__name__)
 
@@ -306,9 +308,10 @@ class BatchProcessor:
         job.status = BatchStatus.RUNNING
         job.started_at = datetime.utcnow().isoformat()
         self._save_batch_job(job)
+        self.publish_progress(job)
         
-        # Initialize pipeline
-        self.pipeline = DocumentIngestionPipeline(self.config)
+        # Initialize pipeline (models are shared across batches)
+        self.pipeline = DocumentIngestionPipeline(self.config, models=get_model_registry())
         await self.pipeline.initialize()
         
         try:
@@ -343,6 +346,7 @@ class BatchProcessor:
         finally:
             # Save final state
             self._save_batch_job(job)
+            self.publish_progress(job)
         
         return job
     
@@ -424,6 +428,30 @@ class BatchProcessor:
             # Save state
             self._save_batch_document(doc)
             self._save_batch_job(job)
+            self.publish_progress(job)
+    
+    def publish_progress(self, job: BatchJob) -> None:
+        """Publish a progress snapshot to ``batch:<batch_id>`` subscribers."""
+        final = job.status in (BatchStatus.COMPLETED, BatchStatus.FAILED, BatchStatus.CANCELLED)
+        get_progress_broker().publish(
+            f"batch:{job.batch_id}",
+            {
+                "batch_id": job.batch_id,
+                "status": job.status.value,
+                "progress": job.progress,
+                "total_files": job.total_files,
+                "processed_files": job.processed_files,
+                "successful_files": job.successful_files,
+                "failed_files": job.failed_files,
+                "success_rate": job.success_rate,
+                "total_chunks": job.total_chunks,
+                "total_entities": job.total_entities,
+                "total_relationships": job.total_relationships,
+                "started_at": job.started_at,
+                "completed_at": job.completed_at,
+            },
+            final=final
+        )
     
     def _save_batch_job(self, job: BatchJob) -> None:
         """Save batch job to database."""
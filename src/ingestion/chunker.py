@@ -14,16 +14,18 @@ Benefits over custom chunking:
 - Token-precise (not character-based estimates)
 - Better for RAG (chunks include document context)
 - Battle-tested (maintained by Docling team)
+
+transformers and docling are imported when a chunker is created, not when
+this module is imported (ChunkingConfig/DocumentChunk stay cheap to use).
 """
 
 import logging
 import os
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
-from transformers import AutoTokenizer
-from docling.chunking import HybridChunker
-from docling_core.types.doc import DoclingDocument
+if TYPE_CHECKING:
+    from docling_core.types.doc import DoclingDocument
 
 logger = logging.getLogger(__name__)
 
@@ -81,20 +83,26 @@ class DoclingHybridChunker:
     - Includes heading context in chunks
     """
 
-    def __init__(self, config: ChunkingConfig):
+    def __init__(self, config: ChunkingConfig, tokenizer: Optional[Any] = None):
         """
         Initialize chunker.
 
         Args:
             config: Chunking configuration (Pydantic model)
+            tokenizer: Preloaded tokenizer to share (loaded here if None)
         """
         self.config = config
 
+        from docling.chunking import HybridChunker
+
         # Initialize tokenizer for token-aware chunking
         # Use Nomic model tokenizer for consistency with embeddings
-        model_id = os.getenv("EMBEDDING_MODEL", "nomic-ai/nomic-embed-code")
-        logger.info(f"Initializing tokenizer for code chunking: {model_id}")
-        self.tokenizer = AutoTokenizer.from_pretrained(model_id, trust_remote_code=True)
+        if tokenizer is None:
+            model_id = os.getenv("EMBEDDING_MODEL", "nomic-ai/nomic-embed-code")
+            logger.info(f"Initializing tokenizer for code chunking: {model_id}")
+            from transformers import AutoTokenizer
+            tokenizer = AutoTokenizer.from_pretrained(model_id, trust_remote_code=True)
+        self.tokenizer = tokenizer
 
         # Create HybridChunker
         self.chunker = HybridChunker(
@@ -111,11 +119,36 @@ class DoclingHybridChunker:
         title: str,
         source: str,
         metadata: Optional[Dict[str, Any]] = None,
-        docling_doc: Optional[DoclingDocument] = None
+        docling_doc: Optional["DoclingDocument"] = None
     ) -> List[DocumentChunk]:
         """
         Chunk a document using Docling's HybridChunker.
 
+        Args:
+            content: Document content (markdown format)
+            title: Document title
+            source: Document source
+            metadata: Additional metadata
+            docling_doc: Optional pre-converted DoclingDocument (for efficiency)
+
+        Returns:
+            List of document chunks with contextualized content
+        """
+        return self.chunk_document_sync(content, title, source, metadata, docling_doc)
+
+    def chunk_document_sync(
+        self,
+        content: str,
+        title: str,
+        source: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        docling_doc: Optional["DoclingDocument"] = None
+    ) -> List[DocumentChunk]:
+        """
+        Chunk a document using Docling's HybridChunker (blocking).
+
+        Tokenizes every chunk; run it on a worker thread from async code.
+
         Args:
             content: Document content (markdown format)
             title: Document title
@@ -252,14 +285,15 @@ class DoclingHybridChunker:
         return chunks
 
 
-def create_chunker(config: ChunkingConfig) -> DoclingHybridChunker:
+def create_chunker(config: ChunkingConfig, tokenizer: Optional[Any] = None) -> DoclingHybridChunker:
     """
     Create Docling HybridChunker instance.
 
     Args:
         config: Chunking configuration (Pydantic model)
+        tokenizer: Preloaded tokenizer to share (loaded if None)
 
     Returns:
         DoclingHybridChunker instance
     """
-    return DoclingHybridChunker(config)
+    return DoclingHybridChunker(config, tokenizer=tokenizer)
@@ -4,16 +4,19 @@ Document embedding generation for vector search.
 COPIED AND REFACTORED FROM: ottomator-agents/docling-rag-agent/ingestion/embedder.py
 
 Provides batch embedding generation with retry logic, rate limit handling, and caching.
+
+The OpenAI client is created on first use (``_get_embedding_client()``), so
+importing this module neither needs OPENAI_API_KEY nor loads the openai SDK.
 """
 
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import hashlib
 
 from pydantic import BaseModel, Field
-from openai import RateLimitError, APIError
 from dotenv import load_dotenv
 
 from src.config.providers import get_embedding_client, get_embedding_model
@@ -24,10 +27,19 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-# Initialize client with flexible provider
-embedding_client = get_embedding_client()
 EMBEDDING_MODEL = get_embedding_model()
 
+# Embedding client (created on first request)
+_embedding_client: Optional[Any] = None
+
+
+def _get_embedding_client() -> Any:
+    """Get or create the embedding client."""
+    global _embedding_client
+    if _embedding_client is None:
+        _embedding_client = get_embedding_client()
+    return _embedding_client
+
 
 class EmbeddingConfig(BaseModel):
     """
@@ -93,9 +105,11 @@ class EmbeddingGenerator:
         if len(text) > self.config["max_tokens"] * 4:  # Rough token estimation
             text = text[:self.config["max_tokens"] * 4]
         
+        from openai import RateLimitError, APIError
+        
         for attempt in range(self.max_retries):
             try:
-                response = await embedding_client.embeddings.create(
+                response = await _get_embedding_client().embeddings.create(
                     model=self.model,
                     input=text
                 )
@@ -152,9 +166,11 @@ class EmbeddingGenerator:
             
             processed_texts.append(text)
         
+        from openai import RateLimitError, APIError
+        
         for attempt in range(self.max_retries):
             try:
-                response = await embedding_client.embeddings.create(
+                response = await _get_embedding_client().embeddings.create(
                     model=self.model,
                     input=processed_texts
                 )
@@ -312,34 +328,46 @@ class EmbeddingGenerator:
 
 
 class EmbeddingCache:
-    """Simple in-memory cache for embeddings."""
+    """Simple in-memory LRU cache for embeddings."""
     
     def __init__(self, max_size: int = 1000):
         """Initialize cache."""
-        self.cache: Dict[str, List[float]] = {}
-        self.access_times: Dict[str, datetime] = {}
+        self.cache: "OrderedDict[str, List[float]]" = OrderedDict()
         self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
     
     def get(self, text: str) -> Optional[List[float]]:
         """Get embedding from cache."""
         text_hash = self._hash_text(text)
-        if text_hash in self.cache:
-            self.access_times[text_hash] = datetime.now()
-            return self.cache[text_hash]
-        return None
+        embedding = self.cache.get(text_hash)
+        if embedding is None:
+            self.misses += 1
+            return None
+        self.cache.move_to_end(text_hash)
+        self.hits += 1
+        return embedding
     
     def put(self, text: str, embedding: List[float]):
         """Store embedding in cache."""
         text_hash = self._hash_text(text)
-        
-        # Evict oldest entries if cache is full
-        if len(self.cache) >= self.max_size:
-            oldest_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
-            del self.cache[oldest_key]
-            del self.access_times[oldest_key]
-        
         self.cache[text_hash] = embedding
-        self.access_times[text_hash] = datetime.now()
+        self.cache.move_to_end(text_hash)
+        
+        # Evict least recently used entries if cache is full
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self.cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
     
     def _hash_text(self, text: str) -> str:
         """Generate hash for text."""
@@ -16,10 +16,13 @@ import argparse
 
 from pydantic import BaseModel, Field
 
-from .chunker import ChunkingConfig, create_chunker, DocumentChunk
+from .chunker import ChunkingConfig, DoclingHybridChunker, create_chunker, DocumentChunk
 from .embedder import create_embedder
 from .processor import DocumentProcessor
+from .model_registry import ModelRegistry
 from ..storage.chroma_client import get_chroma_client, initialize_chroma, close_chroma
+from ..storage.collection_manager import get_collection_manager
+from ..storage.write_versions import bump_collection_version
 from ..models.document import Document, ProcessingStatus
 
 logger = logging.getLogger(__name__)
@@ -51,7 +54,8 @@ class DocumentIngestionPipeline:
         self,
         config: IngestionConfig,
         documents_folder: str = "documents",
-        clean_before_ingest: bool = True
+        clean_before_ingest: bool = True,
+        models: Optional[ModelRegistry] = None
     ):
         """
         Initialize ingestion pipeline.
@@ -60,6 +64,8 @@ class DocumentIngestionPipeline:
             config: Ingestion configuration
             documents_folder: Folder containing documents to ingest
             clean_before_ingest: Whether to clean existing data before ingestion
+            models: Shared model registry (tokenizer, embedder, Docling
+                converter); models are loaded for this pipeline if None
         """
         self.config = config
         self.documents_folder = documents_folder
@@ -73,9 +79,15 @@ class DocumentIngestionPipeline:
             use_semantic_splitting=config.use_semantic_chunking
         )
         
-        self.chunker = create_chunker(self.chunker_config)
-        self.embedder = create_embedder()
-        self.processor = DocumentProcessor()
+        # The chunker loads a tokenizer, so it is built in initialize() on a worker thread
+        self.models = models
+        self.chunker: Optional[DoclingHybridChunker] = None
+        if models is not None:
+            self.embedder = models.embedder
+            self.processor = models.processor
+        else:
+            self.embedder = create_embedder()
+            self.processor = DocumentProcessor()
         
         self._initialized = False
     
@@ -86,12 +98,20 @@ class DocumentIngestionPipeline:
         
         logger.info("Initializing ingestion pipeline...")
         
+        if self.chunker is None:
+            self.chunker = await asyncio.to_thread(self._create_chunker)
+        
         # Initialize Chroma
         await initialize_chroma()
         
         self._initialized = True
         logger.info("Ingestion pipeline initialized")
     
+    def _create_chunker(self) -> DoclingHybridChunker:
+        """Build the chunker (blocking: loads the tokenizer unless shared)."""
+        tokenizer = self.models.tokenizer if self.models is not None else None
+        return create_chunker(self.chunker_config, tokenizer=tokenizer)
+    
     async def close(self):
         """Close database connections."""
         if self._initialized:
@@ -325,7 +345,8 @@ class DocumentIngestionPipeline:
         source: str,
         content: str,
         chunks: List[DocumentChunk],
-        metadata: Dict[str, Any]
+        metadata: Dict[str, Any],
+        collection_name: Optional[str] = None
     ) -> str:
         """
         Save document and chunks to Chroma vector database.
@@ -336,6 +357,7 @@ class DocumentIngestionPipeline:
             content: Full document content
             chunks: List of embedded chunks
             metadata: Document metadata
+            collection_name: Named collection to store into (None = default collection)
         
         Returns:
             Document ID
@@ -346,9 +368,6 @@ class DocumentIngestionPipeline:
         content_hash = hashlib.sha256(content.encode()).hexdigest()
         document_id = f"doc_{content_hash[:16]}"
         
-        # Get Chroma client
-        chroma_client = get_chroma_client()
-        
         # Prepare embeddings for batch insertion
         embeddings = []
         chunk_ids = []
@@ -373,13 +392,30 @@ class DocumentIngestionPipeline:
             }
             chunk_metadatas.append(chunk_metadata)
         
+        if collection_name:
+            # Named collection: the manager creates it if needed and bumps its version
+            manager = get_collection_manager()
+            await manager.get_or_create_collection(custom_name=collection_name)
+            await manager.add_to_collection(
+                collection_name=collection_name,
+                ids=chunk_ids,
+                embeddings=embeddings,
+                metadatas=chunk_metadatas,
+                documents=chunk_contents
+            )
+            logger.info(f"Saved {len(chunks)} chunks to collection {collection_name} for document: {document_id}")
+            return document_id
+        
         # Batch insert into Chroma
+        chroma_client = get_chroma_client()
         await chroma_client.add_embeddings(
             ids=chunk_ids,
             embeddings=embeddings,
             documents=chunk_contents,
             metadatas=chunk_metadatas
         )
+        # Default Chroma collection has no name here; invalidate all cached results
+        bump_collection_version()
         
         logger.info(f"Saved {len(chunks)} chunks to Chroma for document: {document_id}")
         
@@ -399,6 +435,7 @@ class DocumentIngestionPipeline:
                 doc_id = doc.get("id")
                 if doc_id:
                     await chroma_client.delete_document(doc_id)
+            bump_collection_version()
             
             logger.info("Cleaned Chroma vector database")
         except Exception as e:
@@ -0,0 +1,391 @@
+"""
+Durable, bounded ingestion job queue.
+
+Replaces unbounded per-request background tasks for uploads:
+- Jobs and their statuses persist in SQLite, so queued work survives a restart
+- A fixed-size pool of workers processes jobs, highest priority first
+- ``submit()`` raises QueueFullError once ``max_pending`` jobs are waiting or
+  running (the API turns this into 429 Too Many Requests)
+- Finished job statuses are deleted after ``status_ttl`` seconds, so storage
+  stays flat under sustained upload traffic
+- Several processes may share one database: a job is claimed atomically
+  (``BEGIN IMMEDIATE``) under a lease that its worker keeps renewing, and only
+  jobs whose lease has expired (their process died) are re-queued
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from ..exceptions import QueueFullError
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ("completed", "failed")
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class IngestionJobQueue:
+    """
+    SQLite-backed priority queue with a fixed worker pool.
+
+    Example:
+        >>> queue = get_ingestion_queue()
+        >>> queue.start(handler)
+        >>> queue.submit(job_id, {"file_path": "uploads/a.pdf"}, priority=5)
+    """
+
+    def __init__(
+        self,
+        db_path: str = "ingestion_queue.db",
+        workers: int = 2,
+        max_pending: int = 100,
+        status_ttl: float = 3600.0,
+        retry_after: int = 30,
+        lease_seconds: float = 60.0
+    ):
+        """
+        Initialize queue.
+
+        Args:
+            db_path: SQLite database path
+            workers: Jobs processed concurrently
+            max_pending: Queued + running jobs accepted before rejecting
+            status_ttl: Seconds a finished job's status is kept
+            retry_after: Retry-After hint (seconds) for rejected submissions
+            lease_seconds: How long a claimed job stays owned without a renewal
+                before another process may run it again
+        """
+        self.db_path = db_path
+        self.workers = workers
+        self.max_pending = max_pending
+        self.status_ttl = status_ttl
+        self.retry_after = retry_after
+        self.lease_seconds = lease_seconds
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+        # isolation_level=None: transactions are explicit (BEGIN IMMEDIATE for claims)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._lock = threading.Lock()
+        self._init_db()
+
+        self._handler: Optional[JobHandler] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self.processed = 0
+        self.rejected = 0
+
+    @contextmanager
+    def _immediate(self) -> Iterator[None]:
+        """Write transaction that takes the database lock up front (atomic across processes)."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _init_db(self) -> None:
+        """Create the jobs table."""
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS ingestion_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    state TEXT NOT NULL,
+                    payload_json TEXT NOT NULL,
+                    status_json TEXT,
+                    created_at REAL NOT NULL,
+                    finished_at REAL,
+                    owner TEXT,
+                    lease_until REAL
+                )
+            """)
+            # Databases created before leases were added
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(ingestion_jobs)")}
+            for column, column_type in (("owner", "TEXT"), ("lease_until", "REAL")):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE ingestion_jobs ADD COLUMN {column} {column_type}")
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_claim
+                ON ingestion_jobs (state, priority DESC, created_at)
+            """)
+
+    def pending_count(self) -> int:
+        """Jobs queued or running."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM ingestion_jobs WHERE state IN ('queued', 'running')"
+            ).fetchone()
+        return row[0]
+
+    def ensure_capacity(self) -> None:
+        """
+        Check that another job would be accepted.
+
+        Raises:
+            QueueFullError: If max_pending jobs are already queued or running
+        """
+        pending = self.pending_count()
+        if pending >= self.max_pending:
+            self.rejected += 1
+            raise QueueFullError(pending, self.max_pending, self.retry_after)
+
+    def submit(
+        self,
+        job_id: str,
+        payload: Dict[str, Any],
+        priority: int = 0,
+        status: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Enqueue a job.
+
+        Args:
+            job_id: Unique job identifier
+            payload: JSON-serializable job arguments passed to the handler
+            priority: Higher runs first
+            status: Initial status snapshot
+
+        Raises:
+            QueueFullError: If max_pending jobs are already queued or running
+        """
+        with self._lock, self._immediate():
+            pending = self._conn.execute(
+                "SELECT COUNT(*) FROM ingestion_jobs WHERE state IN ('queued', 'running')"
+            ).fetchone()[0]
+            if pending >= self.max_pending:
+                self.rejected += 1
+                raise QueueFullError(pending, self.max_pending, self.retry_after)
+
+            self._conn.execute(
+                "INSERT INTO ingestion_jobs (job_id, priority, state, payload_json, status_json, created_at) "
+                "VALUES (?, ?, 'queued', ?, ?, ?)",
+                (job_id, priority, json.dumps(payload), json.dumps(status) if status else None, time.time())
+            )
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def update_status(self, job_id: str, status: Dict[str, Any]) -> None:
+        """
+        Persist a job's status snapshot.
+
+        A status of "completed"/"failed" marks the job finished and starts its TTL.
+        """
+        finished = status.get("status") in FINISHED_STATUSES
+        with self._lock:
+            self._conn.execute(
+                "UPDATE ingestion_jobs SET status_json = ?, "
+                "state = CASE WHEN ? THEN 'finished' ELSE state END, "
+                "finished_at = CASE WHEN ? THEN ? ELSE finished_at END "
+                "WHERE job_id = ?",
+                (json.dumps(status), finished, finished, time.time(), job_id)
+            )
+
+    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Latest status snapshot (None if unknown or expired)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_json FROM ingestion_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+    def purge_expired(self) -> int:
+        """Delete finished jobs older than the TTL; returns the number removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM ingestion_jobs WHERE state = 'finished' AND finished_at < ?",
+                (time.time() - self.status_ttl,)
+            )
+        return cursor.rowcount
+
+    def _claim(self) -> Optional[Dict[str, Any]]:
+        """Lease the highest-priority queued job to this process and return it."""
+        with self._lock, self._immediate():
+            row = self._conn.execute(
+                "SELECT job_id, payload_json FROM ingestion_jobs WHERE state = 'queued' "
+                "ORDER BY priority DESC, created_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE ingestion_jobs SET state = 'running', owner = ?, lease_until = ? WHERE job_id = ?",
+                (self.owner, time.time() + self.lease_seconds, row[0])
+            )
+        return {"job_id": row[0], **json.loads(row[1])}
+
+    def _renew_lease(self, job_id: str) -> bool:
+        """Extend this process's lease on a running job; False if it was lost."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE ingestion_jobs SET lease_until = ? "
+                "WHERE job_id = ? AND owner = ? AND state = 'running'",
+                (time.time() + self.lease_seconds, job_id, self.owner)
+            )
+        return cursor.rowcount > 0
+
+    async def _keep_lease(self, job_id: str) -> None:
+        """Renew a job's lease while its handler runs."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            if not self._renew_lease(job_id):
+                logger.warning(f"Lost the lease on ingestion job {job_id}")
+                return
+
+    def _finish(self, job_id: str) -> None:
+        """Mark a job finished if the handler did not report a final status."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE ingestion_jobs SET state = 'finished', finished_at = COALESCE(finished_at, ?) "
+                "WHERE job_id = ? AND owner = ?",
+                (time.time(), job_id, self.owner)
+            )
+
+    def _requeue(self, job_id: str) -> None:
+        """Return an interrupted job that this process is running to the queue."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_json FROM ingestion_jobs WHERE job_id = ? AND state = 'running' AND owner = ?",
+                (job_id, self.owner)
+            ).fetchone()
+            if row is None:
+                return
+            status = json.loads(row[0]) if row[0] else {}
+            status.update(status="queued", current_step="Interrupted; queued for restart")
+            self._conn.execute(
+                "UPDATE ingestion_jobs SET state = 'queued', status_json = ?, finished_at = NULL, "
+                "owner = NULL, lease_until = NULL WHERE job_id = ? AND owner = ?",
+                (json.dumps(status), job_id, self.owner)
+            )
+        logger.info(f"Re-queued interrupted ingestion job {job_id}")
+
+    def requeue_expired(self) -> int:
+        """Re-queue running jobs whose lease expired (their process died); returns the count."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE ingestion_jobs SET state = 'queued', owner = NULL, lease_until = NULL "
+                "WHERE state = 'running' AND (lease_until IS NULL OR lease_until < ?)",
+                (time.time(),)
+            )
+        if cursor.rowcount:
+            logger.info(f"Re-queued {cursor.rowcount} ingestion jobs with expired leases")
+            if self._wakeup is not None:
+                self._wakeup.set()
+        return cursor.rowcount
+
+    async def _worker(self, worker_id: int) -> None:
+        """Process jobs until cancelled."""
+        while True:
+            job = self._claim()
+            if job is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            lease = asyncio.create_task(self._keep_lease(job["job_id"]))
+            try:
+                await self._handler(job)
+            except asyncio.CancelledError:
+                # Shutdown: put the job back so the next start() runs it again
+                self._requeue(job["job_id"])
+                raise
+            except Exception as e:
+                logger.error(f"Ingestion job {job['job_id']} failed in worker {worker_id}: {e}")
+            finally:
+                lease.cancel()
+            self._finish(job["job_id"])
+            self.processed += 1
+
+    async def _purge_loop(self) -> None:
+        """Expire finished statuses and re-queue abandoned jobs periodically."""
+        interval = max(1.0, min(60.0, self.status_ttl / 2, self.lease_seconds))
+        while True:
+            await asyncio.sleep(interval)
+            self.requeue_expired()
+            removed = self.purge_expired()
+            if removed:
+                logger.debug(f"Expired {removed} finished ingestion job statuses")
+
+    def start(self, handler: JobHandler) -> None:
+        """
+        Start the worker pool on the running event loop.
+
+        Jobs left running by a process that died (expired lease) are re-queued;
+        jobs other live processes are running are left alone.
+
+        Args:
+            handler: Coroutine function called with each job's payload (plus job_id)
+        """
+        self._handler = handler
+        self.requeue_expired()
+
+        self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._purge_loop()))
+        logger.info(f"Ingestion queue started ({self.workers} workers, max {self.max_pending} pending)")
+
+    async def stop(self) -> None:
+        """Stop the worker pool (running jobs are re-queued)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue statistics."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) FROM ingestion_jobs GROUP BY state"
+            ).fetchall()
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "jobs": dict(rows),
+            "processed": self.processed,
+            "rejected": self.rejected,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+# Global queue instance
+_ingestion_queue: Optional[IngestionJobQueue] = None
+
+
+def get_ingestion_queue() -> IngestionJobQueue:
+    """Get or create global ingestion queue."""
+    global _ingestion_queue
+    if _ingestion_queue is None:
+        _ingestion_queue = IngestionJobQueue(
+            db_path=os.getenv("INGEST_QUEUE_DB", "ingestion_queue.db"),
+            workers=int(os.getenv("INGEST_WORKERS", "2")),
+            max_pending=int(os.getenv("INGEST_QUEUE_MAX", "100")),
+            status_ttl=float(os.getenv("INGEST_STATUS_TTL", "3600")),
+            lease_seconds=float(os.getenv("INGEST_LEASE_SECONDS", "60")),
+        )
+    return _ingestion_queue
+
+
+async def close_ingestion_queue() -> None:
+    """Stop workers and close the global ingestion queue."""
+    global _ingestion_queue
+    if _ingestion_queue is not None:
+        await _ingestion_queue.stop()
+        _ingestion_queue.close()
+        _ingestion_queue = None
@@ -0,0 +1,232 @@
+"""
+Process-wide registry of heavy ingestion and retrieval models.
+
+Loads each model once and shares it between the API routes, batch jobs and
+the background worker instead of reloading per upload or per batch:
+- Tokenizer used by the HybridChunker
+- Embedding generator (with its cache)
+- CrossEncoder reranker
+- Docling document converter (held by a shared DocumentProcessor)
+
+Models load lazily on first use; ``warmup()`` loads all of them up front and
+runs one small inference through each so the first real request does not pay
+for it. ``ready`` stays False until warmup has finished.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .embedder import EmbeddingGenerator, create_embedder
+from .processor import DocumentProcessor
+from ..config.reranker import SentenceTransformerReranker, get_reranker
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRegistry:
+    """
+    Shared model instances with warmup and readiness tracking.
+
+    Example:
+        >>> registry = get_model_registry()
+        >>> await registry.warmup()
+        >>> pipeline = DocumentIngestionPipeline(config, models=registry)
+    """
+
+    def __init__(self, tokenizer_model: Optional[str] = None, warmup_embedder: bool = True):
+        """
+        Initialize registry (nothing is loaded yet).
+
+        Args:
+            tokenizer_model: Chunker tokenizer model (default: EMBEDDING_MODEL env)
+            warmup_embedder: Send one embedding request during warmup
+        """
+        self.tokenizer_model = tokenizer_model or os.getenv("EMBEDDING_MODEL", "nomic-ai/nomic-embed-code")
+        self.warmup_embedder = warmup_embedder
+
+        self._tokenizer: Optional[Any] = None
+        self._embedder: Optional[EmbeddingGenerator] = None
+        self._processor: Optional[DocumentProcessor] = None
+        self._reranker: Optional[SentenceTransformerReranker] = None
+        # One lock per model, so a cheap model is never stuck behind a slow load
+        self._locks: Dict[str, threading.Lock] = {
+            name: threading.Lock() for name in ("tokenizer", "embedder", "processor", "reranker")
+        }
+
+        self.ready = False
+        self.warmup_error: Optional[str] = None
+        self.components: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def tokenizer(self) -> Any:
+        """HybridChunker tokenizer."""
+        if self._tokenizer is None:
+            with self._locks["tokenizer"]:
+                if self._tokenizer is None:
+                    logger.info(f"Loading tokenizer: {self.tokenizer_model}")
+                    from transformers import AutoTokenizer
+                    self._tokenizer = AutoTokenizer.from_pretrained(self.tokenizer_model, trust_remote_code=True)
+        return self._tokenizer
+
+    @property
+    def embedder(self) -> EmbeddingGenerator:
+        """Cached embedding generator."""
+        if self._embedder is None:
+            with self._locks["embedder"]:
+                if self._embedder is None:
+                    self._embedder = create_embedder()
+        return self._embedder
+
+    @property
+    def processor(self) -> DocumentProcessor:
+        """Document processor holding the Docling converter."""
+        if self._processor is None:
+            with self._locks["processor"]:
+                if self._processor is None:
+                    self._processor = DocumentProcessor()
+        return self._processor
+
+    @property
+    def reranker(self) -> SentenceTransformerReranker:
+        """CrossEncoder reranker (the process-wide singleton)."""
+        if self._reranker is None:
+            with self._locks["reranker"]:
+                if self._reranker is None:
+                    self._reranker = get_reranker()
+        return self._reranker
+
+    def _load_converter(self) -> None:
+        """Build the Docling converter and its PDF pipeline (model weights)."""
+        converter = self.processor._get_docling_converter()
+        from docling.datamodel.base_models import InputFormat
+        converter.initialize_pipeline(InputFormat.PDF)
+
+    async def _warm(self, name: str, step, required: bool = True) -> None:
+        """Run one warmup step and record its outcome."""
+        start = time.perf_counter()
+        try:
+            await step()
+            self.components[name] = {
+                "status": "ready",
+                "warmup_ms": round((time.perf_counter() - start) * 1000, 1),
+            }
+        except Exception as e:
+            self.components[name] = {"status": "failed" if required else "degraded", "error": str(e)}
+            if required:
+                raise
+            logger.warning(f"Warmup of {name} failed (continuing): {e}")
+
+    async def warmup(self) -> None:
+        """
+        Load every model and run one inference through each.
+
+        Loading runs in worker threads so the event loop keeps serving
+        (e.g. liveness checks) meanwhile. The embedder is remote, so a failed
+        warmup request only marks it degraded.
+
+        Raises:
+            Exception: If a local model fails to load
+        """
+        start = time.perf_counter()
+        self.ready = False
+        self.warmup_error = None
+
+        async def warm_tokenizer():
+            await asyncio.to_thread(lambda: self.tokenizer.encode("warmup"))
+
+        async def warm_converter():
+            await asyncio.to_thread(self._load_converter)
+
+        async def warm_reranker():
+            reranker = await asyncio.to_thread(lambda: self.reranker)
+            await reranker.score_pairs("warmup", ["warmup"])
+
+        async def warm_embedder():
+            if self.warmup_embedder:
+                await self.embedder.generate_embedding("warmup")
+            else:
+                _ = self.embedder
+
+        try:
+            await self._warm("tokenizer", warm_tokenizer)
+            await self._warm("docling_converter", warm_converter)
+            await self._warm("reranker", warm_reranker)
+            await self._warm("embedder", warm_embedder, required=False)
+        except Exception as e:
+            self.warmup_error = str(e)
+            logger.error(f"Model warmup failed: {e}")
+            raise
+
+        self.ready = True
+        logger.info(f"Model warmup complete in {time.perf_counter() - start:.1f}s")
+
+    async def warmup_with_retry(self, initial_delay: float = 5.0, max_delay: float = 300.0) -> None:
+        """
+        Warm up, retrying failed attempts with exponential backoff until ready.
+
+        Each failure is logged and kept in ``warmup_error`` (reported by
+        ``get_status``) while the next attempt waits.
+
+        Args:
+            initial_delay: Seconds before the first retry
+            max_delay: Upper bound for the delay between retries
+        """
+        delay = initial_delay
+        attempt = 1
+        while True:
+            try:
+                await self.warmup()
+                return
+            except Exception as e:
+                logger.error(f"Model warmup attempt {attempt} failed: {e}; retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+            attempt += 1
+
+    def get_status(self) -> Dict[str, Any]:
+        """Readiness and per-component warmup status."""
+        return {
+            "ready": self.ready,
+            "error": self.warmup_error,
+            "components": dict(self.components),
+        }
+
+    def close(self) -> None:
+        """Release model resources."""
+        if self._reranker is not None:
+            self._reranker.close()
+        self.ready = False
+
+
+# Global registry instance
+_model_registry: Optional[ModelRegistry] = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get or create global model registry."""
+    global _model_registry
+    if _model_registry is None:
+        _model_registry = ModelRegistry(
+            warmup_embedder=os.getenv("MODEL_WARMUP_EMBEDDING", "true").lower() == "true"
+        )
+    return _model_registry
+
+
+async def initialize_model_registry() -> ModelRegistry:
+    """Load and warm up the global model registry."""
+    registry = get_model_registry()
+    if not registry.ready:
+        await registry.warmup()
+    return registry
+
+
+def close_model_registry() -> None:
+    """Release the global model registry."""
+    global _model_registry
+    if _model_registry is not None:
+        _model_registry.close()
+        _model_registry = None
@@ -0,0 +1,332 @@
+"""
+Parallel multi-file ingestion on one shared pipeline.
+
+Used by ``cli ingest batch --jobs N``:
+- Up to ``jobs`` files are converted (Docling) concurrently on worker
+  threads, sharing the pipeline's converter (built once before fan-out)
+- Chunking also runs on a worker thread, one file at a time because the
+  shared tokenizer is not safe for concurrent use; it overlaps with the
+  other files' conversions and never blocks the event loop
+- Chunks from concurrently processed files are merged into shared embedding
+  batches, so many small files do not each send a small embedding request
+- A JSON manifest records every fully ingested file (with its size and
+  mtime); ``resume`` skips files that are unchanged since they were ingested.
+  Files whose embeddings failed (stored with zero vectors) are not recorded
+- Every stage is timed through ``track_document_processing`` (stages:
+  convert, chunk, embed, store) for the end-of-run summary
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .chunker import DocumentChunk
+from .ingest import DocumentIngestionPipeline, IngestionResult
+from ..monitoring.metrics import get_metrics, track_document_processing
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("convert", "chunk", "embed", "store")
+
+
+class IngestManifest:
+    """
+    Record of files already ingested, persisted after every file.
+
+    Example:
+        >>> manifest = IngestManifest(Path("docs/.ingest_manifest.json"))
+        >>> if not manifest.is_done(path):
+        ...     manifest.mark_done(path, result)
+    """
+
+    def __init__(self, path: Path, resume: bool = True):
+        """
+        Load or start a manifest.
+
+        Args:
+            path: Manifest JSON file
+            resume: Keep existing entries (False starts a fresh manifest)
+        """
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if resume and path.exists():
+            try:
+                self.entries = json.loads(path.read_text()).get("files", {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable ingest manifest {path}: {e}")
+
+    @staticmethod
+    def _fingerprint(file_path: Path) -> Dict[str, Any]:
+        stat = file_path.stat()
+        return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+    def is_done(self, file_path: Path) -> bool:
+        """True if the file was ingested and has not changed since."""
+        entry = self.entries.get(str(file_path.resolve()))
+        if entry is None:
+            return False
+        try:
+            fingerprint = self._fingerprint(file_path)
+        except OSError:
+            return False
+        return entry["size"] == fingerprint["size"] and entry["mtime"] == fingerprint["mtime"]
+
+    def mark_done(self, file_path: Path, result: IngestionResult) -> None:
+        """Record an ingested file and persist the manifest."""
+        self.entries[str(file_path.resolve())] = {
+            **self._fingerprint(file_path),
+            "document_id": result.document_id,
+            "chunks": result.chunks_created,
+            "ingested_at": time.time(),
+        }
+        self.save()
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({"files": self.entries}, indent=2))
+        os.replace(tmp_path, self.path)
+
+
+class CrossFileEmbeddingBatcher:
+    """
+    Merges chunks from concurrently processed files into shared embedding calls.
+
+    Chunks wait up to ``window_ms`` for other files to join, and a batch is
+    flushed early once it holds ``max_chunks``.
+    """
+
+    def __init__(self, embedder: Any, max_chunks: Optional[int] = None, window_ms: float = 50.0):
+        """
+        Initialize batcher.
+
+        Args:
+            embedder: Embedder with ``embed_chunks(chunks)`` (shared by all files)
+            max_chunks: Chunks per flush (default: the embedder's batch size)
+            window_ms: How long to wait for other files' chunks
+        """
+        self.embedder = embedder
+        self.max_chunks = max_chunks or getattr(embedder, "batch_size", 100)
+        self.window_ms = window_ms
+
+        self._pending: List[Tuple[List[DocumentChunk], "asyncio.Future[List[DocumentChunk]]"]] = []
+        self._pending_chunks = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self.flushes = 0
+
+    async def embed_chunks(self, chunks: List[DocumentChunk]) -> List[DocumentChunk]:
+        """Embed one file's chunks as part of a shared batch."""
+        if not chunks:
+            return chunks
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((chunks, future))
+        self._pending_chunks += len(chunks)
+
+        if self._pending_chunks >= self.max_chunks:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            loop.create_task(self._flush())
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.window_ms / 1000, lambda: loop.create_task(self._flush())
+            )
+
+        return await future
+
+    async def _flush(self) -> None:
+        """Embed every pending file's chunks in one call and hand them back."""
+        self._flush_handle = None
+        batch, self._pending = self._pending, []
+        self._pending_chunks = 0
+        if not batch:
+            return
+
+        all_chunks = [chunk for chunks, _ in batch for chunk in chunks]
+        self.flushes += 1
+        start = time.perf_counter()
+        try:
+            embedded = await self.embedder.embed_chunks(all_chunks)
+        except Exception as e:
+            track_document_processing("embed", (time.perf_counter() - start) * 1000, False)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        track_document_processing("embed", (time.perf_counter() - start) * 1000, True)
+
+        offset = 0
+        for chunks, future in batch:
+            if not future.done():
+                future.set_result(embedded[offset:offset + len(chunks)])
+            offset += len(chunks)
+
+
+class ParallelIngestor:
+    """
+    Ingests many files concurrently through one shared pipeline.
+
+    Example:
+        >>> ingestor = ParallelIngestor(pipeline, jobs=4, manifest=manifest)
+        >>> results = await ingestor.run(files)
+    """
+
+    def __init__(
+        self,
+        pipeline: DocumentIngestionPipeline,
+        jobs: int = 4,
+        manifest: Optional[IngestManifest] = None,
+        embed_window_ms: float = 50.0,
+        collection_name: Optional[str] = None
+    ):
+        """
+        Initialize ingestor.
+
+        Args:
+            pipeline: Initialized ingestion pipeline (converter, chunker, embedder)
+            jobs: Files converted concurrently
+            manifest: Records ingested files (None = no resume support)
+            embed_window_ms: How long chunks wait for other files to join an embedding batch
+            collection_name: Named collection to store into (None = the pipeline's default collection)
+        """
+        self.pipeline = pipeline
+        self.jobs = max(1, jobs)
+        self.manifest = manifest
+        self.collection_name = collection_name
+        self.batcher = CrossFileEmbeddingBatcher(pipeline.embedder, window_ms=embed_window_ms)
+
+        # Conversion slots, and a bound on files held in memory awaiting embedding/storage
+        self._convert_slots = asyncio.Semaphore(self.jobs)
+        self._in_flight = asyncio.Semaphore(self.jobs * 2)
+        # The shared tokenizer must not be used by two threads at once
+        self._chunk_lock = asyncio.Lock()
+
+    async def _timed(self, stage: str, step: Callable[[], Any]) -> Any:
+        """Run one stage and record its duration."""
+        start = time.perf_counter()
+        try:
+            result = await step()
+        except Exception:
+            track_document_processing(stage, (time.perf_counter() - start) * 1000, False)
+            raise
+        track_document_processing(stage, (time.perf_counter() - start) * 1000, True)
+        return result
+
+    async def ingest_file(self, file_path: Path, metadata: Optional[Dict[str, Any]] = None) -> IngestionResult:
+        """
+        Convert, chunk, embed and store one file.
+
+        Args:
+            file_path: Document to ingest
+            metadata: Extra metadata stored with every chunk
+
+        Returns:
+            Ingestion result
+        """
+        pipeline = self.pipeline
+        start = time.perf_counter()
+
+        async with self._in_flight:
+            async with self._convert_slots:
+                content, docling_doc = await self._timed(
+                    "convert", lambda: asyncio.to_thread(pipeline._read_document, str(file_path))
+                )
+                title = pipeline._extract_title(content, str(file_path))
+                source = os.path.relpath(file_path, pipeline.documents_folder)
+                document_metadata = {**pipeline._extract_document_metadata(content, str(file_path)), **(metadata or {})}
+
+                async with self._chunk_lock:
+                    chunks = await self._timed("chunk", lambda: asyncio.to_thread(
+                        pipeline.chunker.chunk_document_sync,
+                        content, title, source, document_metadata, docling_doc
+                    ))
+
+            if not chunks:
+                return IngestionResult(
+                    document_id="",
+                    title=title,
+                    chunks_created=0,
+                    processing_time_ms=(time.perf_counter() - start) * 1000,
+                    errors=["No chunks created"]
+                )
+
+            embedded_chunks = await self.batcher.embed_chunks(chunks)
+
+            document_id = await self._timed("store", lambda: pipeline._save_to_chroma(
+                title, source, content, embedded_chunks, document_metadata,
+                collection_name=self.collection_name
+            ))
+
+        result = IngestionResult(
+            document_id=document_id,
+            title=title,
+            chunks_created=len(chunks),
+            processing_time_ms=(time.perf_counter() - start) * 1000,
+        )
+        failed_embeddings = sum(1 for chunk in embedded_chunks if "embedding_error" in chunk.metadata)
+        if failed_embeddings:
+            # Stored with zero vectors: leave it out of the manifest so --resume retries it
+            result.errors.append(f"Embedding failed for {failed_embeddings} chunks")
+        elif self.manifest is not None:
+            self.manifest.mark_done(file_path, result)
+        return result
+
+    async def run(
+        self,
+        files: List[Path],
+        metadata: Optional[Dict[str, Any]] = None,
+        on_result: Optional[Callable[[Path, Optional[IngestionResult], Optional[Exception]], None]] = None
+    ) -> List[Optional[IngestionResult]]:
+        """
+        Ingest files concurrently.
+
+        Args:
+            files: Documents to ingest
+            metadata: Extra metadata stored with every chunk
+            on_result: Called as each file finishes with (path, result, error)
+
+        Returns:
+            Results in input order (None where a file failed)
+        """
+        async def ingest(file_path: Path) -> Optional[IngestionResult]:
+            try:
+                result = await self.ingest_file(file_path, metadata)
+            except Exception as e:
+                logger.error(f"Failed to ingest {file_path}: {e}")
+                if on_result:
+                    on_result(file_path, None, e)
+                return None
+            if on_result:
+                on_result(file_path, result, None)
+            return result
+
+        await self.prepare()
+        return await asyncio.gather(*(ingest(file_path) for file_path in files))
+
+    async def prepare(self) -> None:
+        """Build the shared Docling converter once, before files fan out to threads."""
+        try:
+            await asyncio.to_thread(self.pipeline.processor._get_docling_converter)
+        except Exception as e:
+            # Text formats don't need Docling; conversions that do will report it
+            logger.warning(f"Docling converter unavailable: {e}")
+
+
+def get_stage_timings() -> Dict[str, Dict[str, float]]:
+    """Per-stage timer statistics (successful runs) recorded by this process."""
+    metrics = get_metrics()
+    timings = {}
+    for stage in STAGES:
+        stats = metrics.get_timer_stats(
+            "document_processing_duration", tags={"stage": stage, "success": "True"}
+        )
+        if stats:
+            timings[stage] = {**stats, "total_ms": stats["avg_ms"] * stats["count"]}
+    return timings
@@ -18,6 +18,7 @@ import hashlib
 import logging
 import mimetypes
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
@@ -86,19 +87,22 @@ class DocumentProcessor:
     def __init__(self):
         """Initialize document processor."""
         self._docling_converter = None
+        self._converter_lock = threading.Lock()
     
     def _get_docling_converter(self):
-        """Lazy-load Docling converter."""
+        """Lazy-load Docling converter (once, even with concurrent callers)."""
         if self._docling_converter is None:
-            try:
-                from docling.document_converter import DocumentConverter
-                self._docling_converter = DocumentConverter()
-                logger.info("Docling DocumentConverter initialized")
-            except ImportError:
-                raise DocumentProcessingError(
-                    message="Docling is not installed",
-                    remediation="Install docling: pip install docling[vlm]>=2.55.0"
-                )
+            with self._converter_lock:
+                if self._docling_converter is None:
+                    try:
+                        from docling.document_converter import DocumentConverter
+                        self._docling_converter = DocumentConverter()
+                        logger.info("Docling DocumentConverter initialized")
+                    except ImportError:
+                        raise DocumentProcessingError(
+                            message="Docling is not installed",
+                            remediation="Install docling: pip install docling[vlm]>=2.55.0"
+                        )
         return self._docling_converter
     
     def process_file(self, file_path: str) -> ProcessedDocument:
@@ -0,0 +1,194 @@
+"""
+In-process pub/sub for ingestion progress.
+
+Ingestion and batch code publish progress snapshots to a topic
+(``ingest:<document_id>``, ``batch:<batch_id>``); SSE endpoints subscribe
+and receive each update as soon as it is published, without polling.
+
+- Each subscriber has a bounded queue; when a slow client falls behind, the
+  oldest pending snapshot is dropped so it always catches up to the latest
+- New subscribers immediately receive the topic's latest snapshot
+- A final snapshot (completed/failed) ends every subscription on the topic
+- The broker only sees its own process; ``follow`` falls back to polling the
+  persisted status when no update arrives in time (the job may be running in
+  another API worker) and yields heartbeats meanwhile
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Seconds a finished topic keeps its last snapshot for late subscribers
+FINISHED_TOPIC_TTL = 300.0
+
+# Seconds without a published update before ``follow`` polls the stored status
+POLL_INTERVAL = float(os.getenv("PROGRESS_POLL_INTERVAL", "5"))
+
+
+class _Subscription:
+    """One subscriber's bounded queue of (snapshot, final) pairs."""
+
+    def __init__(self, max_queue: int):
+        self.queue: "asyncio.Queue[tuple]" = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def offer(self, snapshot: Dict[str, Any], final: bool) -> None:
+        """Enqueue, dropping the oldest pending snapshot if the client is behind."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait((snapshot, final))
+
+
+class ProgressBroker:
+    """
+    Topic-based progress broadcaster for the event loop it runs on.
+
+    Example:
+        >>> broker = get_progress_broker()
+        >>> broker.publish("batch:123", {"progress": 0.5})
+        >>> async for snapshot in broker.subscribe("batch:123"):
+        ...     print(snapshot["progress"])
+    """
+
+    def __init__(self, max_queue: int = 16):
+        """
+        Initialize broker.
+
+        Args:
+            max_queue: Pending snapshots per subscriber before coalescing
+        """
+        self.max_queue = max_queue
+        self._subscribers: Dict[str, Set[_Subscription]] = {}
+        self._latest: Dict[str, tuple] = {}
+
+    def publish(self, topic: str, snapshot: Dict[str, Any], final: bool = False) -> None:
+        """
+        Publish a progress snapshot (never blocks).
+
+        Args:
+            topic: Topic name
+            snapshot: JSON-serializable progress state
+            final: True for the terminal snapshot (ends subscriptions)
+        """
+        self._latest[topic] = (snapshot, final)
+        for subscription in self._subscribers.get(topic, ()):
+            subscription.offer(snapshot, final)
+
+        if final:
+            try:
+                asyncio.get_running_loop().call_later(
+                    FINISHED_TOPIC_TTL, self._expire, topic, snapshot
+                )
+            except RuntimeError:
+                pass  # No loop (e.g. sync caller); keep the snapshot
+
+    def _expire(self, topic: str, snapshot: Dict[str, Any]) -> None:
+        """Forget a finished topic unless it was republished since."""
+        latest = self._latest.get(topic)
+        if latest is not None and latest[0] is snapshot:
+            del self._latest[topic]
+
+    def latest(self, topic: str) -> Optional[Dict[str, Any]]:
+        """Latest snapshot for a topic (None if never published)."""
+        latest = self._latest.get(topic)
+        return latest[0] if latest else None
+
+    async def subscribe(
+        self,
+        topic: str,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield snapshots for a topic until its final snapshot.
+
+        Args:
+            topic: Topic name
+            timeout: Seconds to wait for an update before yielding None
+                (None = wait indefinitely)
+
+        Yields:
+            Progress snapshots, starting with the latest published one
+            (None when ``timeout`` passed without an update)
+        """
+        subscription = _Subscription(self.max_queue)
+        self._subscribers.setdefault(topic, set()).add(subscription)
+
+        latest = self._latest.get(topic)
+        if latest is not None:
+            subscription.offer(*latest)
+
+        try:
+            while True:
+                try:
+                    snapshot, final = await asyncio.wait_for(subscription.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                yield snapshot
+                if final:
+                    break
+        finally:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[topic]
+            if subscription.dropped:
+                logger.debug(f"Coalesced {subscription.dropped} updates for slow subscriber on {topic}")
+
+    async def follow(
+        self,
+        topic: str,
+        poll: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        is_final: Callable[[Dict[str, Any]], bool],
+        interval: float = POLL_INTERVAL
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield snapshots for a topic, polling when this process sees no updates.
+
+        Args:
+            topic: Topic name
+            poll: Re-reads the persisted snapshot (None once it no longer exists)
+            is_final: Whether a snapshot is terminal
+            interval: Seconds without a published update before polling
+
+        Yields:
+            Snapshots as they change, and None as a heartbeat when a poll found
+            nothing new; ends after a final snapshot
+        """
+        last: Optional[Dict[str, Any]] = None
+        async for snapshot in self.subscribe(topic, timeout=interval):
+            if snapshot is None:
+                snapshot = await poll()
+                if snapshot is None:
+                    return
+                if snapshot == last:
+                    yield None
+                    continue
+            last = snapshot
+            yield snapshot
+            if is_final(snapshot):
+                return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Broker statistics."""
+        return {
+            "topics": len(self._latest),
+            "subscribers": sum(len(subs) for subs in self._subscribers.values()),
+        }
+
+
+# Global broker instance
+_progress_broker: Optional[ProgressBroker] = None
+
+
+def get_progress_broker() -> ProgressBroker:
+    """Get or create global progress broker."""
+    global _progress_broker
+    if _progress_broker is None:
+        _progress_broker = ProgressBroker()
+    return _progress_broker
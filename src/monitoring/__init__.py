@@ -2,6 +2,7 @@
 
 from .metrics import (
     MetricsCollector,
+    Histogram,
     get_metrics,
     collect_system_metrics,
     Timer,
@@ -32,6 +33,7 @@ from .profiling import (
 __all__ = [
     # Metrics
     "MetricsCollector",
+    "Histogram",
     "get_metrics",
     "collect_system_metrics",
     "Timer",
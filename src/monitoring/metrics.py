@@ -7,18 +7,38 @@ Tracks:
 - Error rates
 - Database operation performance
 - Cache hit rates
+
+Timers and histograms are fixed-bucket cumulative histograms: recording is
+O(1) and memory is constant per series, and they are exported to Prometheus
+with ``_bucket``/``_sum``/``_count`` lines carrying the series' tags as labels.
 """
 
+import re
+import threading
 import time
 import psutil
 import logging
-from typing import Dict, Any, Optional, List
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+from collections import defaultdict
+from datetime import datetime
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds (ms) for timer buckets; exported in seconds
+DEFAULT_TIMER_BUCKETS_MS: Tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000
+)
+
+# Upper bounds for value histograms (result counts, batch sizes, ...)
+DEFAULT_HISTOGRAM_BUCKETS: Tuple[float, ...] = (
+    1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000
+)
+
+# (metric name, sorted label pairs)
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
 
 class MetricType(str, Enum):
     """Types of metrics to track."""
@@ -28,65 +48,189 @@ class MetricType(str, Enum):
     TIMER = "timer"  # Duration measurements
 
 
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    Recording is O(1) in the number of observations (one bisect over the
+    fixed bucket bounds); quantiles are estimated from the buckets by linear
+    interpolation, like Prometheus' histogram_quantile().
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(upper bound, cumulative count) pairs, ending with +Inf."""
+        pairs = []
+        total = 0
+        for bound, bucket_count in zip(self.bounds + (float("inf"),), self.counts):
+            total += bucket_count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0..1), clamped to the observed range."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        lower = 0.0
+        seen = 0
+        for bound, bucket_count in zip(self.bounds + (self.max,), self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                upper = min(bound, self.max)
+                lower = max(lower, self.min)
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(estimate, self.min), self.max)
+            seen += bucket_count
+            lower = bound
+        return self.max
+
+    def stats(self) -> Dict[str, float]:
+        """count, min, max, avg and estimated p50/p95/p99."""
+        if not self.count:
+            return {}
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.sum / self.count,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+def _sanitize_name(name: str) -> str:
+    """Make a metric or label name valid for Prometheus."""
+    return re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{_sanitize_name(k)}="{_escape_label_value(v)}"' for k, v in pairs) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
 class MetricsCollector:
-    """Collect and aggregate performance metrics."""
+    """
+    Collect and aggregate performance metrics.
+
+    Every series is keyed by metric name plus its tags, so differently
+    tagged series are never mixed. Timers and histograms are fixed-bucket
+    cumulative histograms exported with ``_bucket``/``_sum``/``_count``.
+    """
     
-    def __init__(self, max_history: int = 1000):
-        self.max_history = max_history
+    def __init__(
+        self,
+        timer_buckets_ms: Sequence[float] = DEFAULT_TIMER_BUCKETS_MS,
+        histogram_buckets: Sequence[float] = DEFAULT_HISTOGRAM_BUCKETS
+    ):
+        self.timer_buckets_ms = tuple(timer_buckets_ms)
+        self.histogram_buckets = tuple(histogram_buckets)
+        self._custom_buckets: Dict[str, Tuple[float, ...]] = {}
+        self._lock = threading.Lock()
         
         # Metric storage
-        self.counters: Dict[str, int] = defaultdict(int)
-        self.gauges: Dict[str, float] = {}
-        self.histograms: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
-        self.timers: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
+        self.counters: Dict[SeriesKey, float] = defaultdict(int)
+        self.gauges: Dict[SeriesKey, float] = {}
+        self.histograms: Dict[SeriesKey, Histogram] = {}
+        self.timers: Dict[SeriesKey, Histogram] = {}
         
         # Timestamps
         self.start_time = datetime.utcnow()
         self.last_reset = datetime.utcnow()
     
+    def set_buckets(self, metric_name: str, buckets: Sequence[float]) -> None:
+        """Use custom bucket bounds for a timer (ms) or histogram metric."""
+        self._custom_buckets[metric_name] = tuple(buckets)
+    
     def increment(self, metric_name: str, value: int = 1, tags: Optional[Dict[str, str]] = None):
         """Increment a counter metric."""
-        key = self._make_key(metric_name, tags)
-        self.counters[key] += value
+        key = self._series_key(metric_name, tags)
+        with self._lock:
+            self.counters[key] += value
     
     def gauge(self, metric_name: str, value: float, tags: Optional[Dict[str, str]] = None):
         """Set a gauge metric to specific value."""
-        key = self._make_key(metric_name, tags)
+        key = self._series_key(metric_name, tags)
         self.gauges[key] = value
     
     def histogram(self, metric_name: str, value: float, tags: Optional[Dict[str, str]] = None):
         """Add value to histogram."""
-        key = self._make_key(metric_name, tags)
-        self.histograms[key].append({
-            "value": value,
-            "timestamp": datetime.utcnow()
-        })
+        self._observe(self.histograms, self.histogram_buckets, metric_name, value, tags)
     
     def timer(self, metric_name: str, duration_ms: float, tags: Optional[Dict[str, str]] = None):
         """Record timing measurement."""
-        key = self._make_key(metric_name, tags)
-        self.timers[key].append({
-            "duration_ms": duration_ms,
-            "timestamp": datetime.utcnow()
-        })
+        self._observe(self.timers, self.timer_buckets_ms, metric_name, duration_ms, tags)
     
-    def _make_key(self, metric_name: str, tags: Optional[Dict[str, str]] = None) -> str:
-        """Create metric key with tags."""
+    def _observe(
+        self,
+        series: Dict[SeriesKey, Histogram],
+        default_buckets: Tuple[float, ...],
+        metric_name: str,
+        value: float,
+        tags: Optional[Dict[str, str]]
+    ) -> None:
+        key = self._series_key(metric_name, tags)
+        with self._lock:
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = Histogram(self._custom_buckets.get(metric_name, default_buckets))
+            hist.observe(value)
+    
+    @staticmethod
+    def _series_key(metric_name: str, tags: Optional[Dict[str, str]] = None) -> SeriesKey:
+        """Series identity: name plus sorted tags."""
         if not tags:
+            return (metric_name, ())
+        return (metric_name, tuple(sorted((k, str(v)) for k, v in tags.items())))
+    
+    def _make_key(self, metric_name: str, tags: Optional[Dict[str, str]] = None) -> str:
+        """Create display key with tags (used in JSON export)."""
+        return self._display_key(self._series_key(metric_name, tags))
+    
+    @staticmethod
+    def _display_key(key: SeriesKey) -> str:
+        metric_name, labels = key
+        if not labels:
             return metric_name
-        
-        tag_str = ",".join(f"{k}={v}" for k, v in sorted(tags.items()))
+        tag_str = ",".join(f"{k}={v}" for k, v in labels)
         return f"{metric_name}{{{tag_str}}}"
     
     def get_counter(self, metric_name: str, tags: Optional[Dict[str, str]] = None) -> int:
         """Get counter value."""
-        key = self._make_key(metric_name, tags)
-        return self.counters.get(key, 0)
+        return self.counters.get(self._series_key(metric_name, tags), 0)
     
     def get_gauge(self, metric_name: str, tags: Optional[Dict[str, str]] = None) -> Optional[float]:
         """Get gauge value."""
-        key = self._make_key(metric_name, tags)
-        return self.gauges.get(key)
+        return self.gauges.get(self._series_key(metric_name, tags))
     
     def get_histogram_stats(
         self,
@@ -94,24 +238,8 @@ class MetricsCollector:
         tags: Optional[Dict[str, str]] = None
     ) -> Dict[str, float]:
         """Get histogram statistics (min, max, avg, p50, p95, p99)."""
-        key = self._make_key(metric_name, tags)
-        values = [entry["value"] for entry in self.histograms.get(key, [])]
-        
-        if not values:
-            return {}
-        
-        sorted_values = sorted(values)
-        count = len(sorted_values)
-        
-        return {
-            "count": count,
-            "min": sorted_values[0],
-            "max": sorted_values[-1],
-            "avg": sum(sorted_values) / count,
-            "p50": sorted_values[int(count * 0.50)] if count > 0 else 0,
-            "p95": sorted_values[int(count * 0.95)] if count > 0 else 0,
-            "p99": sorted_values[int(count * 0.99)] if count > 0 else 0,
-        }
+        hist = self.histograms.get(self._series_key(metric_name, tags))
+        return hist.stats() if hist else {}
     
     def get_timer_stats(
         self,
@@ -119,63 +247,94 @@ class MetricsCollector:
         tags: Optional[Dict[str, str]] = None
     ) -> Dict[str, float]:
         """Get timer statistics."""
-        key = self._make_key(metric_name, tags)
-        durations = [entry["duration_ms"] for entry in self.timers.get(key, [])]
-        
-        if not durations:
+        hist = self.timers.get(self._series_key(metric_name, tags))
+        return self._timer_stats(hist) if hist else {}
+    
+    @staticmethod
+    def _timer_stats(hist: Histogram) -> Dict[str, float]:
+        stats = hist.stats()
+        if not stats:
             return {}
-        
-        sorted_durations = sorted(durations)
-        count = len(sorted_durations)
-        
         return {
-            "count": count,
-            "min_ms": sorted_durations[0],
-            "max_ms": sorted_durations[-1],
-            "avg_ms": sum(sorted_durations) / count,
-            "p50_ms": sorted_durations[int(count * 0.50)] if count > 0 else 0,
-            "p95_ms": sorted_durations[int(count * 0.95)] if count > 0 else 0,
-            "p99_ms": sorted_durations[int(count * 0.99)] if count > 0 else 0,
+            "count": stats["count"],
+            "min_ms": stats["min"],
+            "max_ms": stats["max"],
+            "avg_ms": stats["avg"],
+            "p50_ms": stats["p50"],
+            "p95_ms": stats["p95"],
+            "p99_ms": stats["p99"],
         }
     
     def reset(self):
         """Reset all metrics."""
-        self.counters.clear()
-        self.gauges.clear()
-        self.histograms.clear()
-        self.timers.clear()
+        with self._lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+            self.timers.clear()
         self.last_reset = datetime.utcnow()
     
+    @staticmethod
+    def _by_name(series: Dict[SeriesKey, Any]) -> Dict[str, List[Tuple[SeriesKey, Any]]]:
+        grouped: Dict[str, List[Tuple[SeriesKey, Any]]] = defaultdict(list)
+        for key, value in sorted(series.items()):
+            grouped[key[0]].append((key, value))
+        return grouped
+    
     def export_prometheus(self) -> str:
-        """Export metrics in Prometheus format."""
-        lines = []
+        """Export metrics in Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+            histograms = {
+                key: (hist, 1.0) for key, hist in self.histograms.items()
+            }
+            # Timers are recorded in ms and exported in seconds
+            timers = {
+                (f"{key[0]}_seconds", key[1]): (hist, 1000.0) for key, hist in self.timers.items()
+            }
+            snapshot = {
+                key: (hist.cumulative(), hist.sum / scale, hist.count, scale)
+                for key, (hist, scale) in {**histograms, **timers}.items()
+            }
         
-        # Counters
-        for key, value in self.counters.items():
-            lines.append(f"{key} {value}")
+        for metric_type, series in (("counter", counters), ("gauge", gauges)):
+            for metric_name, items in self._by_name(series).items():
+                name = _sanitize_name(metric_name)
+                lines.append(f"# TYPE {name} {metric_type}")
+                for (_, labels), value in items:
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
         
-        # Gauges
-        for key, value in self.gauges.items():
-            lines.append(f"{key} {value}")
+        for metric_name, items in self._by_name(snapshot).items():
+            name = _sanitize_name(metric_name)
+            lines.append(f"# TYPE {name} histogram")
+            for (_, labels), (buckets, total, count, scale) in items:
+                for bound, cumulative in buckets:
+                    le = _format_bound(bound / scale if bound != float("inf") else bound)
+                    lines.append(f"{name}_bucket{_format_labels(labels, ('le', le))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+                lines.append(f"{name}_count{_format_labels(labels)} {count}")
         
-        return "\n".join(lines)
+        return "\n".join(lines) + "\n"
     
     def export_json(self) -> Dict[str, Any]:
-        """Export all metrics as JSON."""
-        return {
-            "uptime_seconds": (datetime.utcnow() - self.start_time).total_seconds(),
-            "last_reset": self.last_reset.isoformat(),
-            "counters": dict(self.counters),
-            "gauges": dict(self.gauges),
-            "histograms": {
-                key: self.get_histogram_stats(key.split("{")[0])
-                for key in self.histograms.keys()
-            },
-            "timers": {
-                key: self.get_timer_stats(key.split("{")[0])
-                for key in self.timers.keys()
-            },
-        }
+        """Export all metrics as JSON (one entry per tagged series)."""
+        with self._lock:
+            return {
+                "uptime_seconds": (datetime.utcnow() - self.start_time).total_seconds(),
+                "last_reset": self.last_reset.isoformat(),
+                "counters": {self._display_key(key): value for key, value in self.counters.items()},
+                "gauges": {self._display_key(key): value for key, value in self.gauges.items()},
+                "histograms": {
+                    self._display_key(key): hist.stats()
+                    for key, hist in self.histograms.items()
+                },
+                "timers": {
+                    self._display_key(key): self._timer_stats(hist)
+                    for key, hist in self.timers.items()
+                },
+            }
 
 
 # Global metrics collector
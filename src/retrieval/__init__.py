@@ -4,15 +4,35 @@ Retrieval module for RAG system.
 Provides vector search, graph search, and hybrid search capabilities.
 """
 
-from .vector_search import vector_search, VectorSearchResult
+from .vector_search import (
+    vector_search,
+    vector_search_batch,
+    vector_search_detailed,
+    VectorSearchResult,
+    VectorSearchResponse,
+)
 from .graph_search import graph_search, GraphSearchResult
-from .hybrid_search import hybrid_search, HybridSearchResult
+from .hybrid_search import (
+    hybrid_search,
+    hybrid_search_detailed,
+    HybridSearchResult,
+    HybridSearchResponse,
+)
+from .fusion import Retriever, FusionResult, fuse
 
 __all__ = [
     "vector_search",
+    "vector_search_batch",
+    "vector_search_detailed",
+    "VectorSearchResponse",
     "VectorSearchResult",
     "graph_search",
     "GraphSearchResult",
     "hybrid_search",
+    "hybrid_search_detailed",
     "HybridSearchResult",
+    "HybridSearchResponse",
+    "Retriever",
+    "FusionResult",
+    "fuse",
 ]
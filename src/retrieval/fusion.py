@@ -0,0 +1,153 @@
+"""
+Deadline-aware N-way Reciprocal Rank Fusion.
+
+Runs any number of retrievers (dense, sparse, graph, symbol lookup, ...)
+concurrently under one latency budget and fuses whatever finished in time:
+- Weighted RRF: score = Σ(weight_i / (k + rank_i)) over contributing retrievers
+- Retrievers still running at the deadline are cancelled
+- The result records which retrievers contributed, timed out or failed
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEADLINE = float(os.getenv("FUSION_DEADLINE_SECONDS", "2.0"))
+
+
+@dataclass
+class Retriever:
+    """A named, weighted ranked-list source for fusion."""
+    name: str
+    search: Callable[[], Awaitable[List[Any]]]  # Returns items best first
+    key: Callable[[Any], str]  # Identity used to merge the same item across sources
+    weight: float = 1.0
+
+
+@dataclass
+class FusedItem:
+    """An item with its fused score and per-source ranks (1-based)."""
+    item: Any
+    score: float
+    ranks: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def sources(self) -> List[str]:
+        return list(self.ranks)
+
+
+@dataclass
+class FusionResult:
+    """Fused ranking plus per-retriever outcomes."""
+    items: List[FusedItem] = field(default_factory=list)
+    contributed: List[str] = field(default_factory=list)
+    timed_out: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)  # retriever -> error
+
+    @property
+    def partial(self) -> bool:
+        """True if any retriever did not contribute."""
+        return bool(self.timed_out or self.failed)
+
+
+def rrf_fuse(
+    rankings: Dict[str, List[Any]],
+    key: Dict[str, Callable[[Any], str]],
+    weights: Dict[str, float],
+    rrf_k: int = 60,
+    limit: Optional[int] = None
+) -> List[FusedItem]:
+    """
+    Fuse ranked lists with weighted RRF.
+
+    Args:
+        rankings: Retriever name -> items, best first
+        key: Retriever name -> identity function
+        weights: Retriever name -> weight
+        rrf_k: RRF constant (typically 60)
+        limit: Maximum fused items (None = all)
+
+    Returns:
+        Fused items ordered by score; an item found by several retrievers keeps
+        the first retriever's representation
+    """
+    fused: Dict[str, FusedItem] = {}
+
+    for name, items in rankings.items():
+        weight = weights.get(name, 1.0)
+        for rank, item in enumerate(items, start=1):
+            item_key = key[name](item)
+            entry = fused.get(item_key)
+            if entry is None:
+                entry = fused[item_key] = FusedItem(item=item, score=0.0)
+            entry.score += weight / (rrf_k + rank)
+            entry.ranks.setdefault(name, rank)
+
+    ordered = sorted(fused.values(), key=lambda entry: entry.score, reverse=True)
+    return ordered[:limit] if limit is not None else ordered
+
+
+async def fuse(
+    retrievers: List[Retriever],
+    limit: int = 10,
+    rrf_k: int = 60,
+    deadline: Optional[float] = None
+) -> FusionResult:
+    """
+    Run retrievers concurrently and fuse the ones that finish by the deadline.
+
+    Args:
+        retrievers: Sources to fuse
+        limit: Maximum fused items
+        rrf_k: RRF constant
+        deadline: Global latency budget in seconds (default FUSION_DEADLINE_SECONDS)
+
+    Returns:
+        FusionResult with fused items and which retrievers contributed
+
+    Example:
+        >>> result = await fuse([
+        ...     Retriever("dense", lambda: dense(q), key=lambda r: r.chunk_id, weight=0.7),
+        ...     Retriever("graph", lambda: graph(q), key=lambda r: r.uuid, weight=0.3),
+        ... ], limit=10, deadline=1.5)
+        >>> result.contributed, result.timed_out
+    """
+    deadline = DEFAULT_DEADLINE if deadline is None else deadline
+    result = FusionResult()
+    if not retrievers:
+        return result
+
+    tasks = {asyncio.ensure_future(r.search()): r for r in retrievers}
+    done, pending = await asyncio.wait(tasks, timeout=deadline)
+
+    for task in pending:
+        task.cancel()
+        result.timed_out.append(tasks[task].name)
+        logger.warning(f"Retriever {tasks[task].name} missed the {deadline}s fusion deadline")
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    rankings: Dict[str, List[Any]] = {}
+    for task in done:
+        retriever = tasks[task]
+        error = task.exception()
+        if error is not None:
+            result.failed[retriever.name] = str(error) or type(error).__name__
+            logger.warning(f"Retriever {retriever.name} failed: {error}")
+        else:
+            rankings[retriever.name] = task.result() or []
+
+    # Keep the caller's retriever order for stable annotations
+    result.contributed = [r.name for r in retrievers if r.name in rankings]
+    result.items = rrf_fuse(
+        {name: rankings[name] for name in result.contributed},
+        key={r.name: r.key for r in retrievers},
+        weights={r.name: r.weight for r in retrievers},
+        rrf_k=rrf_k,
+        limit=limit
+    )
+    return result
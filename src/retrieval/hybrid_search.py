@@ -4,22 +4,24 @@ Hybrid search combining vector and graph search with RRF ranking.
 Implements Reciprocal Rank Fusion (RRF) to combine results from multiple
 search methods. Adapted from agentic-rag-knowledge-graph/agent/db_utils.py:hybrid_search()
 
-RRF Formula: score = sum(1 / (k + rank_i)) for each ranking
+RRF Formula: score = sum(weight_i / (k + rank_i)) for each ranking
 Standard k value: 60 (from academic literature)
 
 Key differences from PostgreSQL implementation:
 - Application-level RRF (not database function)
-- Combines vector (Chroma) + graph (Graphiti) instead of vector + text
-- Parallel execution for better performance
+- Combines vector (Chroma) + graph (Graphiti) + any extra retrievers
+  (sparse, symbol lookup) instead of vector + text
+- Concurrent execution under a latency budget (see ``fusion.fuse``): slow
+  retrievers are cancelled and the response reports who contributed
 """
 
-import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
-from .vector_search import vector_search, VectorSearchResult, vector_search_by_text
+from .vector_search import VectorSearchResult, vector_search_by_text
 from .graph_search import graph_search, GraphSearchResult
+from .fusion import Retriever, fuse
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,7 @@ class HybridSearchResult(BaseModel):
     combined_score: float = Field(..., description="Combined RRF score")
     vector_score: Optional[float] = Field(None, description="Vector similarity score")
     graph_score: Optional[float] = Field(None, description="Graph relevance score")
+    sources: List[str] = Field(default_factory=list, description="Retrievers that returned this result")
     
     # Original result data
     chunk_id: Optional[str] = Field(None, description="Chunk ID (for vector results)")
@@ -44,6 +47,20 @@ class HybridSearchResult(BaseModel):
     collection: Optional[str] = Field(None, description="Collection name (for vector results)")
 
 
+class HybridSearchResponse(BaseModel):
+    """Fused hybrid results plus which retrievers contributed."""
+    
+    results: List[HybridSearchResult] = Field(default_factory=list, description="Fused results, best first")
+    contributed_sources: List[str] = Field(default_factory=list, description="Retrievers fused into the results")
+    timed_out_sources: List[str] = Field(default_factory=list, description="Retrievers cancelled at the deadline")
+    failed_sources: Dict[str, str] = Field(default_factory=dict, description="Retriever -> error")
+    
+    @property
+    def partial(self) -> bool:
+        """True if some retrievers did not contribute."""
+        return bool(self.timed_out_sources or self.failed_sources)
+
+
 async def hybrid_search(
     query_text: str,
     collection_name: Optional[str] = None,
@@ -52,13 +69,15 @@ async def hybrid_search(
     graph_weight: float = 0.3,
     rrf_k: int = 60,
     use_graph: bool = True,
-    metadata_filter: Optional[Dict[str, Any]] = None
+    metadata_filter: Optional[Dict[str, Any]] = None,
+    extra_retrievers: Optional[List[Retriever]] = None,
+    deadline: Optional[float] = None
 ) -> List[HybridSearchResult]:
     """
     Perform hybrid search combining vector and graph search with RRF ranking.
     
     This function runs vector similarity search and graph knowledge search
-    in parallel, then combines results using Reciprocal Rank Fusion (RRF).
+    concurrently, then combines results using Reciprocal Rank Fusion (RRF).
     
     Args:
         query_text: Natural language query
@@ -69,6 +88,9 @@ async def hybrid_search(
         rrf_k: RRF constant (default 60, standard from literature)
         use_graph: Whether to include graph search (default True)
         metadata_filter: Optional metadata filter for vector search
+        extra_retrievers: Additional sources (e.g. sparse, symbol lookup)
+            returning HybridSearchResult lists
+        deadline: Latency budget in seconds (default FUSION_DEADLINE_SECONDS)
     
     Returns:
         List of hybrid search results ordered by combined RRF score
@@ -89,173 +111,138 @@ async def hybrid_search(
         ...     print(f"  {result.content[:100]}")
     
     Notes:
-        - Vector and graph searches run in parallel for better performance
+        - Retrievers run concurrently; those missing the deadline are cancelled
         - RRF is more robust than score averaging when combining different metrics
         - Graph search can be disabled (use_graph=False) for faster queries
+        - Use hybrid_search_detailed() to see which sources contributed
+    """
+    response = await hybrid_search_detailed(
+        query_text=query_text,
+        collection_name=collection_name,
+        limit=limit,
+        vector_weight=vector_weight,
+        graph_weight=graph_weight,
+        rrf_k=rrf_k,
+        use_graph=use_graph,
+        metadata_filter=metadata_filter,
+        extra_retrievers=extra_retrievers,
+        deadline=deadline
+    )
+    return response.results
+
+
+async def hybrid_search_detailed(
+    query_text: str,
+    collection_name: Optional[str] = None,
+    limit: int = 10,
+    vector_weight: float = 0.7,
+    graph_weight: float = 0.3,
+    rrf_k: int = 60,
+    use_graph: bool = True,
+    metadata_filter: Optional[Dict[str, Any]] = None,
+    extra_retrievers: Optional[List[Retriever]] = None,
+    deadline: Optional[float] = None
+) -> HybridSearchResponse:
+    """
+    Hybrid search that also reports which retrievers contributed.
+    
+    Args:
+        See hybrid_search()
+    
+    Returns:
+        HybridSearchResponse with fused results and per-retriever status
     """
     try:
-        # Validate weights
-        if abs((vector_weight + graph_weight) - 1.0) > 0.01:
-            logger.warning(f"Weights don't sum to 1.0: {vector_weight} + {graph_weight} = {vector_weight + graph_weight}")
-            # Normalize weights
-            total = vector_weight + graph_weight
-            vector_weight = vector_weight / total
-            graph_weight = graph_weight / total
-        
-        # Run vector and graph searches in parallel
-        search_tasks = []
+        if use_graph:
+            # Validate weights
+            if abs((vector_weight + graph_weight) - 1.0) > 0.01:
+                logger.warning(f"Weights don't sum to 1.0: {vector_weight} + {graph_weight} = {vector_weight + graph_weight}")
+                # Normalize weights
+                total = vector_weight + graph_weight
+                vector_weight = vector_weight / total
+                graph_weight = graph_weight / total
         
-        # Vector search task
-        vector_task = vector_search_by_text(
-            query_text=query_text,
-            collection_name=collection_name,
-            limit=limit * 2,  # Get more results for fusion
-            metadata_filter=metadata_filter
-        )
-        search_tasks.append(vector_task)
+        async def run_vector() -> List[HybridSearchResult]:
+            results = await vector_search_by_text(
+                query_text=query_text,
+                collection_name=collection_name,
+                limit=limit * 2,  # Get more results for fusion
+                metadata_filter=metadata_filter
+            )
+            return [_from_vector_result(r) for r in results]
         
-        # Graph search task (if enabled)
-        if use_graph:
-            graph_task = graph_search(
+        async def run_graph() -> List[HybridSearchResult]:
+            results = await graph_search(
                 query=query_text,
                 limit=limit * 2  # Get more results for fusion
             )
-            search_tasks.append(graph_task)
+            return [_from_graph_result(r) for r in results]
         
-        # Execute searches in parallel
+        retrievers = [Retriever("vector", run_vector, key=_result_key, weight=vector_weight)]
         if use_graph:
-            vector_results, graph_results = await asyncio.gather(*search_tasks)
-        else:
-            vector_results = await vector_task
-            graph_results = []
+            retrievers.append(Retriever("graph", run_graph, key=_result_key, weight=graph_weight))
+        retrievers.extend(extra_retrievers or [])
+        
+        fusion = await fuse(retrievers, limit=limit, rrf_k=rrf_k, deadline=deadline)
         
-        logger.info(f"Hybrid search: {len(vector_results)} vector + {len(graph_results)} graph results")
+        results = [
+            fused.item.model_copy(update={"combined_score": fused.score, "sources": fused.sources})
+            for fused in fusion.items
+        ]
         
-        # Apply RRF ranking
-        combined_results = _apply_rrf_ranking(
-            vector_results=vector_results,
-            graph_results=graph_results,
-            vector_weight=vector_weight,
-            graph_weight=graph_weight,
-            rrf_k=rrf_k,
-            limit=limit
+        logger.info(
+            f"Hybrid search returned {len(results)} results from "
+            f"{', '.join(fusion.contributed) or 'no sources'}"
+            + (f" (timed out: {', '.join(fusion.timed_out)})" if fusion.timed_out else "")
         )
         
-        logger.info(f"Hybrid search returned {len(combined_results)} combined results")
-        return combined_results
+        return HybridSearchResponse(
+            results=results,
+            contributed_sources=fusion.contributed,
+            timed_out_sources=fusion.timed_out,
+            failed_sources=fusion.failed
+        )
         
     except Exception as e:
         logger.error(f"Hybrid search failed: {e}")
-        return []
+        return HybridSearchResponse(failed_sources={"hybrid": str(e)})
 
 
-def _apply_rrf_ranking(
-    vector_results: List[VectorSearchResult],
-    graph_results: List[GraphSearchResult],
-    vector_weight: float,
-    graph_weight: float,
-    rrf_k: int,
-    limit: int
-) -> List[HybridSearchResult]:
-    """
-    Apply Reciprocal Rank Fusion to combine vector and graph results.
-    
-    RRF is a rank-based fusion method that is more robust than score-based
-    methods when combining results from different scoring systems.
-    
-    Args:
-        vector_results: Vector search results (already ranked)
-        graph_results: Graph search results (already ranked)
-        vector_weight: Weight for vector scores
-        graph_weight: Weight for graph scores
-        rrf_k: RRF constant (typically 60)
-        limit: Maximum results to return
-    
-    Returns:
-        Combined and re-ranked results
-    """
-    # Track results by unique identifier
-    result_scores: Dict[str, Dict[str, Any]] = {}
-    
-    # Process vector results
-    for rank, vector_result in enumerate(vector_results):
-        result_id = f"vector_{vector_result.chunk_id}"
-        
-        # Calculate RRF score for this ranking
-        rrf_score = 1.0 / (rrf_k + rank + 1)  # rank is 0-indexed, so +1
-        weighted_score = rrf_score * vector_weight
-        
-        result_scores[result_id] = {
-            "content": vector_result.content,
-            "source_type": "vector",
-            "combined_score": weighted_score,
-            "vector_score": vector_result.similarity,
-            "graph_score": None,
-            "chunk_id": vector_result.chunk_id,
-            "document_id": vector_result.document_id,
-            "fact_uuid": None,
-            "metadata": vector_result.metadata,
-            "document_title": vector_result.document_title,
-            "document_source": vector_result.document_source,
-            "collection": vector_result.collection,
-            "vector_rank": rank + 1,
-            "graph_rank": None
+def _result_key(result: HybridSearchResult) -> str:
+    """Identity used to merge the same chunk or fact across retrievers."""
+    return f"chunk:{result.chunk_id}" if result.chunk_id else f"fact:{result.fact_uuid}"
+
+
+def _from_vector_result(vector_result: VectorSearchResult) -> HybridSearchResult:
+    """Convert a vector search hit to a (not yet scored) hybrid result."""
+    return HybridSearchResult(
+        content=vector_result.content,
+        source_type="vector",
+        combined_score=0.0,
+        vector_score=vector_result.similarity,
+        chunk_id=vector_result.chunk_id,
+        document_id=vector_result.document_id,
+        metadata=vector_result.metadata,
+        document_title=vector_result.document_title,
+        document_source=vector_result.document_source,
+        collection=vector_result.collection
+    )
+
+
+def _from_graph_result(graph_result: GraphSearchResult) -> HybridSearchResult:
+    """Convert a graph fact to a (not yet scored) hybrid result."""
+    return HybridSearchResult(
+        content=graph_result.fact,
+        source_type="graph",
+        combined_score=0.0,
+        graph_score=graph_result.score,
+        fact_uuid=graph_result.uuid,
+        metadata={
+            "valid_at": graph_result.valid_at,
+            "invalid_at": graph_result.invalid_at,
+            "source_node_uuid": graph_result.source_node_uuid
         }
-    
-    # Process graph results
-    for rank, graph_result in enumerate(graph_results):
-        result_id = f"graph_{graph_result.uuid}"
-        
-        # Calculate RRF score for this ranking
-        rrf_score = 1.0 / (rrf_k + rank + 1)
-        weighted_score = rrf_score * graph_weight
-        
-        # Check if this result also appeared in vector search (unlikely but possible)
-        if result_id in result_scores:
-            # Combine scores (result appeared in both rankings)
-            result_scores[result_id]["combined_score"] += weighted_score
-            result_scores[result_id]["graph_score"] = graph_result.score
-            result_scores[result_id]["graph_rank"] = rank + 1
-        else:
-            # New result from graph only
-            result_scores[result_id] = {
-                "content": graph_result.fact,
-                "source_type": "graph",
-                "combined_score": weighted_score,
-                "vector_score": None,
-                "graph_score": graph_result.score,
-                "chunk_id": None,
-                "document_id": None,
-                "fact_uuid": graph_result.uuid,
-                "metadata": {
-                    "valid_at": graph_result.valid_at,
-                    "invalid_at": graph_result.invalid_at,
-                    "source_node_uuid": graph_result.source_node_uuid
-                },
-                "document_title": None,
-                "document_source": None,
-                "collection": None,
-                "vector_rank": None,
-                "graph_rank": rank + 1
-            }
-    
-    # Sort by combined RRF score (descending)
-    sorted_results = sorted(
-        result_scores.items(),
-        key=lambda x: x[1]["combined_score"],
-        reverse=True
     )
-    
-    # Convert to HybridSearchResult objects and limit
-    hybrid_results = []
-    for result_id, result_data in sorted_results[:limit]:
-        # Remove ranking info (internal use only)
-        result_data.pop("vector_rank", None)
-        result_data.pop("graph_rank", None)
-        
-        hybrid_results.append(HybridSearchResult(**result_data))
-    
-    return hybrid_results
 
 
 async def hybrid_search_with_reranking(
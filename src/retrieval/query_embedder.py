@@ -0,0 +1,169 @@
+"""
+Process-wide query embedding service.
+
+One warm embedding client and one shared query cache for every retrieval
+entry point (vector search, hybrid search, agent tools, API routes):
+- LRU cache keyed by normalized query text
+- Concurrent requests for the same query share one embedding call
+- Cache misses in a multi-query request are embedded as one batch
+
+Initialized in the API lifespan; other callers lazily get the same instance.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Dict, List, Any, Optional
+
+from ..ingestion.embedder import EmbeddingGenerator, EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbeddingService:
+    """
+    Shared query embedder with caching and in-flight deduplication.
+
+    Example:
+        >>> service = get_query_embedding_service()
+        >>> embedding = await service.embed("How do I deploy?")
+        >>> embeddings = await service.embed_many(["retries", "step.run"])
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[EmbeddingGenerator] = None,
+        cache_size: Optional[int] = None
+    ):
+        """
+        Initialize service.
+
+        Args:
+            embedder: Embedding generator (default: configured provider model)
+            cache_size: Maximum cached queries (default QUERY_EMBEDDING_CACHE_SIZE or 4096)
+        """
+        self.embedder = embedder or EmbeddingGenerator()
+        self.cache = EmbeddingCache(
+            max_size=cache_size or int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "4096"))
+        )
+        self._in_flight: Dict[str, "asyncio.Future[List[float]]"] = {}
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Cache key normalization (whitespace only; case can matter for code)."""
+        return " ".join(text.split())
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        Embed a single query.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Query embedding
+        """
+        key = self._normalize(text)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        pending = self._in_flight.get(key)
+        if pending is None:
+            # Owned by the service, not the first caller: cancelling one
+            # caller must not cancel others waiting on the same query
+            pending = asyncio.ensure_future(self._embed_shared(key))
+            pending.add_done_callback(_retrieve_exception)
+            self._in_flight[key] = pending
+        return await asyncio.shield(pending)
+
+    async def _embed_shared(self, key: str) -> List[float]:
+        """Embed and cache one query for every caller waiting on it."""
+        try:
+            embedding = await self.embedder.embed_query(key)
+            self.cache.put(key, embedding)
+            return embedding
+        finally:
+            self._in_flight.pop(key, None)
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several queries, batching the cache misses.
+
+        Args:
+            texts: Query texts
+
+        Returns:
+            Embeddings in input order
+        """
+        keys = [self._normalize(t) for t in texts]
+        embeddings: Dict[str, List[float]] = {}
+        misses: List[str] = []
+
+        for key in dict.fromkeys(keys):
+            cached = self.cache.get(key)
+            if cached is not None:
+                embeddings[key] = cached
+            elif key in self._in_flight:
+                embeddings[key] = await asyncio.shield(self._in_flight[key])
+            else:
+                misses.append(key)
+
+        if misses:
+            batch = await self.embedder.generate_embeddings_batch(misses)
+            for key, embedding in zip(misses, batch):
+                self.cache.put(key, embedding)
+                embeddings[key] = embedding
+
+        return [embeddings[key] for key in keys]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics."""
+        return {**self.cache.stats(), "in_flight": len(self._in_flight)}
+
+
+def _retrieve_exception(task: "asyncio.Future[List[float]]") -> None:
+    """Mark a failure retrieved so embeddings without waiters don't log it."""
+    if not task.cancelled():
+        task.exception()
+
+
+# Global service instance
+_query_embedding_service: Optional[QueryEmbeddingService] = None
+
+
+def get_query_embedding_service() -> QueryEmbeddingService:
+    """Get or create global query embedding service."""
+    global _query_embedding_service
+    if _query_embedding_service is None:
+        _query_embedding_service = QueryEmbeddingService()
+    return _query_embedding_service
+
+
+async def initialize_query_embedding_service(warmup: bool = True) -> QueryEmbeddingService:
+    """
+    Initialize global query embedding service.
+
+    Args:
+        warmup: Embed a short query so the first real request doesn't pay
+            connection setup
+
+    Returns:
+        The global service
+    """
+    service = get_query_embedding_service()
+    if warmup:
+        try:
+            await service.embed("warmup")
+        except Exception as e:
+            logger.warning(f"Query embedding warmup failed: {e}")
+    return service
+
+
+async def close_query_embedding_service() -> None:
+    """Close global query embedding service."""
+    global _query_embedding_service
+    if _query_embedding_service:
+        logger.info(f"Query embedding cache stats: {_query_embedding_service.get_stats()}")
+        _query_embedding_service = None
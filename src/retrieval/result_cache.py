@@ -0,0 +1,193 @@
+"""
+Versioned search-result cache with request coalescing.
+
+Caches search results keyed by normalized query, filters, collection and
+limit. Each entry is tagged with the collection's write version (see
+``storage.write_versions``); a write bumps the version and stale entries are
+dropped on their next lookup. Concurrent identical requests share a single
+in-flight computation (singleflight).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from ..storage.write_versions import get_collection_version
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SearchResultCache:
+    """
+    Bounded LRU cache of search results with write-through invalidation.
+
+    Example:
+        >>> cache = get_search_result_cache()
+        >>> results = await cache.get_or_compute(
+        ...     query="retry policy", collection="agent_kit", limit=5, filters=None,
+        ...     compute=lambda: run_search("retry policy"),
+        ... )
+    """
+
+    def __init__(self, max_size: int = 2048, ttl_seconds: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum cached result sets
+            ttl_seconds: Optional age limit, for sources without write versions
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple, Tuple[Tuple[int, int], float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Tuple, "asyncio.Future[Any]"] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidated = 0
+
+    @staticmethod
+    def make_key(
+        query: str,
+        collection: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+        **extra: Any
+    ) -> Tuple:
+        """Build a cache key from normalized request parameters."""
+        normalized_query = " ".join(query.split())
+        filters_key = json.dumps(filters, sort_keys=True, default=str) if filters else ""
+        extra_key = json.dumps(extra, sort_keys=True, default=str) if extra else ""
+        return (normalized_query, collection or "*", limit, filters_key, extra_key)
+
+    def _lookup(self, key: Tuple, version: Tuple[int, int]) -> Tuple[bool, Any]:
+        """Return (found, value) for a fresh entry, dropping stale ones."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        entry_version, stored_at, value = entry
+        expired = self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds
+        if entry_version != version or expired:
+            del self._entries[key]
+            self.invalidated += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key: Tuple, version: Tuple[int, int], value: Any) -> None:
+        """Insert an entry, evicting least recently used ones."""
+        self._entries[key] = (version, time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(
+        self,
+        query: str,
+        collection: Optional[str],
+        limit: int,
+        compute: Callable[[], Awaitable[T]],
+        filters: Optional[Dict[str, Any]] = None,
+        should_cache: Optional[Callable[[T], bool]] = None,
+        **extra: Any
+    ) -> T:
+        """
+        Return cached results or compute them once for all concurrent callers.
+
+        Args:
+            query: Query text
+            collection: Collection name (None = all collections)
+            limit: Result limit
+            compute: Coroutine factory producing the results on a miss
+            filters: Metadata filters
+            should_cache: Predicate deciding whether a result may be stored
+                (e.g. reject partial fan-out results); it is still shared
+                with concurrent callers
+            **extra: Other parameters that change the results (e.g. min_similarity)
+
+        Returns:
+            Search results (shared between callers; do not mutate)
+        """
+        key = self.make_key(query, collection, limit, filters, **extra)
+        # Version captured before computing: a write during the computation
+        # leaves the entry tagged with the old version, so it is never served stale
+        version = get_collection_version(collection)
+
+        found, value = self._lookup(key, version)
+        if found:
+            self.hits += 1
+            return value
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            # The computation is owned by the cache, not by the first caller:
+            # cancelling any one caller (e.g. a fusion deadline) must not
+            # cancel the identical searches waiting on it
+            pending = asyncio.ensure_future(self._compute(key, version, compute, should_cache))
+            pending.add_done_callback(_retrieve_exception)
+            self._in_flight[key] = pending
+        return await asyncio.shield(pending)
+
+    async def _compute(
+        self,
+        key: Tuple,
+        version: Tuple[int, int],
+        compute: Callable[[], Awaitable[T]],
+        should_cache: Optional[Callable[[T], bool]]
+    ) -> T:
+        """Compute and cache results for all callers waiting on ``key``."""
+        try:
+            value = await compute()
+            if should_cache is None or should_cache(value):
+                self._store(key, version, value)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidated": self.invalidated,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def _retrieve_exception(task: "asyncio.Future[Any]") -> None:
+    """Mark a failure retrieved so computations without waiters don't log it."""
+    if not task.cancelled():
+        task.exception()
+
+
+# Global cache instance
+_search_result_cache: Optional[SearchResultCache] = None
+
+
+def get_search_result_cache() -> SearchResultCache:
+    """Get or create global search result cache."""
+    global _search_result_cache
+    if _search_result_cache is None:
+        _search_result_cache = SearchResultCache(
+            max_size=int(os.getenv("SEARCH_RESULT_CACHE_SIZE", "2048"))
+        )
+    return _search_result_cache
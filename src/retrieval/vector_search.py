@@ -6,14 +6,17 @@ Key changes:
 - PostgreSQL pgvector → Chroma client
 - Distance to similarity conversion (Chroma returns distances, lower = better)
 - Metadata filtering support
+- Concurrent cross-collection fan-out with bounded top-k merge
 """
 
+import heapq
 import logging
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
 from ..storage.chroma_client import get_chroma_client
 from ..storage.collection_manager import get_collection_manager
+from ..storage.fanout import fan_out
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,20 @@ class VectorSearchResult(BaseModel):
     collection: Optional[str] = Field(None, description="Collection name")
 
 
+class VectorSearchResponse(BaseModel):
+    """Merged results of a (possibly cross-collection) vector search."""
+    
+    results: List[VectorSearchResult] = Field(default_factory=list, description="Top results, best first")
+    searched_collections: List[str] = Field(default_factory=list, description="Collections that answered")
+    failed_collections: Dict[str, str] = Field(default_factory=dict, description="Collection -> error")
+    timed_out_collections: List[str] = Field(default_factory=list, description="Collections that exceeded the timeout")
+    
+    @property
+    def partial(self) -> bool:
+        """True if some collections did not contribute results."""
+        return bool(self.failed_collections or self.timed_out_collections)
+
+
 async def vector_search(
     query_embedding: List[float],
     collection_name: Optional[str] = None,
@@ -55,9 +72,8 @@ async def vector_search(
         List of matching chunks ordered by similarity (best first)
     
     Example:
-        >>> from src.ingestion.embedder import create_embedder
-        >>> embedder = create_embedder()
-        >>> embedding = await embedder.generate_embedding("What is Python?")
+        >>> from src.retrieval.query_embedder import get_query_embedding_service
+        >>> embedding = await get_query_embedding_service().embed("What is Python?")
         >>> results = await vector_search(
         ...     query_embedding=embedding,
         ...     collection_name="python_docs",
@@ -67,102 +83,205 @@ async def vector_search(
         >>> for result in results:
         ...     print(f"{result.similarity:.2f}: {result.content[:100]}")
     """
+    responses = await vector_search_batch_detailed(
+        query_embeddings=[query_embedding],
+        collection_name=collection_name,
+        limit=limit,
+        metadata_filter=metadata_filter,
+        min_similarity=min_similarity
+    )
+    return responses[0].results
+
+
+async def vector_search_detailed(
+    query_embedding: List[float],
+    collection_name: Optional[str] = None,
+    limit: int = 10,
+    metadata_filter: Optional[Dict[str, Any]] = None,
+    min_similarity: float = 0.0,
+    timeout: Optional[float] = None
+) -> VectorSearchResponse:
+    """
+    Vector search that also reports collections that failed or timed out.
+    
+    Args:
+        query_embedding: Query embedding vector
+        collection_name: Specific collection to search (None = search all via manager)
+        limit: Maximum number of results to return
+        metadata_filter: Optional metadata filtering
+        min_similarity: Minimum similarity threshold (0-1)
+        timeout: Per-collection timeout in seconds
+    
+    Returns:
+        VectorSearchResponse with merged results and per-collection status
+    """
+    responses = await vector_search_batch_detailed(
+        query_embeddings=[query_embedding],
+        collection_name=collection_name,
+        limit=limit,
+        metadata_filter=metadata_filter,
+        min_similarity=min_similarity,
+        timeout=timeout
+    )
+    return responses[0]
+
+
+async def vector_search_batch(
+    query_embeddings: List[List[float]],
+    collection_name: Optional[str] = None,
+    limit: int = 10,
+    metadata_filter: Optional[Dict[str, Any]] = None,
+    min_similarity: float = 0.0
+) -> List[List[VectorSearchResult]]:
+    """
+    Perform several vector searches with one query per collection.
+    
+    Args:
+        query_embeddings: Query embedding vectors
+        collection_name: Specific collection to search (None = search all via manager)
+        limit: Maximum number of results per query
+        metadata_filter: Optional metadata filtering shared by all queries
+        min_similarity: Minimum similarity threshold (0-1)
+    
+    Returns:
+        One result list per query embedding, in input order
+    """
+    responses = await vector_search_batch_detailed(
+        query_embeddings=query_embeddings,
+        collection_name=collection_name,
+        limit=limit,
+        metadata_filter=metadata_filter,
+        min_similarity=min_similarity
+    )
+    return [response.results for response in responses]
+
+
+async def vector_search_batch_detailed(
+    query_embeddings: List[List[float]],
+    collection_name: Optional[str] = None,
+    limit: int = 10,
+    metadata_filter: Optional[Dict[str, Any]] = None,
+    min_similarity: float = 0.0,
+    timeout: Optional[float] = None
+) -> List[VectorSearchResponse]:
+    """
+    Core search: concurrent per-collection queries merged with a top-k heap.
+    
+    Every collection is queried once with all embeddings, in parallel, each
+    bounded by ``timeout``. Per query, results are merged with
+    ``heapq.nlargest`` instead of concatenating and sorting everything.
+    
+    Args:
+        query_embeddings: Query embedding vectors
+        collection_name: Specific collection to search (None = search all via manager)
+        limit: Maximum number of results per query
+        metadata_filter: Optional metadata filtering shared by all queries
+        min_similarity: Minimum similarity threshold (0-1)
+        timeout: Per-collection timeout in seconds
+    
+    Returns:
+        One VectorSearchResponse per query embedding, in input order
+    """
+    if not query_embeddings:
+        return []
+    
     try:
         chroma_client = get_chroma_client()
         
-        # If no collection specified, use collection manager for cross-collection search
         if collection_name is None:
             collection_manager = get_collection_manager()
-            
-            # Search across all collections
-            all_results = []
-            collections = await collection_manager.list_collections()
-            for coll_info in collections:
-                coll_name = coll_info["name"]
-                try:
-                    coll_results = await _search_collection(
-                        chroma_client=chroma_client,
-                        collection_name=coll_name,
-                        query_embedding=query_embedding,
-                        limit=limit,
-                        metadata_filter=metadata_filter
-                    )
-                    all_results.extend(coll_results)
-                except Exception as e:
-                    logger.warning(f"Failed to search collection {coll_name}: {e}")
-                    continue
-            
-            # Sort by similarity and take top results
-            all_results.sort(key=lambda x: x.similarity, reverse=True)
-            results = all_results[:limit]
+            collection_names = [c["name"] for c in await collection_manager.list_collections()]
         else:
-            # Search single collection
-            results = await _search_collection(
-                chroma_client=chroma_client,
-                collection_name=collection_name,
-                query_embedding=query_embedding,
-                limit=limit,
-                metadata_filter=metadata_filter
-            )
+            collection_names = [collection_name]
+        
+        outcome = await fan_out(
+            {
+                name: (
+                    lambda name=name: _query_collection(
+                        chroma_client, name, query_embeddings, limit, metadata_filter
+                    )
+                )
+                for name in collection_names
+            },
+            timeout=timeout
+        )
         
-        # Filter by minimum similarity
-        if min_similarity > 0.0:
-            results = [r for r in results if r.similarity >= min_similarity]
+        responses = []
+        for q in range(len(query_embeddings)):
+            candidates = (
+                result
+                for per_collection in outcome.results.values()
+                for result in per_collection[q]
+                if result.similarity >= min_similarity
+            )
+            responses.append(
+                VectorSearchResponse(
+                    results=heapq.nlargest(limit, candidates, key=lambda r: r.similarity),
+                    searched_collections=list(outcome.results),
+                    failed_collections=outcome.failed,
+                    timed_out_collections=outcome.timed_out
+                )
+            )
         
-        logger.info(f"Vector search returned {len(results)} results (collection: {collection_name or 'all'})")
-        return results
+        logger.info(
+            f"Vector search ran {len(query_embeddings)} queries over {len(collection_names)} "
+            f"collections (collection: {collection_name or 'all'}, "
+            f"failed: {len(outcome.failed)}, timed out: {len(outcome.timed_out)})"
+        )
+        return responses
         
     except Exception as e:
         logger.error(f"Vector search failed: {e}")
-        return []
+        return [VectorSearchResponse() for _ in query_embeddings]
 
 
-async def _search_collection(
+def _query_collection(
     chroma_client,
     collection_name: str,
-    query_embedding: List[float],
+    query_embeddings: List[List[float]],
     limit: int,
     metadata_filter: Optional[Dict[str, Any]] = None
-) -> List[VectorSearchResult]:
+) -> List[List[VectorSearchResult]]:
     """
-    Search a single Chroma collection.
+    Search a single Chroma collection with several query vectors at once.
     
-    Internal helper function that performs the actual Chroma query.
+    Internal blocking helper run in the fan-out thread pool; errors propagate
+    so the caller can report the collection as failed.
     
     Args:
         chroma_client: Chroma client instance
         collection_name: Collection to search
-        query_embedding: Query embedding vector
-        limit: Maximum results
+        query_embeddings: Query embedding vectors
+        limit: Maximum results per query
         metadata_filter: Optional metadata filter
     
     Returns:
-        List of search results
+        One result list per query embedding, in input order
     """
-    try:
-        # Get collection
-        collection = chroma_client.get_collection(collection_name)
-        
-        # Perform Chroma query
-        # NOTE: Chroma returns DISTANCES (lower = better), we need SIMILARITY (higher = better)
-        query_results = collection.query(
-            query_embeddings=[query_embedding],
-            n_results=limit,
-            where=metadata_filter,  # Chroma metadata filtering
-            include=["documents", "metadatas", "distances"]
-        )
-        
-        # Convert Chroma results to VectorSearchResult objects
+    # Get collection
+    collection = chroma_client.get_collection(collection_name)
+    
+    # Perform Chroma query
+    # NOTE: Chroma returns DISTANCES (lower = better), we need SIMILARITY (higher = better)
+    query_results = collection.query(
+        query_embeddings=query_embeddings,
+        n_results=limit,
+        where=metadata_filter,  # Chroma metadata filtering
+        include=["documents", "metadatas", "distances"]
+    )
+    
+    # Convert Chroma results to VectorSearchResult objects
+    batch_results = []
+    
+    for q in range(len(query_embeddings)):
         results = []
+        ids = query_results["ids"][q] if query_results["ids"] else []
         
-        if not query_results["ids"] or not query_results["ids"][0]:
-            return results
-        
-        for i in range(len(query_results["ids"][0])):
-            chunk_id = query_results["ids"][0][i]
-            distance = query_results["distances"][0][i]
-            content = query_results["documents"][0][i]
-            metadata = query_results["metadatas"][0][i] or {}
+        for i in range(len(ids)):
+            chunk_id = ids[i]
+            distance = query_results["distances"][q][i]
+            content = query_results["documents"][q][i]
+            metadata = query_results["metadatas"][q][i] or {}
             
             # Convert distance to similarity
             # Chroma uses L2 distance, convert to cosine similarity approximation
@@ -183,11 +302,9 @@ async def _search_collection(
                 )
             )
         
-        return results
-        
-    except Exception as e:
-        logger.error(f"Collection search failed for {collection_name}: {e}")
-        return []
+        batch_results.append(results)
+    
+    return batch_results
 
 
 async def vector_search_by_text(
@@ -220,22 +337,71 @@ async def vector_search_by_text(
         ...     limit=3
         ... )
     """
-    from ..ingestion.embedder import create_embedder
+    from .query_embedder import get_query_embedding_service
+    from .result_cache import get_search_result_cache
     
-    try:
-        # Generate embedding for query text
-        embedder = create_embedder()
-        embedding = await embedder.generate_embedding(query_text)
-        
-        # Perform vector search
-        return await vector_search(
+    async def compute() -> VectorSearchResponse:
+        # Generate embedding for query text (shared warm client + cache)
+        embedding = await get_query_embedding_service().embed(query_text)
+        return await vector_search_detailed(
             query_embedding=embedding,
             collection_name=collection_name,
             limit=limit,
             metadata_filter=metadata_filter,
             min_similarity=min_similarity
         )
+    
+    try:
+        # Cached per collection write version; identical concurrent queries share one search
+        response = await get_search_result_cache().get_or_compute(
+            query=query_text,
+            collection=collection_name,
+            limit=limit,
+            filters=metadata_filter,
+            compute=compute,
+            should_cache=lambda r: not r.partial,
+            min_similarity=min_similarity
+        )
+        return list(response.results)
         
     except Exception as e:
         logger.error(f"Vector search by text failed: {e}")
         return []
+
+
+async def vector_search_batch_by_text(
+    query_texts: List[str],
+    collection_name: Optional[str] = None,
+    limit: int = 10,
+    metadata_filter: Optional[Dict[str, Any]] = None,
+    min_similarity: float = 0.0
+) -> List[List[VectorSearchResult]]:
+    """
+    Perform several text searches, batching the embedding and search calls.
+    
+    Args:
+        query_texts: Text queries to search for
+        collection_name: Optional collection to search
+        limit: Maximum results per query
+        metadata_filter: Optional metadata filter
+        min_similarity: Minimum similarity threshold
+    
+    Returns:
+        One result list per query text, in input order
+    """
+    from .query_embedder import get_query_embedding_service
+    
+    try:
+        embeddings = await get_query_embedding_service().embed_many(query_texts)
+        
+        return await vector_search_batch(
+            query_embeddings=embeddings,
+            collection_name=collection_name,
+            limit=limit,
+            metadata_filter=metadata_filter,
+            min_similarity=min_similarity
+        )
+        
+    except Exception as e:
+        logger.error(f"Batch vector search by text failed: {e}")
+        return [[] for _ in query_texts]
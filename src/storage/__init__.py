@@ -1,11 +1,41 @@
-"""Storage module - Qdrant vector database."""
+"""Storage module - Qdrant vector database and embedded local index.
+
+Exports are resolved on first attribute access, so importing one storage
+module (e.g. ``src.storage.qdrant_store``) does not import numpy, the
+reindexer and every other backend with it.
+"""
+
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "QdrantStore": ".qdrant_store",
+    "QdrantStoreConfig": ".qdrant_store",
+    "SparseEncoder": ".sparse_encoder",
+    "LocalVectorIndex": ".local_index",
+    "LocalIndexConfig": ".local_index",
+    "CollectionReindexer": ".reindex",
+    "ReindexReport": ".reindex",
+    "ValidationReport": ".reindex",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-from .qdrant_store import (
-    QdrantStore,
-    QdrantStoreConfig,
-)
 
 __all__ = [
     "QdrantStore",
     "QdrantStoreConfig",
+    "SparseEncoder",
+    "LocalVectorIndex",
+    "LocalIndexConfig",
+    "CollectionReindexer",
+    "ReindexReport",
+    "ValidationReport",
 ]
@@ -7,8 +7,9 @@ Manages multiple collections for different knowledge categories:
 - Domain knowledge (algorithms, system design, etc.)
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
 from datetime import datetime
 
 import chromadb
@@ -22,6 +23,9 @@ from src.models.collection import (
     get_collection_config,
 )
 from src.storage.chroma_client import ChromaConfig, SearchResult
+from src.storage.fanout import FanOutResult, fan_out, get_fanout_executor
+from src.storage.write_versions import bump_collection_version
+from src.storage.context_window import ChunkWindow, merge_windows, assign_chunks
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +36,7 @@ class MultiCollectionManager:
     
     Provides:
     - Auto-routing to appropriate collection based on content type
-    - Cross-collection search
+    - Cross-collection search (concurrent, with per-collection timeouts)
     - Collection lifecycle management
     - Statistics and monitoring
     """
@@ -252,6 +256,7 @@ class MultiCollectionManager:
                 documents=batch_documents,
             )
         
+        bump_collection_version(collection_name)
         logger.info(f"Added {len(ids)} embeddings to collection '{collection_name}'")
     
     async def search_collection(
@@ -273,36 +278,232 @@ class MultiCollectionManager:
         Returns:
             List of search results
         """
+        results = await self.search_collection_batch(
+            collection_name=collection_name,
+            query_embeddings=[query_embedding],
+            n_results=n_results,
+            where=where,
+        )
+        return results[0]
+    
+    async def search_collection_batch(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[List[SearchResult]]:
+        """
+        Run several searches against one collection in a single query.
+        
+        Args:
+            collection_name: Collection to search
+            query_embeddings: Query vectors
+            n_results: Number of results per query
+            where: Metadata filters (shared by all queries)
+            
+        Returns:
+            One result list per query embedding, in input order
+        """
         if not self._initialized:
             await self.initialize()
         
+        return self._query_collection(collection_name, query_embeddings, n_results, where)
+    
+    def _query_collection(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[List[SearchResult]]:
+        """Blocking Chroma query returning one result list per embedding."""
         collection = self._collections.get(collection_name)
         if not collection:
             raise ValueError(f"Collection not found: {collection_name}")
         
+        if not query_embeddings:
+            return []
+        
         results = collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=n_results,
             where=where,
         )
         
         # Convert to SearchResult objects
-        search_results = []
-        for i in range(len(results['ids'][0])):
-            metadata = results['metadatas'][0][i]
-            search_results.append(
-                SearchResult(
-                    id=results['ids'][0][i],
-                    document_id=metadata.get('document_id', ''),
-                    content=results['documents'][0][i],
-                    score=1.0 - results['distances'][0][i],  # Convert distance to similarity
-                    metadata=metadata,
-                    document_title=metadata.get('document_title', ''),
-                    document_source=metadata.get('source', ''),
+        batch_results = []
+        for q in range(len(query_embeddings)):
+            search_results = []
+            for i in range(len(results['ids'][q])):
+                metadata = results['metadatas'][q][i]
+                search_results.append(
+                    SearchResult(
+                        id=results['ids'][q][i],
+                        document_id=metadata.get('document_id', ''),
+                        content=results['documents'][q][i],
+                        score=1.0 - results['distances'][q][i],  # Convert distance to similarity
+                        metadata=metadata,
+                        document_title=metadata.get('document_title', ''),
+                        document_source=metadata.get('source', ''),
+                    )
                 )
+            batch_results.append(search_results)
+        
+        return batch_results
+    
+    async def get_neighbor_chunks(
+        self,
+        collection_name: str,
+        chunk_ids: List[str],
+        window: int = 1,
+    ) -> List[ChunkWindow]:
+        """
+        Fetch the chunks around hit chunks instead of whole documents.
+        
+        Args:
+            collection_name: Collection holding the chunks
+            chunk_ids: Hit chunk IDs
+            window: Neighbors to include on each side (chunk_index ± window)
+            
+        Returns:
+            Merged windows with their chunks ordered by chunk_index
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        collection = self._collections.get(collection_name)
+        if not collection:
+            raise ValueError(f"Collection not found: {collection_name}")
+        
+        if not chunk_ids:
+            return []
+        
+        hits = collection.get(ids=chunk_ids, include=["metadatas"])
+        windows = merge_windows(
+            (
+                (metadata["document_id"], int(metadata["chunk_index"]), chunk_id)
+                for chunk_id, metadata in zip(hits["ids"], hits["metadatas"])
+                if metadata and "document_id" in metadata and "chunk_index" in metadata
+            ),
+            window
+        )
+        if not windows:
+            return []
+        
+        # One range-filtered get for all windows
+        clauses = [
+            {"$and": [
+                {"document_id": w.document_id},
+                {"chunk_index": {"$gte": w.start}},
+                {"chunk_index": {"$lte": w.end}},
+            ]}
+            for w in windows
+        ]
+        where = clauses[0] if len(clauses) == 1 else {"$or": clauses}
+        
+        neighbors = collection.get(where=where, include=["documents", "metadatas"])
+        chunks = [
+            {
+                "id": chunk_id,
+                "document_id": metadata.get("document_id"),
+                "chunk_index": metadata.get("chunk_index"),
+                "content": document,
+                "metadata": metadata,
+            }
+            for chunk_id, document, metadata in zip(
+                neighbors["ids"], neighbors["documents"], neighbors["metadatas"]
             )
+        ]
         
-        return search_results
+        return assign_chunks(windows, chunks)
+    
+    async def iter_collection(
+        self,
+        collection_name: str,
+        where: Optional[Dict[str, Any]] = None,
+        batch_size: int = 256,
+        include_embeddings: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream every chunk of a collection page by page.
+        
+        Only one page is held in memory at a time; page reads run on the
+        fan-out executor so the event loop is not blocked.
+        
+        Args:
+            collection_name: Collection to export
+            where: Metadata filters
+            batch_size: Chunks fetched per page
+            include_embeddings: Include stored vectors
+            
+        Yields:
+            Dicts with id, collection, document_id, chunk_index, content,
+            metadata (and vector when requested)
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        collection = self._collections.get(collection_name)
+        if not collection:
+            raise ValueError(f"Collection not found: {collection_name}")
+        
+        include = ["documents", "metadatas"] + (["embeddings"] if include_embeddings else [])
+        loop = asyncio.get_running_loop()
+        offset = 0
+        while True:
+            page = await loop.run_in_executor(
+                get_fanout_executor(),
+                lambda offset=offset: collection.get(
+                    where=where, limit=batch_size, offset=offset, include=include
+                ),
+            )
+            ids = page["ids"]
+            for i, chunk_id in enumerate(ids):
+                metadata = page["metadatas"][i] or {}
+                item = {
+                    "id": chunk_id,
+                    "collection": collection_name,
+                    "document_id": metadata.get("document_id"),
+                    "chunk_index": metadata.get("chunk_index"),
+                    "content": page["documents"][i],
+                    "metadata": metadata,
+                }
+                if include_embeddings:
+                    item["vector"] = [float(x) for x in page["embeddings"][i]]
+                yield item
+            if len(ids) < batch_size:
+                break
+            offset += len(ids)
+    
+    async def iter_document(
+        self,
+        document_id: str,
+        batch_size: int = 256,
+        include_embeddings: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream every chunk of one document across all collections.
+        
+        Args:
+            document_id: Document identifier
+            batch_size: Chunks fetched per page
+            include_embeddings: Include stored vectors
+            
+        Yields:
+            Chunk dicts as produced by iter_collection()
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        for name in list(self._collections):
+            async for item in self.iter_collection(
+                name,
+                where={"document_id": document_id},
+                batch_size=batch_size,
+                include_embeddings=include_embeddings,
+            ):
+                yield item
     
     async def search_all_collections(
         self,
@@ -319,31 +520,64 @@ class MultiCollectionManager:
             categories: Filter by categories (None = search all)
             
         Returns:
-            Dict mapping collection names to search results
+            Dict mapping collection names to search results (collections that
+            failed or timed out are omitted; use search_all_collections_batch
+            to see them)
+        """
+        fan_out_result = await self.search_all_collections_batch(
+            query_embeddings=[query_embedding],
+            n_results_per_collection=n_results_per_collection,
+            categories=categories,
+        )
+        return {
+            name: per_query[0]
+            for name, per_query in fan_out_result.results.items()
+        }
+    
+    async def search_all_collections_batch(
+        self,
+        query_embeddings: List[List[float]],
+        n_results_per_collection: int = 5,
+        categories: Optional[List[CollectionCategory]] = None,
+        timeout: Optional[float] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> FanOutResult[List[List[SearchResult]]]:
+        """
+        Search several queries across multiple collections concurrently.
+        
+        Each collection is queried once with all embeddings, so N queries over
+        M collections cost M round trips instead of N * M. Collections run in
+        parallel with a per-collection timeout.
+        
+        Args:
+            query_embeddings: Query vectors
+            n_results_per_collection: Results per collection and query
+            categories: Filter by categories (None = search all)
+            timeout: Per-collection timeout in seconds
+            where: Metadata filters (shared by all queries)
+            
+        Returns:
+            FanOutResult mapping collection names to one result list per query
+            embedding (in input order), plus failed and timed-out collections
         """
         if not self._initialized:
             await self.initialize()
         
-        results = {}
-        
-        for name, collection in self._collections.items():
+        calls = {}
+        for name in self._collections:
             # Filter by category if specified
             if categories:
                 metadata = self._metadata.get(name)
                 if metadata and metadata.category not in categories:
                     continue
             
-            try:
-                collection_results = await self.search_collection(
-                    collection_name=name,
-                    query_embedding=query_embedding,
-                    n_results=n_results_per_collection,
+            calls[name] = (
+                lambda name=name: self._query_collection(
+                    name, query_embeddings, n_results_per_collection, where
                 )
-                results[name] = collection_results
-            except Exception as e:
-                logger.warning(f"Error searching collection {name}: {e}")
+            )
         
-        return results
+        return await fan_out(calls, timeout=timeout)
     
     async def list_collections(self) -> List[Dict[str, Any]]:
         """
@@ -387,6 +621,7 @@ class MultiCollectionManager:
             self._client.delete_collection(collection_name)
             self._collections.pop(collection_name, None)
             self._metadata.pop(collection_name, None)
+            bump_collection_version(collection_name)
             logger.info(f"Deleted collection: {collection_name}")
             return True
         except Exception as e:
@@ -0,0 +1,95 @@
+"""
+Neighbor-window context assembly.
+
+Given hit chunks, expand each to ``chunk_index ± window`` within its
+document and merge overlapping or adjacent ranges, so the surrounding
+context of several hits is fetched with one range-filtered query instead of
+loading whole documents.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterable, Tuple
+
+
+@dataclass
+class ChunkWindow:
+    """A contiguous chunk range of one document."""
+    document_id: str
+    start: int  # First chunk_index (inclusive)
+    end: int  # Last chunk_index (inclusive)
+    hit_ids: List[str] = field(default_factory=list)
+    chunks: List[Dict[str, Any]] = field(default_factory=list)  # Ordered by chunk_index
+
+    @property
+    def content(self) -> str:
+        return "\n\n".join(chunk.get("content", "") for chunk in self.chunks)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "document_id": self.document_id,
+            "start": self.start,
+            "end": self.end,
+            "hit_ids": self.hit_ids,
+            "chunk_count": len(self.chunks),
+            "content": self.content,
+            "chunks": self.chunks,
+        }
+
+
+def merge_windows(hits: Iterable[Tuple[str, int, str]], window: int) -> List[ChunkWindow]:
+    """
+    Expand hits into windows and merge overlapping ones per document.
+
+    Args:
+        hits: (document_id, chunk_index, chunk_id) per hit chunk
+        window: Neighbors to include on each side
+
+    Returns:
+        Merged windows, ordered by document then start
+    """
+    by_document: Dict[str, List[Tuple[int, int, str]]] = {}
+    for document_id, chunk_index, chunk_id in hits:
+        by_document.setdefault(document_id, []).append(
+            (max(0, chunk_index - window), chunk_index + window, chunk_id)
+        )
+
+    merged: List[ChunkWindow] = []
+    for document_id in sorted(by_document):
+        current = None
+        for start, end, chunk_id in sorted(by_document[document_id]):
+            if current is not None and start <= current.end + 1:
+                current.end = max(current.end, end)
+                current.hit_ids.append(chunk_id)
+            else:
+                current = ChunkWindow(document_id=document_id, start=start, end=end, hit_ids=[chunk_id])
+                merged.append(current)
+    return merged
+
+
+def assign_chunks(windows: List[ChunkWindow], chunks: Iterable[Dict[str, Any]]) -> List[ChunkWindow]:
+    """
+    Place fetched chunks into their windows, ordered by chunk_index.
+
+    Args:
+        windows: Output of merge_windows()
+        chunks: Chunk dicts with ``document_id`` and ``chunk_index`` keys
+
+    Returns:
+        The same windows, filled
+    """
+    by_document: Dict[str, List[ChunkWindow]] = {}
+    for window in windows:
+        by_document.setdefault(window.document_id, []).append(window)
+
+    for chunk in chunks:
+        index = chunk.get("chunk_index")
+        if index is None:
+            continue
+        for window in by_document.get(chunk.get("document_id"), []):
+            if window.start <= index <= window.end:
+                window.chunks.append(chunk)
+                break
+
+    for window in windows:
+        window.chunks.sort(key=lambda chunk: chunk["chunk_index"])
+    return windows
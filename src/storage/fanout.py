@@ -0,0 +1,99 @@
+"""
+Concurrent per-collection fan-out for blocking vector store clients.
+
+Runs one blocking call per collection in a shared thread pool, bounds each
+call with a timeout and reports slow or failing collections instead of
+dropping them silently.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_TIMEOUT = float(os.getenv("COLLECTION_SEARCH_TIMEOUT", "5.0"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_fanout_executor() -> ThreadPoolExecutor:
+    """Get or create the shared fan-out thread pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("COLLECTION_SEARCH_WORKERS", "8")),
+            thread_name_prefix="collection-search"
+        )
+    return _executor
+
+
+def close_fanout_executor() -> None:
+    """Shut down the shared fan-out thread pool."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+@dataclass
+class FanOutResult(Generic[T]):
+    """Per-collection outcomes of a fan-out."""
+    results: Dict[str, T] = field(default_factory=dict)
+    failed: Dict[str, str] = field(default_factory=dict)  # collection -> error
+    timed_out: List[str] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        """True if any collection did not contribute results."""
+        return bool(self.failed or self.timed_out)
+
+
+async def fan_out(
+    calls: Dict[str, Callable[[], T]],
+    timeout: Optional[float] = None
+) -> FanOutResult[T]:
+    """
+    Run blocking per-collection calls concurrently.
+
+    Args:
+        calls: Collection name -> zero-argument blocking callable
+        timeout: Per-collection timeout in seconds (default COLLECTION_SEARCH_TIMEOUT)
+
+    Returns:
+        FanOutResult with results, failures and timeouts by collection
+
+    Note:
+        A timed-out call keeps its worker thread until the client returns;
+        its result is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_fanout_executor()
+    timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+
+    names = list(calls)
+    outcomes = await asyncio.gather(
+        *(
+            asyncio.wait_for(loop.run_in_executor(executor, calls[name]), timeout)
+            for name in names
+        ),
+        return_exceptions=True
+    )
+
+    result: FanOutResult[T] = FanOutResult()
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            result.timed_out.append(name)
+            logger.warning(f"Search in collection {name} timed out after {timeout}s")
+        elif isinstance(outcome, BaseException):
+            result.failed[name] = str(outcome) or type(outcome).__name__
+            logger.warning(f"Search in collection {name} failed: {outcome}")
+        else:
+            result.results[name] = outcome
+
+    return result
@@ -0,0 +1,148 @@
+"""
+Filter-usage statistics for payload index advice.
+
+``QdrantStore._build_filter`` records which payload fields each search
+filters on. Counts are kept in memory and periodically written, on a
+background thread, to a JSON file owned by this process (next to the
+configured usage file) so the index advisor (a separate CLI process) can
+read them:
+- Each process only ever rewrites its own file (temp file + ``os.replace``),
+  so concurrent API workers and CLI runs never lose each other's counts
+- ``load`` sums the configured file and every per-process file
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FilterUsageTracker:
+    """
+    Per-collection counts of filtered payload fields.
+
+    Example:
+        >>> tracker = get_filter_usage_tracker()
+        >>> tracker.record("agent_kit", ["file_type", "language"])
+        >>> tracker.load()["agent_kit"]["file_type"]
+    """
+
+    def __init__(self, path: Optional[str] = "configs/qdrant_filter_usage.json", flush_every: int = 100):
+        """
+        Initialize tracker.
+
+        Args:
+            path: Usage file; this process writes ``<stem>.<pid>-<id><suffix>``
+                beside it (None = memory only)
+            flush_every: Recorded searches between automatic background flushes
+        """
+        self.path = Path(path) if path else None
+        self.process_path = (
+            self.path.with_name(f"{self.path.stem}.{os.getpid()}-{uuid.uuid4().hex[:8]}{self.path.suffix}")
+            if self.path else None
+        )
+        self.flush_every = flush_every
+        self._pending: Dict[str, Counter] = {}
+        self._flushed: Dict[str, Counter] = {}
+        self._since_flush = 0
+        self._flush_scheduled = False
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def record(self, collection: str, fields: Iterable[str]) -> None:
+        """Count one filtered search on the given fields (never blocks on I/O)."""
+        with self._lock:
+            self._pending.setdefault(collection, Counter()).update(set(fields))
+            self._since_flush += 1
+            should_flush = (
+                self.path is not None
+                and self._since_flush >= self.flush_every
+                and not self._flush_scheduled
+            )
+            if should_flush:
+                self._flush_scheduled = True
+        if should_flush:
+            threading.Thread(target=self.flush, name="filter-usage-flush", daemon=True).start()
+
+    def _usage_files(self) -> List[Path]:
+        """The configured file plus every process's file."""
+        if not self.path:
+            return []
+        files = [self.path] if self.path.exists() else []
+        return files + sorted(self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}"))
+
+    def _read_files(self) -> Dict[str, Counter]:
+        """Counts persisted by flushes of every process."""
+        usage: Dict[str, Counter] = {}
+        for file_path in self._usage_files():
+            if file_path == self.process_path:
+                continue  # Own counts are merged from memory
+            try:
+                counts = json.loads(file_path.read_text())
+            except FileNotFoundError:
+                continue
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable filter usage file {file_path}: {e}")
+                continue
+            for collection, fields in counts.items():
+                usage.setdefault(collection, Counter()).update(fields)
+        return usage
+
+    @staticmethod
+    def _merge(usage: Dict[str, Counter], pending: Dict[str, Counter]) -> Dict[str, Dict[str, int]]:
+        for collection, counts in pending.items():
+            usage.setdefault(collection, Counter()).update(counts)
+        return {collection: dict(counts) for collection, counts in usage.items()}
+
+    def load(self) -> Dict[str, Dict[str, int]]:
+        """Persisted counts of all processes merged with this process's counts."""
+        with self._lock:
+            own: Dict[str, Counter] = {}
+            for counts in (self._flushed, self._pending):
+                for collection, fields in counts.items():
+                    own.setdefault(collection, Counter()).update(fields)
+        return self._merge(self._read_files(), own)
+
+    def flush(self) -> None:
+        """Write this process's counts to its own usage file."""
+        if not self.path:
+            return
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._since_flush = 0
+                self._flush_scheduled = False
+                if not pending:
+                    return
+                for collection, counts in pending.items():
+                    self._flushed.setdefault(collection, Counter()).update(counts)
+                snapshot = {collection: dict(counts) for collection, counts in self._flushed.items()}
+            tmp_path = self.process_path.with_name(self.process_path.name + ".tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_text(json.dumps(snapshot, indent=2, sort_keys=True))
+                os.replace(tmp_path, self.process_path)
+            except OSError as e:
+                logger.warning(f"Failed to write filter usage to {self.process_path}: {e}")
+
+
+# Global tracker instance
+_filter_usage_tracker: Optional[FilterUsageTracker] = None
+
+
+def get_filter_usage_tracker() -> FilterUsageTracker:
+    """Get or create global filter usage tracker (flushed at exit)."""
+    global _filter_usage_tracker
+    if _filter_usage_tracker is None:
+        _filter_usage_tracker = FilterUsageTracker(
+            path=os.getenv("QDRANT_FILTER_USAGE_FILE", "configs/qdrant_filter_usage.json")
+        )
+        atexit.register(_filter_usage_tracker.flush)
+    return _filter_usage_tracker
@@ -0,0 +1,136 @@
+"""
+Payload index advisor driven by filter usage.
+
+Compares the fields searches actually filter on (see ``filter_usage``) with
+the collection's payload indexes and recommends, or creates, indexes for
+frequently filtered fields that have none. Each field's schema type is
+inferred from a sample of stored payloads.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
+
+from qdrant_client.models import PayloadSchemaType
+
+from .qdrant_store import QdrantStore
+from .filter_usage import get_filter_usage_tracker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IndexRecommendation:
+    """A frequently filtered field without a payload index."""
+    field_name: str
+    filter_count: int
+    schema: Optional[PayloadSchemaType]  # None = could not infer from samples
+    created: bool = False
+
+
+def infer_schema(values: List[Any]) -> Optional[PayloadSchemaType]:
+    """
+    Infer a payload index type from sample values.
+
+    Args:
+        values: Sampled payload values (lists are flattened)
+
+    Returns:
+        Schema type, or None if the samples are empty or mixed
+    """
+    flat = []
+    for value in values:
+        flat.extend(value if isinstance(value, list) else [value])
+    flat = [value for value in flat if value is not None]
+    if not flat:
+        return None
+
+    if all(isinstance(value, bool) for value in flat):
+        return PayloadSchemaType.BOOL
+    if all(isinstance(value, int) and not isinstance(value, bool) for value in flat):
+        return PayloadSchemaType.INTEGER
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in flat):
+        return PayloadSchemaType.FLOAT
+    if all(isinstance(value, str) for value in flat):
+        return PayloadSchemaType.KEYWORD
+    return None
+
+
+def _sample_payload_values(store: QdrantStore, fields: List[str], sample_size: int) -> Dict[str, List[Any]]:
+    """Collect values of the given fields from a sample of points."""
+    points, _ = store.client.scroll(
+        collection_name=store.collection_name,
+        limit=sample_size,
+        with_payload=fields,
+        with_vectors=False
+    )
+    samples: Dict[str, List[Any]] = {field_name: [] for field_name in fields}
+    for point in points:
+        payload = point.payload or {}
+        for field_name in fields:
+            if field_name in payload:
+                samples[field_name].append(payload[field_name])
+    return samples
+
+
+def recommend_indexes(
+    store: QdrantStore,
+    min_count: int = 10,
+    usage: Optional[Dict[str, int]] = None,
+    sample_size: int = 200
+) -> List[IndexRecommendation]:
+    """
+    Recommend payload indexes for frequently filtered, unindexed fields.
+
+    Args:
+        store: Collection to inspect
+        min_count: Minimum recorded filtered searches for a recommendation
+        usage: Field -> filter count (default: recorded usage for the collection)
+        sample_size: Points sampled to infer each field's schema
+
+    Returns:
+        Recommendations, most frequently filtered first
+    """
+    if usage is None:
+        usage = get_filter_usage_tracker().load().get(store.collection_name, {})
+
+    indexed = set((store.client.get_collection(store.collection_name).payload_schema or {}).keys())
+    candidates = sorted(
+        (
+            (field_name, count) for field_name, count in usage.items()
+            if count >= min_count and field_name not in indexed
+        ),
+        key=lambda item: item[1],
+        reverse=True
+    )
+    if not candidates:
+        return []
+
+    samples = _sample_payload_values(store, [field_name for field_name, _ in candidates], sample_size)
+    return [
+        IndexRecommendation(
+            field_name=field_name,
+            filter_count=count,
+            schema=infer_schema(samples[field_name])
+        )
+        for field_name, count in candidates
+    ]
+
+
+def apply_recommendations(store: QdrantStore, recommendations: List[IndexRecommendation]) -> List[str]:
+    """
+    Create the recommended indexes whose schema could be inferred.
+
+    Args:
+        store: Collection to index
+        recommendations: Output of recommend_indexes()
+
+    Returns:
+        Names of created indexes
+    """
+    created = store.reconcile_payload_indexes(
+        [(rec.field_name, rec.schema) for rec in recommendations if rec.schema is not None]
+    )
+    for rec in recommendations:
+        rec.created = rec.field_name in created
+    return created
@@ -0,0 +1,515 @@
+"""
+Embedded, read-only vector index over exported embedding JSONL files.
+
+Serves the ``QdrantStore.search`` interface without a running Qdrant server:
+- One-time conversion of ``output/embeddings/<collection>/*.jsonl`` into a
+  memory-mapped float32 matrix, a payload file and a byte-offset table
+- Near-instant startup afterwards (files are mapped, not parsed)
+- Exact top-k with vectorized NumPy, optional IVF coarse quantizer for
+  larger corpora
+- The same metadata filter semantics as ``QdrantStore._build_filter``
+
+The index is rebuilt automatically when the source JSONL files change.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+import numpy as np
+from pydantic import BaseModel, field_validator
+
+from ..exceptions import VectorStoreError
+
+logger = logging.getLogger(__name__)
+
+_VECTORS_FILE = "vectors.f32"
+_PAYLOADS_FILE = "payloads.jsonl"
+_OFFSETS_FILE = "offsets.npy"
+_MANIFEST_FILE = "manifest.json"
+_IVF_CENTROIDS_FILE = "ivf_centroids.npy"
+_IVF_ORDER_FILE = "ivf_order.npy"
+_IVF_OFFSETS_FILE = "ivf_offsets.npy"
+
+_FORMAT_VERSION = 1
+
+_DISTANCE_METRICS = ("Cosine", "Euclidean", "Dot")
+# Qdrant's own enum spelling, accepted for the Euclidean metric
+_DISTANCE_ALIASES = {"Euclid": "Euclidean"}
+
+
+def _canonical_distance(name: Optional[str]) -> Optional[str]:
+    return _DISTANCE_ALIASES.get(name, name)
+
+
+class LocalIndexConfig(BaseModel):
+    """Configuration for the embedded local index."""
+
+    collection_name: str = "documents"
+    source_dir: Optional[str] = None  # Default: output/embeddings/<collection_name>
+    index_dir: str = "output/local_index"
+    vector_size: Optional[int] = None  # Inferred from data when not set
+    distance_metric: str = "Cosine"  # Cosine, Euclidean, Dot (as in QdrantStoreConfig)
+
+    # IVF coarse quantizer (0 = exact search only)
+    ivf_lists: int = 0
+    ivf_probes: int = 8
+    ivf_min_points: int = 50_000  # Below this, exact search is used anyway
+    ivf_train_iterations: int = 10
+
+    search_block_rows: int = 65_536  # Rows scored per block during exact search
+
+    @field_validator("distance_metric")
+    @classmethod
+    def _normalize_distance(cls, value: str) -> str:
+        value = _canonical_distance(value)
+        if value not in _DISTANCE_METRICS:
+            raise ValueError(f"distance_metric must be one of {', '.join(_DISTANCE_METRICS)}")
+        return value
+
+    @classmethod
+    def from_env(cls, collection_name: str) -> "LocalIndexConfig":
+        """Build config from LOCAL_INDEX_* environment variables."""
+        embeddings_dir = os.getenv("LOCAL_EMBEDDINGS_DIR", "output/embeddings")
+        return cls(
+            collection_name=collection_name,
+            source_dir=str(Path(embeddings_dir) / collection_name),
+            index_dir=os.getenv("LOCAL_INDEX_DIR", "output/local_index"),
+            ivf_lists=int(os.getenv("LOCAL_INDEX_IVF_LISTS", "0")),
+            ivf_probes=int(os.getenv("LOCAL_INDEX_IVF_PROBES", "8")),
+        )
+
+
+class LocalVectorIndex:
+    """
+    Read-only vector index backed by memory-mapped files.
+
+    Drop-in replacement for ``QdrantStore`` on the read path (``search``,
+    ``get_stats``, ``health_check``). Write methods raise ``VectorStoreError``;
+    regenerate the JSONL exports and the index rebuilds itself on next open.
+
+    Example:
+        >>> index = LocalVectorIndex(LocalIndexConfig(collection_name="agent_kit"))
+        >>> results = index.search(query_embedding, limit=5)
+    """
+
+    def __init__(self, config: Optional[LocalIndexConfig] = None):
+        """Open the index, building it from the source JSONL files if needed."""
+        self.config = config or LocalIndexConfig()
+        self.collection_name = self.config.collection_name
+        self.source_dir = Path(
+            self.config.source_dir or Path("output/embeddings") / self.collection_name
+        )
+        self.index_path = Path(self.config.index_dir) / self.collection_name
+
+        manifest = self._load_manifest()
+        if manifest is None or manifest.get("source_signature") != self._source_signature():
+            manifest = self._build()
+
+        self.manifest = manifest
+        self.count: int = manifest["count"]
+        self.dim: int = manifest["dim"]
+        self.distance: str = _canonical_distance(manifest["distance"])
+
+        if self.config.vector_size and self.config.vector_size != self.dim:
+            raise VectorStoreError(
+                f"Local index has dimension {self.dim}, expected {self.config.vector_size}",
+                operation="open",
+                collection=self.collection_name,
+                remediation="Check the embedding model used for the exported JSONL files"
+            )
+
+        self._vectors = np.memmap(
+            self.index_path / _VECTORS_FILE,
+            dtype=np.float32,
+            mode="r",
+            shape=(self.count, self.dim)
+        ) if self.count else np.zeros((0, self.dim), dtype=np.float32)
+        self._offsets = np.load(self.index_path / _OFFSETS_FILE, mmap_mode="r")
+        self._payload_file = open(self.index_path / _PAYLOADS_FILE, "rb")
+        self._payload_lock = threading.Lock()  # seek+read fallback where os.pread is missing
+
+        self._ivf_centroids: Optional[np.ndarray] = None
+        if manifest.get("ivf_lists"):
+            self._ivf_centroids = np.load(self.index_path / _IVF_CENTROIDS_FILE)
+            self._ivf_order = np.load(self.index_path / _IVF_ORDER_FILE, mmap_mode="r")
+            self._ivf_offsets = np.load(self.index_path / _IVF_OFFSETS_FILE)
+
+        logger.info(
+            f"Opened local index {self.collection_name}: {self.count} vectors, "
+            f"dim={self.dim}, ivf_lists={manifest.get('ivf_lists', 0)}"
+        )
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+
+    def _source_files(self) -> List[Path]:
+        """JSONL export files for this collection, in stable order."""
+        if not self.source_dir.exists():
+            raise VectorStoreError(
+                f"Embeddings directory not found: {self.source_dir}",
+                operation="build",
+                collection=self.collection_name,
+                remediation="Export embeddings to output/embeddings/<collection>/*.jsonl first"
+            )
+        return sorted(self.source_dir.glob("*.jsonl"))
+
+    def _source_signature(self) -> Dict[str, List[float]]:
+        """File name -> (size, mtime) for change detection."""
+        signature = {}
+        for path in self._source_files():
+            stat = path.stat()
+            signature[path.name] = [stat.st_size, stat.st_mtime]
+        return signature
+
+    def _load_manifest(self) -> Optional[Dict[str, Any]]:
+        """Load manifest if the index exists and matches the current format."""
+        manifest_path = self.index_path / _MANIFEST_FILE
+        if not manifest_path.exists():
+            return None
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable local index manifest {manifest_path}: {e}")
+            return None
+        if manifest.get("format_version") != _FORMAT_VERSION:
+            return None
+        if _canonical_distance(manifest.get("distance")) != self.config.distance_metric:
+            return None
+        if manifest.get("ivf_lists_requested", 0) != self.config.ivf_lists:
+            return None
+        return manifest
+
+    def _iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream records from all source JSONL files."""
+        for path in self._source_files():
+            with open(path, "r", encoding="utf-8") as f:
+                for line_no, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"Skipping malformed line {path.name}:{line_no}: {e}")
+
+    def _build(self) -> Dict[str, Any]:
+        """Convert the JSONL exports into memory-mapped index files."""
+        logger.info(f"Building local index for {self.collection_name} from {self.source_dir}")
+        self.index_path.mkdir(parents=True, exist_ok=True)
+
+        signature = self._source_signature()
+        normalize = self.config.distance_metric == "Cosine"
+
+        vectors_tmp = self.index_path / (_VECTORS_FILE + ".tmp")
+        payloads_tmp = self.index_path / (_PAYLOADS_FILE + ".tmp")
+
+        count = 0
+        dim: Optional[int] = self.config.vector_size
+        offsets = [0]
+
+        with open(vectors_tmp, "wb") as vf, open(payloads_tmp, "wb") as pf:
+            for record in self._iter_records():
+                embedding = record.get("embedding")
+                if not embedding:
+                    continue
+
+                vector = np.asarray(embedding, dtype=np.float32)
+                if dim is None:
+                    dim = vector.shape[0]
+                if vector.shape[0] != dim:
+                    logger.warning(
+                        f"Skipping {record.get('id')}: dimension {vector.shape[0]} != {dim}"
+                    )
+                    continue
+
+                if normalize:
+                    norm = np.linalg.norm(vector)
+                    if norm > 0:
+                        vector = vector / norm
+
+                vf.write(vector.tobytes())
+
+                line = json.dumps(
+                    {"id": record.get("id"), "payload": record.get("metadata") or {}},
+                    ensure_ascii=False
+                ).encode("utf-8") + b"\n"
+                pf.write(line)
+                offsets.append(offsets[-1] + len(line))
+                count += 1
+
+        if dim is None:
+            raise VectorStoreError(
+                f"No embeddings found in {self.source_dir}",
+                operation="build",
+                collection=self.collection_name
+            )
+
+        os.replace(vectors_tmp, self.index_path / _VECTORS_FILE)
+        os.replace(payloads_tmp, self.index_path / _PAYLOADS_FILE)
+        np.save(self.index_path / _OFFSETS_FILE, np.asarray(offsets, dtype=np.int64))
+
+        ivf_lists = 0
+        if self.config.ivf_lists and count >= max(self.config.ivf_min_points, self.config.ivf_lists):
+            ivf_lists = self._build_ivf(count, dim)
+
+        manifest = {
+            "format_version": _FORMAT_VERSION,
+            "collection": self.collection_name,
+            "count": count,
+            "dim": dim,
+            "distance": self.config.distance_metric,
+            "ivf_lists": ivf_lists,
+            "ivf_lists_requested": self.config.ivf_lists,
+            "source_signature": signature,
+        }
+        # Manifest is written last so a crashed build is rebuilt on next open
+        (self.index_path / _MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+
+        logger.info(f"Built local index for {self.collection_name}: {count} vectors, dim={dim}")
+        return manifest
+
+    def _build_ivf(self, count: int, dim: int) -> int:
+        """Train a k-means coarse quantizer and write inverted lists."""
+        vectors = np.memmap(
+            self.index_path / _VECTORS_FILE, dtype=np.float32, mode="r", shape=(count, dim)
+        )
+        n_lists = self.config.ivf_lists
+        rng = np.random.default_rng(0)
+
+        # Train on a sample; ~256 points per list is plenty for a coarse quantizer
+        sample_size = min(count, n_lists * 256)
+        sample = np.asarray(vectors[np.sort(rng.choice(count, sample_size, replace=False))])
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(self.config.ivf_train_iterations):
+            assignments = self._nearest_centroids(sample, centroids)
+            for list_id in range(n_lists):
+                members = sample[assignments == list_id]
+                if len(members):
+                    centroids[list_id] = members.mean(axis=0)
+            if self.config.distance_metric == "Cosine":
+                centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+
+        # Assign every vector, block by block
+        assignments = np.empty(count, dtype=np.int32)
+        block = self.config.search_block_rows
+        for start in range(0, count, block):
+            assignments[start:start + block] = self._nearest_centroids(
+                np.asarray(vectors[start:start + block]), centroids
+            )
+
+        order = np.argsort(assignments, kind="stable").astype(np.int64)
+        list_offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=n_lists), out=list_offsets[1:])
+
+        np.save(self.index_path / _IVF_CENTROIDS_FILE, centroids)
+        np.save(self.index_path / _IVF_ORDER_FILE, order)
+        np.save(self.index_path / _IVF_OFFSETS_FILE, list_offsets)
+        return n_lists
+
+    def _nearest_centroids(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Index of the best-scoring centroid for each vector."""
+        return np.argmax(self._score_matrix(vectors, centroids), axis=1)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _score_matrix(self, vectors: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """Scores (higher = better) of each vector against each query."""
+        if self.config.distance_metric == "Euclidean":
+            # Negative squared distance keeps "higher is better" for ranking
+            return (
+                2.0 * vectors @ queries.T
+                - np.sum(vectors * vectors, axis=1, keepdims=True)
+                - np.sum(queries * queries, axis=1)
+            )
+        return vectors @ queries.T
+
+    def _prepare_query(self, query_embedding: List[float]) -> np.ndarray:
+        """Convert and (for cosine) normalize the query vector."""
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape != (self.dim,):
+            raise VectorStoreError(
+                f"Query dimension {query.shape[0]} does not match index dimension {self.dim}",
+                operation="search",
+                collection=self.collection_name
+            )
+        if self.config.distance_metric == "Cosine":
+            norm = np.linalg.norm(query)
+            if norm > 0:
+                query = query / norm
+        return query
+
+    def _candidate_scores(self, query: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (row indices, scores) for every candidate row."""
+        queries = query[np.newaxis, :]
+
+        if self._ivf_centroids is not None:
+            centroid_scores = self._score_matrix(self._ivf_centroids, queries)[:, 0]
+            probes = min(self.config.ivf_probes, len(self._ivf_centroids))
+            lists = np.argpartition(-centroid_scores, probes - 1)[:probes]
+            rows = np.concatenate([
+                np.asarray(self._ivf_order[self._ivf_offsets[l]:self._ivf_offsets[l + 1]])
+                for l in lists
+            ])
+            rows.sort()  # Sequential reads from the memmap
+            return rows, self._score_matrix(np.asarray(self._vectors[rows]), queries)[:, 0]
+
+        scores = np.empty(self.count, dtype=np.float32)
+        block = self.config.search_block_rows
+        for start in range(0, self.count, block):
+            scores[start:start + block] = self._score_matrix(
+                np.asarray(self._vectors[start:start + block]), queries
+            )[:, 0]
+        return np.arange(self.count), scores
+
+    def _read_record(self, row: int) -> Dict[str, Any]:
+        """Read the id/payload record for a row."""
+        start = int(self._offsets[row])
+        end = int(self._offsets[row + 1])
+        # Searches run concurrently on the API thread pool: read at an
+        # explicit offset instead of moving the shared file position
+        if hasattr(os, "pread"):
+            return json.loads(os.pread(self._payload_file.fileno(), end - start, start))
+        with self._payload_lock:
+            self._payload_file.seek(start)
+            return json.loads(self._payload_file.read(end - start))
+
+    def _to_result_score(self, score: float) -> float:
+        """Map internal ranking scores back to Qdrant's score convention."""
+        if self.config.distance_metric == "Euclidean":
+            return float(np.sqrt(max(-score, 0.0)))
+        return float(score)
+
+    def search(
+        self,
+        query_embedding: List[float],
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for similar embeddings with optional filtering.
+
+        Args:
+            query_embedding: Dense query vector
+            limit: Maximum number of results
+            filters: Metadata filters (same semantics as QdrantStore)
+            score_threshold: Minimum score (maximum distance for Euclidean)
+
+        Returns:
+            List of results with id, score, metadata and content
+        """
+        if self.count == 0 or limit <= 0:
+            return []
+
+        query = self._prepare_query(query_embedding)
+        rows, scores = self._candidate_scores(query)
+
+        if score_threshold is not None:
+            if self.config.distance_metric == "Euclidean":
+                keep = scores >= -(score_threshold ** 2)
+            else:
+                keep = scores >= score_threshold
+            rows, scores = rows[keep], scores[keep]
+
+        if filters:
+            # Walk candidates best-first until enough pass the filter
+            order = np.argsort(-scores, kind="stable")
+        elif len(scores) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            order = top[np.argsort(-scores[top], kind="stable")]
+        else:
+            order = np.argsort(-scores, kind="stable")
+
+        results = []
+        for position in order:
+            record = self._read_record(int(rows[position]))
+            payload = record.get("payload") or {}
+            if filters and not _matches_filters(payload, filters):
+                continue
+            results.append({
+                "id": record.get("id"),
+                "score": self._to_result_score(float(scores[position])),
+                "metadata": payload,
+                "content": payload.get("content", "")
+            })
+            if len(results) >= limit:
+                break
+
+        return results
+
+    # ------------------------------------------------------------------
+    # QdrantStore-compatible housekeeping
+    # ------------------------------------------------------------------
+
+    def add_embeddings(self, *args, **kwargs) -> List[Any]:
+        """Local indexes are read-only."""
+        raise VectorStoreError(
+            "Local index is read-only",
+            operation="add_embeddings",
+            collection=self.collection_name,
+            remediation="Write to Qdrant or regenerate the JSONL exports; the index rebuilds on next open"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get collection statistics."""
+        return {
+            "collection_name": self.collection_name,
+            "vectors_count": self.count,
+            "indexed_vectors_count": self.count,
+            "points_count": self.count,
+            "status": "green",
+            "backend": "local",
+            "vector_size": self.dim,
+            "distance": self.config.distance_metric,
+            "ivf_lists": self.manifest.get("ivf_lists", 0),
+            "quantization_enabled": False,
+            "on_disk": True
+        }
+
+    def health_check(self) -> bool:
+        """Check that the index files are readable."""
+        try:
+            return (self.index_path / _VECTORS_FILE).exists() and not self._payload_file.closed
+        except Exception as e:
+            logger.error(f"Health check failed: {e}")
+            return False
+
+    def close(self):
+        """Release file handles."""
+        self._payload_file.close()
+
+
+def _matches_filters(payload: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """Evaluate filters against a payload like QdrantStore._build_filter does."""
+    for key, value in filters.items():
+        actual = payload.get(key)
+        if isinstance(value, list):
+            if isinstance(actual, list):
+                if not set(actual) & set(value):
+                    return False
+            elif actual not in value:
+                return False
+        elif isinstance(value, dict):
+            if actual is None:
+                return False
+            try:
+                if "gte" in value and actual < value["gte"]:
+                    return False
+                if "lte" in value and actual > value["lte"]:
+                    return False
+            except TypeError:
+                return False
+        elif isinstance(actual, list):
+            if value not in actual:
+                return False
+        elif actual != value:
+            return False
+    return True
@@ -2,14 +2,17 @@
 Qdrant vector storage layer with advanced features.
 
 Features:
-- Scalar quantization (int8) for 4x memory savings
+- Scalar (int8, 4x) or binary (32x) quantization with oversampled rescoring
 - Payload indexing for fast metadata filtering
-- Hybrid search (dense + sparse vectors)
+- Alias-aware, so reads follow blue/green reindex swaps
+- Hybrid search (named dense + BM25 sparse vectors, fused server-side)
 - Production-ready with health checks
 """
 
+import json
 import logging
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Optional, Iterator
 from datetime import datetime
 import uuid
 
@@ -24,17 +27,71 @@ from qdrant_client.models import (
     MatchAny,
     Range,
     SearchParams,
+    SearchRequest,
+    NamedVector,
     ScalarQuantization,
     ScalarQuantizationConfig,
     ScalarType,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    QuantizationSearchParams,
     PayloadSchemaType,
     HnswConfigDiff,
     CollectionConfig,
+    SparseVector,
+    SparseVectorParams,
+    SparseIndexParams,
+    Modifier,
+    Prefetch,
+    FusionQuery,
+    Fusion,
 )
 from pydantic import BaseModel
 
+from ..exceptions import ConfigurationError, VectorStoreError
+from .sparse_encoder import SparseEncoder
+from .write_versions import bump_collection_version
+from .filter_usage import get_filter_usage_tracker
+from .context_window import ChunkWindow, merge_windows, assign_chunks
+
 logger = logging.getLogger(__name__)
 
+# Payload indexes every collection should have (reconciled at startup)
+DEFAULT_PAYLOAD_INDEXES = [
+    ("document_id", PayloadSchemaType.KEYWORD),
+    ("document_title", PayloadSchemaType.TEXT),
+    ("chunk_index", PayloadSchemaType.INTEGER),
+    ("content_type", PayloadSchemaType.KEYWORD),
+    ("timestamp", PayloadSchemaType.DATETIME),
+    ("tags", PayloadSchemaType.KEYWORD),
+    # Converter filters
+    ("file_type", PayloadSchemaType.KEYWORD),
+    ("language", PayloadSchemaType.KEYWORD),
+    # Code-specific indexes for enhanced search
+    ("function_name", PayloadSchemaType.KEYWORD),
+    ("class_name", PayloadSchemaType.KEYWORD),
+    ("api_endpoint", PayloadSchemaType.KEYWORD),
+    ("programming_language", PayloadSchemaType.KEYWORD),
+    ("section", PayloadSchemaType.KEYWORD),
+]
+
+
+def _serialize_vector(vector: Any) -> Any:
+    """
+    Convert a stored vector to JSON-safe values.
+    
+    Dense vectors become lists of floats, sparse vectors become
+    ``{"indices": [...], "values": [...]}``; named vectors are converted
+    per name.
+    """
+    if vector is None:
+        return None
+    if isinstance(vector, dict):
+        return {name: _serialize_vector(value) for name, value in vector.items()}
+    if isinstance(vector, SparseVector):
+        return {"indices": list(vector.indices), "values": list(vector.values)}
+    return [float(value) for value in vector]
+
 
 class QdrantStoreConfig(BaseModel):
     """Configuration for Qdrant storage."""
@@ -44,14 +101,35 @@ class QdrantStoreConfig(BaseModel):
     collection_name: str = "documents"
     vector_size: int = 1536  # Nomic Embed Code dimension
     distance_metric: str = "Cosine"  # Cosine, Euclidean, Dot
-    enable_quantization: bool = True  # 4x memory savings
+    enable_quantization: bool = True  # 4x memory savings (int8), 32x (binary)
     quantization_type: str = "int8"  # int8 or binary
     
+    # Search defaults for this collection (overridable per call)
+    search_hnsw_ef: int = 64  # Higher = better recall, slower search
+    search_exact: bool = False  # Brute-force search on original vectors
+    tuning_file: Optional[str] = "configs/qdrant_tuning.json"  # Tuned hnsw_ef per collection
+    
+    # Search-time quantization settings (defaults for QdrantStore.search)
+    quantization_rescore: bool = True  # Re-score candidates with original vectors
+    quantization_oversampling: Optional[float] = None  # None = 1.0 for int8, 3.0 for binary
+    
     # HNSW index parameters
     hnsw_m: int = 16  # Number of edges per node (higher = better recall)
     hnsw_ef_construct: int = 100  # Size of dynamic candidate list
     on_disk: bool = False  # Store vectors on disk to save RAM
     
+    # Hybrid search (applies to newly created collections; existing
+    # collections keep whatever vector layout they were created with)
+    enable_sparse: bool = True  # Named dense + sparse vectors
+    dense_vector_name: str = "dense"
+    sparse_vector_name: str = "sparse"
+    hybrid_prefetch_multiplier: int = 4  # Candidates per branch = limit * multiplier
+    
+    # Collection lifecycle (read-only tools disable both)
+    create_if_missing: bool = True  # Create the collection if it does not exist
+    reconcile_indexes: bool = True  # Create missing default indexes on existing collections
+    track_filter_usage: bool = True  # Record filtered fields for the index advisor
+    
     # Production settings
     timeout: int = 60
     prefer_grpc: bool = False  # Use REST for string ID compatibility
@@ -75,20 +153,69 @@ class QdrantStore:
             api_key=config.api_key
         )
         
+        # Vector layout (resolved from the live collection below)
+        self.named_vectors = False
+        self.sparse_enabled = False
+        self.sparse_encoder = SparseEncoder()
+        
+        # Default hnsw_ef, possibly replaced by a tuned value
+        self.search_hnsw_ef = self.config.search_hnsw_ef
+        self._load_tuning()
+        
         # Initialize collection with optimizations
         self._initialize_collection()
+        self._detect_vector_layout()
         
         logger.info(f"Qdrant store initialized: {config.collection_name}")
     
+    def _load_tuning(self):
+        """Apply the persisted hnsw_ef for this collection, if one was tuned."""
+        if not self.config.tuning_file:
+            return
+        
+        path = Path(self.config.tuning_file)
+        if not path.exists():
+            return
+        
+        try:
+            tuning = json.loads(path.read_text()).get(self.collection_name)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable tuning file {path}: {e}")
+            return
+        
+        if tuning and tuning.get("hnsw_ef"):
+            self.search_hnsw_ef = int(tuning["hnsw_ef"])
+            logger.info(
+                f"Using tuned hnsw_ef={self.search_hnsw_ef} for {self.collection_name} "
+                f"(recall@{tuning.get('k')}={tuning.get('recall')})"
+            )
+    
     def _initialize_collection(self):
         """Create collection with optimized settings for code embeddings."""
         
-        # Check if collection exists
+        # Check if collection (or an alias pointing at one) exists
         collections = self.client.get_collections().collections
         if any(c.name == self.collection_name for c in collections):
             logger.info(f"Collection {self.collection_name} already exists")
+            if self.config.reconcile_indexes:
+                self.reconcile_payload_indexes()
             return
         
+        target = self.resolve_alias()
+        if target:
+            logger.info(f"Collection {self.collection_name} is an alias for {target}")
+            if self.config.reconcile_indexes:
+                self.reconcile_payload_indexes()
+            return
+        
+        if not self.config.create_if_missing:
+            raise VectorStoreError(
+                f"Collection {self.collection_name} does not exist",
+                operation="open",
+                collection=self.collection_name,
+                remediation="Check the collection name (list them with: collections list)"
+            )
+        
         # Distance metric mapping
         distance_map = {
             "Cosine": Distance.COSINE,
@@ -107,61 +234,180 @@ class QdrantStore:
                         always_ram=True
                     )
                 )
-            
+            elif self.config.quantization_type == "binary":
+                # 1 bit per dimension; works best for high-dimensional embeddings
+                # and needs oversampling + rescoring to recover recall
+                quantization_config = BinaryQuantization(
+                    binary=BinaryQuantizationConfig(always_ram=True)
+                )
+            else:
+                raise ConfigurationError(
+                    f"Unsupported quantization_type: {self.config.quantization_type!r} "
+                    f"(expected 'int8' or 'binary')",
+                    config_key="quantization_type"
+                )
+        
+        dense_params = VectorParams(
+            size=self.config.vector_size,
+            distance=distance_map[self.config.distance_metric],
+            hnsw_config=HnswConfigDiff(
+                m=self.config.hnsw_m,
+                ef_construct=self.config.hnsw_ef_construct,
+                full_scan_threshold=10000,
+                max_indexing_threads=0,
+                on_disk=self.config.on_disk
+            )
+        )
+        
+        # Named dense + sparse vectors for hybrid search. IDF is computed by
+        # Qdrant, so the local encoder only supplies BM25 term-frequency weights.
+        if self.config.enable_sparse:
+            vectors_config = {self.config.dense_vector_name: dense_params}
+            sparse_vectors_config = {
+                self.config.sparse_vector_name: SparseVectorParams(
+                    index=SparseIndexParams(on_disk=self.config.on_disk),
+                    modifier=Modifier.IDF
+                )
+            }
+        else:
+            vectors_config = dense_params
+            sparse_vectors_config = None
+        
         # Create collection with advanced settings
         self.client.create_collection(
             collection_name=self.collection_name,
-            vectors_config=VectorParams(
-                size=self.config.vector_size,
-                distance=distance_map[self.config.distance_metric],
-                hnsw_config=HnswConfigDiff(
-                    m=self.config.hnsw_m,
-                    ef_construct=self.config.hnsw_ef_construct,
-                    full_scan_threshold=10000,
-                    max_indexing_threads=0,
-                    on_disk=self.config.on_disk
-                )
-            ),
+            vectors_config=vectors_config,
+            sparse_vectors_config=sparse_vectors_config,
             quantization_config=quantization_config
         )
         
         # Create indexes for fast filtering on metadata fields
         # These indexes dramatically speed up filtered searches
-        payload_indexes = [
-            ("document_id", PayloadSchemaType.KEYWORD),
-            ("document_title", PayloadSchemaType.TEXT),
-            ("chunk_index", PayloadSchemaType.INTEGER),
-            ("content_type", PayloadSchemaType.KEYWORD),
-            ("timestamp", PayloadSchemaType.DATETIME),
-            ("tags", PayloadSchemaType.KEYWORD),
-            # Code-specific indexes for enhanced search
-            ("function_name", PayloadSchemaType.KEYWORD),
-            ("class_name", PayloadSchemaType.KEYWORD),
-            ("api_endpoint", PayloadSchemaType.KEYWORD),
-            ("programming_language", PayloadSchemaType.KEYWORD),
-            ("section", PayloadSchemaType.KEYWORD),
-        ]
+        self.reconcile_payload_indexes()
+        
+        logger.info(
+            f"Collection {self.collection_name} created with quantization: "
+            f"{self.config.enable_quantization}, sparse: {self.config.enable_sparse}"
+        )
+    
+    def reconcile_payload_indexes(
+        self,
+        indexes: Optional[List[Any]] = None
+    ) -> List[str]:
+        """
+        Create payload indexes that are missing from the collection.
         
-        for field_name, field_type in payload_indexes:
+        Args:
+            indexes: (field_name, PayloadSchemaType) pairs (default DEFAULT_PAYLOAD_INDEXES)
+        
+        Returns:
+            Names of newly created indexes
+        """
+        indexes = DEFAULT_PAYLOAD_INDEXES if indexes is None else indexes
+        existing = self.client.get_collection(self.collection_name).payload_schema or {}
+        
+        created = []
+        for field_name, field_type in indexes:
+            if field_name in existing:
+                continue
             try:
                 self.client.create_payload_index(
                     collection_name=self.collection_name,
                     field_name=field_name,
                     field_schema=field_type
                 )
+                created.append(field_name)
                 logger.debug(f"Created index for {field_name}")
             except Exception as e:
                 logger.warning(f"Failed to create index for {field_name}: {e}")
         
-        logger.info(f"Collection {self.collection_name} created with quantization: {self.config.enable_quantization}")
+        if created:
+            logger.info(f"Created payload indexes on {self.collection_name}: {', '.join(created)}")
+        return created
+    
+    def _detect_vector_layout(self):
+        """Detect whether the live collection uses named and sparse vectors."""
+        try:
+            params = self.client.get_collection(self.collection_name).config.params
+        except Exception as e:
+            logger.warning(f"Could not inspect vector layout of {self.collection_name}: {e}")
+            return
+        
+        vectors = params.vectors
+        self.named_vectors = (
+            isinstance(vectors, dict) and self.config.dense_vector_name in vectors
+        )
+        sparse_vectors = params.sparse_vectors or {}
+        self.sparse_enabled = self.config.sparse_vector_name in sparse_vectors
+        
+        if self.config.enable_sparse and not self.sparse_enabled:
+            logger.info(
+                f"Collection {self.collection_name} has no sparse vectors; "
+                f"hybrid_search will fall back to dense search"
+            )
+    
+    def refresh_vector_layout(self) -> bool:
+        """
+        Re-detect the vector layout (e.g. after a reindex swapped the alias).
+        
+        Returns:
+            True if the layout changed
+        """
+        before = (self.named_vectors, self.sparse_enabled)
+        self._detect_vector_layout()
+        changed = (self.named_vectors, self.sparse_enabled) != before
+        if changed:
+            logger.info(
+                f"Vector layout of {self.collection_name} changed "
+                f"(named={self.named_vectors}, sparse={self.sparse_enabled})"
+            )
+        return changed
+    
+    def _retry_on_layout_change(self, operation: Callable[[], Any]) -> Any:
+        """
+        Run a query; if it fails because the alias now points at a collection
+        with a different vector layout, re-detect the layout and retry once.
+        """
+        try:
+            return operation()
+        except Exception:
+            if not self.refresh_vector_layout():
+                raise
+            return operation()
+    
+    def _dense_query_vector(self, query_embedding: List[float]) -> Any:
+        """Wrap a dense query vector for the collection's vector layout."""
+        if self.named_vectors:
+            return (self.config.dense_vector_name, query_embedding)
+        return query_embedding
+    
+    def _point_vector(self, embedding: List[float], text: Optional[str]) -> Any:
+        """Build the stored vector(s) for a point."""
+        if not self.named_vectors:
+            return embedding
+        
+        vector: Dict[str, Any] = {self.config.dense_vector_name: embedding}
+        if self.sparse_enabled and text:
+            indices, values = self.sparse_encoder.encode_document(text)
+            if indices:
+                vector[self.config.sparse_vector_name] = SparseVector(
+                    indices=indices, values=values
+                )
+        return vector
     
     def add_embeddings(
         self,
         embeddings: List[List[float]],
         metadatas: List[Dict[str, Any]],
-        ids: Optional[List[Any]] = None
+        ids: Optional[List[Any]] = None,
+        documents: Optional[List[str]] = None
     ) -> List[Any]:
-        """Add embeddings with metadata to the collection."""
+        """
+        Add embeddings with metadata to the collection.
+        
+        Sparse vectors are derived from ``documents`` when given, otherwise
+        from each payload's ``content`` field.
+        """
         
         if not embeddings:
             return []
@@ -176,14 +422,16 @@ class QdrantStore:
             if "timestamp" not in metadata:
                 metadata["timestamp"] = timestamp
         
+        texts = documents or [metadata.get("content") for metadata in metadatas]
+        
         # Create points
         points = [
             PointStruct(
                 id=point_id,
-                vector=embedding,
+                vector=self._point_vector(embedding, text),
                 payload=metadata
             )
-            for point_id, embedding, metadata in zip(ids, embeddings, metadatas)
+            for point_id, embedding, metadata, text in zip(ids, embeddings, metadatas, texts)
         ]
         
         # Upload points in batches for efficiency
@@ -195,6 +443,7 @@ class QdrantStore:
                 points=batch
             )
         
+        bump_collection_version(self.collection_name)
         logger.info(f"Added {len(embeddings)} embeddings to {self.collection_name}")
         return ids
     
@@ -203,32 +452,227 @@ class QdrantStore:
         query_embedding: List[float],
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None,
-        score_threshold: Optional[float] = None
+        score_threshold: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: Optional[bool] = None,
+        oversampling: Optional[float] = None,
+        rescore: Optional[bool] = None
     ) -> List[Dict[str, Any]]:
-        """Search for similar embeddings with optional filtering."""
+        """
+        Search for similar embeddings with optional filtering.
+        
+        Args:
+            query_embedding: Dense query vector
+            limit: Maximum number of results
+            filters: Optional metadata filters
+            score_threshold: Minimum similarity score
+            hnsw_ef: HNSW candidate list size (default: tuned or config value)
+            exact: Brute-force search on original vectors, ignoring the HNSW
+                index and quantization (default from config)
+            oversampling: Quantized candidates fetched per result before
+                rescoring (default from config)
+            rescore: Re-score quantized candidates with the original vectors
+                (default from config)
+        
+        Returns:
+            List of results with id, score, metadata and content
+        """
         
         # Convert filters to Qdrant filter format
         qdrant_filter = self._build_filter(filters) if filters else None
         
         # Search parameters
-        search_params = SearchParams(
-            hnsw_ef=64,  # Higher = better recall, slower search
-            exact=False   # Use approximate search for speed
+        search_params = self._search_params(
+            hnsw_ef=hnsw_ef,
+            exact=exact,
+            oversampling=oversampling,
+            rescore=rescore
         )
         
-        # Perform search
-        results = self.client.search(
+        # Perform search (vector wrapped per call: the layout may be re-detected)
+        results = self._retry_on_layout_change(lambda: self.client.search(
             collection_name=self.collection_name,
-            query_vector=query_embedding,
+            query_vector=self._dense_query_vector(query_embedding),
             limit=limit,
             query_filter=qdrant_filter,
             search_params=search_params,
             score_threshold=score_threshold,
             with_payload=True,
             with_vectors=False  # Don't return vectors to save bandwidth
+        ))
+        
+        return self._format_results(results)
+    
+    def _search_params(
+        self,
+        hnsw_ef: Optional[int] = None,
+        exact: Optional[bool] = None,
+        oversampling: Optional[float] = None,
+        rescore: Optional[bool] = None
+    ) -> SearchParams:
+        """Build search parameters from per-call overrides and collection defaults."""
+        if exact is None:
+            exact = self.config.search_exact
+        
+        quantization = None
+        if exact:
+            # Exact means exact: score against the original vectors
+            quantization = QuantizationSearchParams(ignore=True)
+        elif self.config.enable_quantization:
+            if oversampling is None:
+                oversampling = self.config.quantization_oversampling
+            if oversampling is None:
+                oversampling = 3.0 if self.config.quantization_type == "binary" else 1.0
+            quantization = QuantizationSearchParams(
+                ignore=False,
+                rescore=self.config.quantization_rescore if rescore is None else rescore,
+                oversampling=oversampling
+            )
+        
+        return SearchParams(
+            hnsw_ef=hnsw_ef or self.search_hnsw_ef,
+            exact=exact,
+            quantization=quantization
         )
+    
+    def search_batch(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run many dense searches in a single round trip.
+        
+        Args:
+            requests: One dict per search with ``query_embedding`` and optional
+                ``limit`` (default 10), ``filters``, ``score_threshold``,
+                ``hnsw_ef``, ``exact``, ``oversampling`` and ``rescore``
+        
+        Returns:
+            One result list per request, in request order
+        
+        Example:
+            >>> results = store.search_batch([
+            ...     {"query_embedding": emb_a, "limit": 5},
+            ...     {"query_embedding": emb_b, "filters": {"content_type": "code"}},
+            ... ])
+        """
+        if not requests:
+            return []
+        
+        def run():
+            batch = []
+            for request in requests:
+                query_embedding = request["query_embedding"]
+                if self.named_vectors:
+                    vector = NamedVector(name=self.config.dense_vector_name, vector=query_embedding)
+                else:
+                    vector = query_embedding
+                
+                filters = request.get("filters")
+                batch.append(
+                    SearchRequest(
+                        vector=vector,
+                        filter=self._build_filter(filters) if filters else None,
+                        limit=request.get("limit", 10),
+                        params=self._search_params(
+                            hnsw_ef=request.get("hnsw_ef"),
+                            exact=request.get("exact"),
+                            oversampling=request.get("oversampling"),
+                            rescore=request.get("rescore")
+                        ),
+                        score_threshold=request.get("score_threshold"),
+                        with_payload=True,
+                        with_vector=False
+                    )
+                )
+            
+            return self.client.search_batch(
+                collection_name=self.collection_name,
+                requests=batch
+            )
+        
+        responses = self._retry_on_layout_change(run)
+        
+        return [self._format_results(results) for results in responses]
+    
+    def hybrid_search(
+        self,
+        query_text: str,
+        query_embedding: List[float],
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        prefetch_limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Dense + sparse search fused with RRF inside Qdrant (one round trip).
+        
+        Both branches are prefetched with the same filter and fused server-side,
+        so identifier-heavy queries (function names, endpoints) match via the
+        sparse branch while paraphrases match via the dense branch.
+        
+        Args:
+            query_text: Raw query text (for the sparse branch)
+            query_embedding: Dense query vector
+            limit: Maximum fused results
+            filters: Optional metadata filters (applied to both branches)
+            prefetch_limit: Candidates per branch (default: limit * multiplier)
+        
+        Returns:
+            List of results; ``score`` is the RRF fusion score
+        """
+        return self._retry_on_layout_change(lambda: self._hybrid_search(
+            query_text, query_embedding, limit, filters, prefetch_limit
+        ))
+    
+    def _hybrid_search(
+        self,
+        query_text: str,
+        query_embedding: List[float],
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        prefetch_limit: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """hybrid_search() for the currently detected layout."""
+        if not self.sparse_enabled:
+            return self.search(query_embedding=query_embedding, limit=limit, filters=filters)
+        
+        qdrant_filter = self._build_filter(filters) if filters else None
+        branch_limit = prefetch_limit or limit * self.config.hybrid_prefetch_multiplier
         
-        # Format results
+        indices, values = self.sparse_encoder.encode_query(query_text)
+        prefetch = [
+            Prefetch(
+                query=query_embedding,
+                # Unnamed (legacy) dense vector next to a sparse one: query the default vector
+                using=self.config.dense_vector_name if self.named_vectors else None,
+                filter=qdrant_filter,
+                params=self._search_params(),
+                limit=branch_limit
+            )
+        ]
+        if indices:
+            prefetch.append(
+                Prefetch(
+                    query=SparseVector(indices=indices, values=values),
+                    using=self.config.sparse_vector_name,
+                    filter=qdrant_filter,
+                    limit=branch_limit
+                )
+            )
+        
+        response = self.client.query_points(
+            collection_name=self.collection_name,
+            prefetch=prefetch,
+            query=FusionQuery(fusion=Fusion.RRF),
+            limit=limit,
+            with_payload=True,
+            with_vectors=False
+        )
+        
+        return self._format_results(response.points)
+    
+    def _format_results(self, results: List[Any]) -> List[Dict[str, Any]]:
+        """Convert scored Qdrant points to plain result dictionaries."""
         formatted_results = []
         for result in results:
             payload = result.payload or {}
@@ -241,6 +685,121 @@ class QdrantStore:
         
         return formatted_results
     
+    def iter_points(
+        self,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+        batch_size: int = 256,
+        with_vectors: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every point of the collection page by page.
+        
+        Uses Qdrant's scroll cursor, so only one page is held in memory at a
+        time regardless of collection size.
+        
+        Args:
+            filter_conditions: Optional payload filters (see search())
+            batch_size: Points fetched per scroll page
+            with_vectors: Include stored vectors
+            
+        Yields:
+            Dicts with id, document_id, chunk_index, content, metadata
+            (and vector when requested)
+        """
+        scroll_filter = self._build_filter(filter_conditions) if filter_conditions else None
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=scroll_filter,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=with_vectors
+            )
+            for point in points:
+                payload = point.payload or {}
+                item = {
+                    "id": point.id,
+                    "document_id": payload.get("document_id"),
+                    "chunk_index": payload.get("chunk_index"),
+                    "content": payload.get("content", ""),
+                    "metadata": payload
+                }
+                if with_vectors:
+                    item["vector"] = _serialize_vector(point.vector)
+                yield item
+            if offset is None:
+                break
+    
+    def get_neighbor_chunks(self, chunk_ids: List[Any], window: int = 1) -> List[ChunkWindow]:
+        """
+        Fetch the chunks around hit chunks instead of whole documents.
+        
+        Each hit expands to ``chunk_index ± window`` within its document;
+        overlapping windows are merged and all of them are fetched in one
+        scroll using the ``document_id`` and ``chunk_index`` payload indexes.
+        
+        Args:
+            chunk_ids: Point ids of hit chunks
+            window: Neighbors to include on each side
+        
+        Returns:
+            Merged windows with their chunks ordered by chunk_index
+        """
+        if not chunk_ids:
+            return []
+        
+        hits = self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=chunk_ids,
+            with_payload=["document_id", "chunk_index"],
+            with_vectors=False
+        )
+        windows = merge_windows(
+            (
+                (point.payload["document_id"], int(point.payload["chunk_index"]), str(point.id))
+                for point in hits
+                if point.payload and "document_id" in point.payload and "chunk_index" in point.payload
+            ),
+            window
+        )
+        if not windows:
+            return []
+        
+        range_filter = Filter(should=[
+            Filter(must=[
+                FieldCondition(key="document_id", match=MatchValue(value=w.document_id)),
+                FieldCondition(key="chunk_index", range=Range(gte=w.start, lte=w.end))
+            ])
+            for w in windows
+        ])
+        
+        chunks = []
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=range_filter,
+                limit=sum(w.end - w.start + 1 for w in windows),
+                offset=offset,
+                with_payload=True,
+                with_vectors=False
+            )
+            for point in points:
+                payload = point.payload or {}
+                chunks.append({
+                    "id": point.id,
+                    "document_id": payload.get("document_id"),
+                    "chunk_index": payload.get("chunk_index"),
+                    "content": payload.get("content", ""),
+                    "metadata": payload
+                })
+            if offset is None:
+                break
+        
+        return assign_chunks(windows, chunks)
+    
     def search_code(
         self,
         query_embedding: List[float],
@@ -323,6 +882,9 @@ class QdrantStore:
         if not filters:
             return None
         
+        if self.config.track_filter_usage:
+            get_filter_usage_tracker().record(self.collection_name, filters.keys())
+        
         conditions = []
         
         for key, value in filters.items():
@@ -363,28 +925,52 @@ class QdrantStore:
         
         return {
             "collection_name": self.collection_name,
+            "alias_for": self.resolve_alias(),
             "vectors_count": info.vectors_count,
             "points_count": info.points_count,
             "indexed_vectors_count": info.indexed_vectors_count,
             "status": str(info.status),
             "optimizer_status": str(info.optimizer_status) if info.optimizer_status else "N/A",
             "quantization_enabled": self.config.enable_quantization,
+            "quantization_type": self.config.quantization_type if self.config.enable_quantization else None,
+            "search_hnsw_ef": self.search_hnsw_ef,
+            "sparse_enabled": self.sparse_enabled,
             "on_disk": self.config.on_disk
         }
     
+    def resolve_alias(self) -> Optional[str]:
+        """
+        Return the collection an alias points to.
+        
+        Returns:
+            Target collection name, or None if ``collection_name`` is not an alias
+        """
+        for alias in self.client.get_aliases().aliases:
+            if alias.alias_name == self.collection_name:
+                return alias.collection_name
+        return None
+    
     def delete_collection(self):
-        """Delete the entire collection."""
-        self.client.delete_collection(collection_name=self.collection_name)
-        logger.info(f"Deleted collection: {self.collection_name}")
+        """Delete the entire collection (the alias target, if this is an alias)."""
+        target = self.resolve_alias() or self.collection_name
+        self.client.delete_collection(collection_name=target)
+        bump_collection_version(self.collection_name)
+        logger.info(f"Deleted collection: {target}")
     
     def reset_collection(self):
-        """Reset collection (delete and recreate)."""
+        """
+        Reset collection (delete and recreate).
+        
+        Search is unavailable until re-ingestion finishes; use
+        ``CollectionReindexer`` to rebuild a live collection without downtime.
+        """
         try:
             self.delete_collection()
         except Exception as e:
             logger.debug(f"Collection didn't exist: {e}")
         
         self._initialize_collection()
+        self._detect_vector_layout()
         logger.info(f"Reset collection: {self.collection_name}")
     
     def health_check(self) -> bool:
@@ -401,7 +987,8 @@ async def create_qdrant_store(
     host: str = "localhost",
     port: int = 6333,
     collection_name: str = "documents",
-    enable_quantization: bool = True
+    enable_quantization: bool = True,
+    quantization_type: str = "int8"
 ) -> QdrantStore:
     """
     Factory function to create Qdrant store.
@@ -410,7 +997,8 @@ async def create_qdrant_store(
         host: Qdrant server host
         port: Qdrant server port
         collection_name: Collection name
-        enable_quantization: Enable int8 quantization (4x memory savings)
+        enable_quantization: Enable vector quantization
+        quantization_type: "int8" (4x memory savings) or "binary" (32x)
     
     Returns:
         Configured QdrantStore instance
@@ -419,6 +1007,7 @@ async def create_qdrant_store(
         host=host,
         port=port,
         collection_name=collection_name,
-        enable_quantization=enable_quantization
+        enable_quantization=enable_quantization,
+        quantization_type=quantization_type
     )
     return QdrantStore(config)
\ No newline at end of file
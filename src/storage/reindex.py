@@ -0,0 +1,389 @@
+"""
+Blue/green reindexing for Qdrant collections through aliases.
+
+Readers (``QdrantStore``, the MCP servers, the converter) address a stable
+alias such as ``agent_kit``. A reindex:
+1. Builds a new versioned collection (``agent_kit__v20250101T120000``)
+2. Validates point counts and a sample of queries against it
+3. Atomically repoints the alias in a single ``update_collection_aliases`` call
+4. Garbage-collects superseded versions
+
+Search keeps hitting the old collection until the swap, so changing the
+embedding model or chunk size no longer takes search offline.
+
+A plain (legacy) collection that occupies the alias name has to be deleted
+before the alias can exist, which briefly takes search offline. Reindexing
+refuses that unless ``migrate_legacy`` is set for a one-time migration; the
+legacy collection is then only deleted once the new version is built and
+validated.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Any, Optional, Callable, Awaitable
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+)
+
+from ..exceptions import ConfigurationError, VectorStoreError
+from .qdrant_store import QdrantStore, QdrantStoreConfig
+from .write_versions import bump_collection_version
+
+logger = logging.getLogger(__name__)
+
+VERSION_SEPARATOR = "__v"
+
+
+@dataclass
+class ValidationReport:
+    """Result of validating a freshly built collection."""
+    collection: str
+    points_count: int
+    expected_points: Optional[int]
+    queries_checked: int = 0
+    empty_queries: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class ReindexReport:
+    """Outcome of a blue/green reindex."""
+    alias: str
+    new_collection: str
+    previous_collection: Optional[str]
+    validation: ValidationReport
+    swapped: bool
+    deleted_collections: List[str] = field(default_factory=list)
+
+
+class CollectionReindexer:
+    """
+    Build, validate and swap versioned collections behind an alias.
+
+    Example:
+        >>> reindexer = CollectionReindexer(QdrantStoreConfig(collection_name="agent_kit", vector_size=3584))
+        >>> target = reindexer.create_version()
+        >>> target.add_embeddings(embeddings, metadatas)
+        >>> report = reindexer.validate(target, sample_queries=[query_vector])
+        >>> if report.passed:
+        ...     reindexer.swap(target.collection_name)
+        ...     reindexer.garbage_collect()
+    """
+
+    def __init__(self, config: QdrantStoreConfig):
+        """
+        Initialize reindexer.
+
+        Args:
+            config: Store configuration; ``collection_name`` is the alias readers use
+        """
+        self.config = config
+        self.alias = config.collection_name
+        self.client = QdrantClient(
+            host=config.host,
+            port=config.port,
+            timeout=config.timeout,
+            prefer_grpc=config.prefer_grpc,
+            api_key=config.api_key
+        )
+
+    def current_target(self) -> Optional[str]:
+        """Collection the alias currently points to (None if not an alias)."""
+        for alias in self.client.get_aliases().aliases:
+            if alias.alias_name == self.alias:
+                return alias.collection_name
+        return None
+
+    def _is_physical_collection(self, name: str) -> bool:
+        """Whether a real (non-alias) collection with this name exists."""
+        return any(c.name == name for c in self.client.get_collections().collections)
+
+    def is_legacy(self) -> bool:
+        """Whether a plain collection (not an alias) occupies the alias name."""
+        return self.current_target() is None and self._is_physical_collection(self.alias)
+
+    def _refuse_legacy(self) -> None:
+        raise ConfigurationError(
+            f"{self.alias} is a plain collection, not an alias, so it cannot be swapped "
+            f"without downtime. Run a one-time migration (converter --reindex --migrate-legacy); "
+            f"search is unavailable between deleting {self.alias} and creating the alias."
+        )
+
+    def versions(self) -> List[str]:
+        """All versioned collections for this alias, oldest first."""
+        prefix = f"{self.alias}{VERSION_SEPARATOR}"
+        return sorted(
+            c.name for c in self.client.get_collections().collections
+            if c.name.startswith(prefix)
+        )
+
+    def create_version(self, **config_overrides: Any) -> QdrantStore:
+        """
+        Create a new, empty versioned collection.
+
+        Args:
+            **config_overrides: QdrantStoreConfig fields to change for the new
+                version (e.g. ``vector_size`` for a new embedding model)
+
+        Returns:
+            QdrantStore writing to the new collection
+        """
+        version = datetime.now().strftime("%Y%m%dT%H%M%S")
+        name = f"{self.alias}{VERSION_SEPARATOR}{version}"
+        # Never reuse an existing version (e.g. the live one, built in the same second)
+        existing = set(self.versions())
+        suffix = 1
+        while name in existing:
+            suffix += 1
+            name = f"{self.alias}{VERSION_SEPARATOR}{version}_{suffix}"
+        target_config = self.config.model_copy(update={**config_overrides, "collection_name": name})
+        logger.info(f"Creating reindex target {name} for alias {self.alias}")
+        return QdrantStore(target_config)
+
+    def validate(
+        self,
+        target: QdrantStore,
+        expected_points: Optional[int] = None,
+        min_count_ratio: float = 0.9,
+        sample_queries: Optional[List[List[float]]] = None,
+        min_score: Optional[float] = None,
+    ) -> ValidationReport:
+        """
+        Check that a new version is safe to serve.
+
+        Args:
+            target: Store for the new version
+            expected_points: Required point count; defaults to ``min_count_ratio``
+                times the live collection's count
+            min_count_ratio: Fraction of the live count required when
+                ``expected_points`` is not given
+            sample_queries: Query vectors (embedded with the new model) that
+                must each return results
+            min_score: Optional minimum top-1 score for each sample query
+
+        Returns:
+            ValidationReport (``passed`` is False if any check failed)
+        """
+        points = target.get_stats().get("points_count") or 0
+
+        if expected_points is None:
+            live = self.current_target() or (
+                self.alias if self._is_physical_collection(self.alias) else None
+            )
+            if live:
+                live_points = self.client.get_collection(live).points_count or 0
+                expected_points = int(live_points * min_count_ratio)
+
+        report = ValidationReport(
+            collection=target.collection_name,
+            points_count=points,
+            expected_points=expected_points
+        )
+
+        if points == 0:
+            report.errors.append("Target collection is empty")
+        elif expected_points is not None and points < expected_points:
+            report.errors.append(f"Point count {points} below expected {expected_points}")
+
+        for query in sample_queries or []:
+            report.queries_checked += 1
+            results = target.search(query_embedding=query, limit=1)
+            if not results:
+                report.empty_queries += 1
+            elif min_score is not None and results[0]["score"] < min_score:
+                report.errors.append(
+                    f"Sample query top score {results[0]['score']:.3f} below {min_score}"
+                )
+        if report.empty_queries:
+            report.errors.append(f"{report.empty_queries} sample queries returned no results")
+
+        logger.info(
+            f"Validated {target.collection_name}: {points} points, "
+            f"{report.queries_checked} queries, passed={report.passed}"
+        )
+        return report
+
+    def swap(self, new_collection: str, migrate_legacy: bool = False) -> Optional[str]:
+        """
+        Atomically point the alias at a new collection.
+
+        Args:
+            new_collection: Collection the alias should resolve to
+            migrate_legacy: Replace a plain collection occupying the alias name
+                (one-time migration with a short search outage)
+
+        Returns:
+            Previously aliased collection (None on first swap)
+
+        Raises:
+            ConfigurationError: If a legacy collection occupies the alias name
+                and ``migrate_legacy`` is not set
+            VectorStoreError: If the new collection is missing or empty, or the
+                alias could not be created after a legacy migration
+        """
+        previous = self.current_target()
+
+        if previous is None and self._is_physical_collection(self.alias):
+            if not migrate_legacy:
+                self._refuse_legacy()
+            self._migrate_legacy(new_collection)
+            return None
+
+        operations = []
+        if previous is not None:
+            operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=self.alias)))
+        operations.append(
+            CreateAliasOperation(
+                create_alias=CreateAlias(collection_name=new_collection, alias_name=self.alias)
+            )
+        )
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        bump_collection_version(self.alias)
+
+        logger.info(f"Alias {self.alias}: {previous or '(none)'} -> {new_collection}")
+        return previous
+
+    def _migrate_legacy(self, new_collection: str) -> None:
+        """Replace the legacy collection with an alias to an already built version."""
+        # Never delete the legacy data unless the replacement can be served
+        if not self._is_physical_collection(new_collection):
+            raise VectorStoreError(
+                f"Replacement collection {new_collection} does not exist",
+                operation="reindex",
+                collection=self.alias,
+                remediation=f"{self.alias} was not changed"
+            )
+        if not (self.client.get_collection(new_collection).points_count or 0):
+            raise VectorStoreError(
+                f"Replacement collection {new_collection} is empty",
+                operation="reindex",
+                collection=self.alias,
+                remediation=f"{self.alias} was not changed"
+            )
+
+        logger.warning(
+            f"Migrating legacy collection {self.alias} to an alias for {new_collection}; "
+            f"searches fail until the alias is created"
+        )
+        self.client.delete_collection(self.alias)
+        try:
+            self.client.update_collection_aliases(change_aliases_operations=[
+                CreateAliasOperation(
+                    create_alias=CreateAlias(collection_name=new_collection, alias_name=self.alias)
+                )
+            ])
+        except Exception as e:
+            raise VectorStoreError(
+                f"Deleted legacy {self.alias} but failed to create the alias: {e}",
+                operation="reindex",
+                collection=self.alias,
+                remediation=f"The data is in {new_collection}; point alias {self.alias} at it"
+            ) from e
+        bump_collection_version(self.alias)
+
+        logger.info(f"Alias {self.alias}: (legacy collection) -> {new_collection}")
+
+    def garbage_collect(self, keep_previous: int = 0) -> List[str]:
+        """
+        Delete superseded versions.
+
+        Args:
+            keep_previous: Number of most recent non-live versions to keep for rollback
+
+        Returns:
+            Names of deleted collections
+        """
+        live = self.current_target()
+        stale = [name for name in self.versions() if name != live]
+        to_delete = stale[:len(stale) - keep_previous] if keep_previous else stale
+
+        for name in to_delete:
+            self.client.delete_collection(name)
+            logger.info(f"Deleted superseded collection {name}")
+
+        return to_delete
+
+    async def reindex(
+        self,
+        build: Callable[[QdrantStore], Awaitable[Any]],
+        sample_queries: Optional[List[List[float]]] = None,
+        expected_points: Optional[int] = None,
+        keep_previous: int = 0,
+        migrate_legacy: bool = False,
+        **config_overrides: Any
+    ) -> ReindexReport:
+        """
+        Run a complete blue/green reindex.
+
+        Args:
+            build: Coroutine that ingests everything into the given target store
+            sample_queries: Query vectors for validation
+            expected_points: Required point count (see ``validate``)
+            keep_previous: Superseded versions to keep for rollback
+            migrate_legacy: Allow replacing a plain collection that occupies
+                the alias name (see ``swap``)
+            **config_overrides: QdrantStoreConfig changes for the new version
+
+        Returns:
+            ReindexReport; on failed validation the alias is left untouched and
+            the new version is deleted
+
+        Raises:
+            ConfigurationError: If a legacy collection occupies the alias name
+                and ``migrate_legacy`` is not set (checked before building)
+            VectorStoreError: If building the new version fails
+        """
+        if self.is_legacy() and not migrate_legacy:
+            self._refuse_legacy()
+
+        target = self.create_version(**config_overrides)
+
+        try:
+            await build(target)
+        except Exception as e:
+            target.delete_collection()
+            raise VectorStoreError(
+                f"Reindex build failed: {e}",
+                operation="reindex",
+                collection=self.alias,
+                remediation="The live alias was not changed; fix the error and retry"
+            ) from e
+
+        validation = self.validate(
+            target,
+            expected_points=expected_points,
+            sample_queries=sample_queries
+        )
+
+        if not validation.passed:
+            logger.error(f"Reindex of {self.alias} failed validation: {validation.errors}")
+            target.delete_collection()
+            return ReindexReport(
+                alias=self.alias,
+                new_collection=target.collection_name,
+                previous_collection=self.current_target(),
+                validation=validation,
+                swapped=False
+            )
+
+        previous = self.swap(target.collection_name, migrate_legacy=migrate_legacy)
+        deleted = self.garbage_collect(keep_previous=keep_previous)
+
+        return ReindexReport(
+            alias=self.alias,
+            new_collection=target.collection_name,
+            previous_collection=previous,
+            validation=validation,
+            swapped=True,
+            deleted_collections=deleted
+        )
@@ -0,0 +1,215 @@
+"""
+Recall/latency auto-tuner for Qdrant HNSW search.
+
+Samples stored vectors as queries, compares approximate search against exact
+search and records the smallest ``hnsw_ef`` that meets a target recall@k.
+The result is persisted to the tuning file that ``QdrantStore`` loads at
+startup, making it the collection's default.
+"""
+
+import json
+import logging
+import random
+import statistics
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Sequence
+
+from .qdrant_store import QdrantStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EF_CANDIDATES = (16, 32, 48, 64, 96, 128, 192, 256, 384, 512)
+
+
+@dataclass
+class TuningResult:
+    """Outcome of an hnsw_ef tuning run."""
+    collection: str
+    k: int
+    target_recall: float
+    hnsw_ef: int
+    recall: float
+    p50_ms: float
+    met_target: bool
+    samples: int
+    evaluated: List[Dict[str, float]] = field(default_factory=list)
+    tuned_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+def sample_query_vectors(
+    store: QdrantStore,
+    sample_size: int = 100,
+    seed: int = 42
+) -> List[List[float]]:
+    """
+    Sample stored dense vectors to use as queries.
+
+    Args:
+        store: Store to sample from
+        sample_size: Number of vectors to return
+        seed: Random seed for reproducible samples
+
+    Returns:
+        List of dense vectors
+    """
+    vectors: List[List[float]] = []
+    offset = None
+
+    while True:
+        points, offset = store.client.scroll(
+            collection_name=store.collection_name,
+            limit=256,
+            offset=offset,
+            with_payload=False,
+            with_vectors=[store.config.dense_vector_name] if store.named_vectors else True
+        )
+        for point in points:
+            vector = point.vector
+            if isinstance(vector, dict):
+                vector = vector.get(store.config.dense_vector_name)
+            if vector:
+                vectors.append(vector)
+        # Oversample the pool so the shuffle is not just the first pages
+        if offset is None or len(vectors) >= sample_size * 20:
+            break
+
+    random.Random(seed).shuffle(vectors)
+    return vectors[:sample_size]
+
+
+def measure_recall(
+    store: QdrantStore,
+    queries: List[List[float]],
+    baselines: List[set],
+    k: int,
+    **search_kwargs: Any
+) -> Dict[str, float]:
+    """
+    Measure recall@k and latency of ``store.search`` against exact baselines.
+
+    Args:
+        store: Store to query
+        queries: Query vectors
+        baselines: Exact top-k id sets, one per query
+        k: Result count
+        **search_kwargs: Per-call search settings (hnsw_ef, oversampling, ...)
+
+    Returns:
+        Dict with recall, p50_ms and p95_ms
+    """
+    recalls, latencies = [], []
+    for query, expected in zip(queries, baselines):
+        start = time.perf_counter()
+        results = store.search(query_embedding=query, limit=k, **search_kwargs)
+        latencies.append((time.perf_counter() - start) * 1000)
+        found = {r["id"] for r in results}
+        recalls.append(len(expected & found) / max(len(expected), 1))
+
+    latencies.sort()
+    return {
+        "recall": statistics.mean(recalls),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(0.95 * (len(latencies) - 1))],
+    }
+
+
+def exact_baselines(store: QdrantStore, queries: List[List[float]], k: int) -> List[set]:
+    """Exact top-k id sets (original vectors, no index) for each query."""
+    return [
+        {r["id"] for r in store.search(query_embedding=q, limit=k, exact=True)}
+        for q in queries
+    ]
+
+
+def tune_hnsw_ef(
+    store: QdrantStore,
+    target_recall: float = 0.95,
+    k: int = 10,
+    samples: int = 100,
+    candidates: Sequence[int] = DEFAULT_EF_CANDIDATES,
+    seed: int = 42
+) -> TuningResult:
+    """
+    Find the smallest hnsw_ef whose recall@k meets the target.
+
+    Args:
+        store: Store whose collection is tuned
+        target_recall: Required mean recall@k (0-1)
+        k: Result count for recall@k
+        samples: Number of stored vectors used as queries
+        candidates: hnsw_ef values to try (ascending)
+        seed: Random seed for query sampling
+
+    Returns:
+        TuningResult (falls back to the best-recall candidate if none meet the target)
+
+    Example:
+        >>> result = tune_hnsw_ef(store, target_recall=0.95, k=10)
+        >>> save_tuning("configs/qdrant_tuning.json", result)
+    """
+    queries = sample_query_vectors(store, samples, seed)
+    if not queries:
+        raise ValueError(f"Collection {store.collection_name} has no vectors to sample")
+
+    baselines = exact_baselines(store, queries, k)
+
+    evaluated = []
+    chosen: Optional[Dict[str, float]] = None
+    for ef in sorted(set(candidates)):
+        # Never ask for fewer candidates than results
+        ef = max(ef, k)
+        stats = measure_recall(store, queries, baselines, k, hnsw_ef=ef, exact=False)
+        stats["hnsw_ef"] = ef
+        evaluated.append(stats)
+        logger.info(
+            f"{store.collection_name}: hnsw_ef={ef} recall@{k}={stats['recall']:.3f} "
+            f"p50={stats['p50_ms']:.2f}ms"
+        )
+        if stats["recall"] >= target_recall:
+            chosen = stats
+            break
+
+    met_target = chosen is not None
+    if chosen is None:
+        chosen = max(evaluated, key=lambda s: (s["recall"], -s["hnsw_ef"]))
+        logger.warning(
+            f"{store.collection_name}: no hnsw_ef reached recall {target_recall}; "
+            f"using best candidate {int(chosen['hnsw_ef'])}"
+        )
+
+    return TuningResult(
+        collection=store.collection_name,
+        k=k,
+        target_recall=target_recall,
+        hnsw_ef=int(chosen["hnsw_ef"]),
+        recall=round(chosen["recall"], 4),
+        p50_ms=round(chosen["p50_ms"], 3),
+        met_target=met_target,
+        samples=len(queries),
+        evaluated=evaluated
+    )
+
+
+def save_tuning(path: str, result: TuningResult) -> None:
+    """
+    Persist a tuning result as the collection's default search settings.
+
+    Args:
+        path: Tuning file (JSON mapping collection name -> settings)
+        result: Result to store
+    """
+    tuning_path = Path(path)
+    tuning: Dict[str, Any] = {}
+    if tuning_path.exists():
+        tuning = json.loads(tuning_path.read_text())
+
+    entry = asdict(result)
+    entry.pop("collection")
+    tuning[result.collection] = entry
+
+    tuning_path.parent.mkdir(parents=True, exist_ok=True)
+    tuning_path.write_text(json.dumps(tuning, indent=2))
+    logger.info(f"Saved tuned hnsw_ef={result.hnsw_ef} for {result.collection} to {tuning_path}")
@@ -0,0 +1,141 @@
+"""
+Local BM25-style sparse encoder for hybrid search.
+
+Produces Qdrant sparse vectors without any model download:
+- Identifier-aware tokenization (camelCase, snake_case, dotted paths, endpoints)
+- Hashed vocabulary (stable across processes, no fitted state to persist)
+- BM25 term-frequency saturation at ingest time
+- IDF applied server-side by Qdrant (``Modifier.IDF`` on the sparse vector)
+
+Dense embeddings capture meaning; these sparse vectors make exact identifiers
+(function names, class names, API endpoints) match reliably.
+"""
+
+import re
+import zlib
+from collections import Counter
+from typing import Dict, List, Tuple
+
+# Whole identifiers, including dotted/slashed paths like "step.run" or "/v1/events"
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(?:[./:-][A-Za-z0-9_]+)*")
+# Sub-word boundaries inside identifiers
+_CAMEL_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+_SPLIT_PATTERN = re.compile(r"[._/:\-]+")
+
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in",
+    "is", "it", "of", "on", "or", "that", "the", "this", "to", "was", "what",
+    "when", "where", "which", "with", "you", "your",
+})
+
+
+class SparseEncoder:
+    """
+    Hashed BM25 sparse encoder.
+
+    Documents are encoded with BM25 term-frequency saturation; queries are
+    encoded as binary term presence. Combined with Qdrant's IDF modifier this
+    reproduces BM25 scoring inside the vector database.
+
+    Example:
+        >>> encoder = SparseEncoder()
+        >>> indices, values = encoder.encode_document("def createFunction(id): ...")
+        >>> query_indices, query_values = encoder.encode_query("createFunction")
+    """
+
+    def __init__(
+        self,
+        vocab_size: int = 2 ** 20,
+        k1: float = 1.2,
+        b: float = 0.75,
+        avg_doc_length: float = 256.0,
+    ):
+        """
+        Initialize sparse encoder.
+
+        Args:
+            vocab_size: Size of the hashed vocabulary (index space)
+            k1: BM25 term-frequency saturation parameter
+            b: BM25 length normalization parameter
+            avg_doc_length: Expected average document length in tokens
+        """
+        self.vocab_size = vocab_size
+        self.k1 = k1
+        self.b = b
+        self.avg_doc_length = avg_doc_length
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Split text into lowercase terms, keeping whole identifiers and their parts.
+
+        "getUserById" yields "getuserbyid", "get", "user", "by", "id".
+        """
+        tokens: List[str] = []
+
+        for match in _IDENTIFIER_PATTERN.finditer(text):
+            identifier = match.group(0)
+            lowered = identifier.lower()
+
+            if lowered not in _STOPWORDS:
+                tokens.append(lowered)
+
+            parts = [p for p in _SPLIT_PATTERN.split(identifier) if p]
+            sub_tokens = []
+            for part in parts:
+                sub_tokens.extend(_CAMEL_PATTERN.findall(part) or [part])
+
+            if len(sub_tokens) > 1:
+                for sub in sub_tokens:
+                    sub_lower = sub.lower()
+                    if len(sub_lower) > 1 and sub_lower not in _STOPWORDS:
+                        tokens.append(sub_lower)
+
+        return tokens
+
+    def _term_index(self, term: str) -> int:
+        """Map a term to a stable index in the hashed vocabulary."""
+        return zlib.crc32(term.encode("utf-8")) % self.vocab_size
+
+    def _to_sparse(self, weights: Dict[int, float]) -> Tuple[List[int], List[float]]:
+        """Convert an index->weight map to sorted (indices, values) lists."""
+        indices = sorted(weights)
+        return indices, [weights[i] for i in indices]
+
+    def encode_document(self, text: str) -> Tuple[List[int], List[float]]:
+        """
+        Encode a document chunk with BM25 term-frequency weights.
+
+        Args:
+            text: Chunk content
+
+        Returns:
+            Tuple of (indices, values) for a Qdrant SparseVector
+        """
+        tokens = self.tokenize(text)
+        if not tokens:
+            return [], []
+
+        doc_length = len(tokens)
+        length_norm = self.k1 * (1 - self.b + self.b * doc_length / self.avg_doc_length)
+
+        weights: Dict[int, float] = {}
+        for term, tf in Counter(tokens).items():
+            index = self._term_index(term)
+            weight = tf * (self.k1 + 1) / (tf + length_norm)
+            # Hash collisions simply accumulate
+            weights[index] = weights.get(index, 0.0) + weight
+
+        return self._to_sparse(weights)
+
+    def encode_query(self, text: str) -> Tuple[List[int], List[float]]:
+        """
+        Encode a search query (binary term presence).
+
+        Args:
+            text: Query text
+
+        Returns:
+            Tuple of (indices, values) for a Qdrant SparseVector
+        """
+        weights = {self._term_index(term): 1.0 for term in set(self.tokenize(text))}
+        return self._to_sparse(weights)
@@ -0,0 +1,51 @@
+"""
+Per-collection write versions for cache invalidation.
+
+Every write path (``QdrantStore.add_embeddings``,
+``MultiCollectionManager.add_to_collection``, ingestion) bumps the version
+of the collection it touched. Caches tag entries with the version current
+when they were computed and drop them once it changes.
+
+Versions are process-local counters; they only need to change, not to be
+comparable across processes.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+_lock = threading.Lock()
+_versions: Dict[str, int] = {}
+_epoch = 0  # Bumped for writes to an unknown collection; invalidates everything
+_total_writes = 0  # Any write; used for cross-collection searches
+
+
+def bump_collection_version(collection: Optional[str] = None) -> None:
+    """
+    Record a write.
+
+    Args:
+        collection: Collection written to (None = unknown, invalidates all)
+    """
+    global _epoch, _total_writes
+    with _lock:
+        _total_writes += 1
+        if collection is None:
+            _epoch += 1
+        else:
+            _versions[collection] = _versions.get(collection, 0) + 1
+
+
+def get_collection_version(collection: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Current version token for a collection.
+
+    Args:
+        collection: Collection name (None = all collections)
+
+    Returns:
+        Opaque version tuple; any write that could affect the collection changes it
+    """
+    with _lock:
+        if collection is None:
+            return (_epoch, _total_writes)
+        return (_epoch, _versions.get(collection, 0))
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Optional
 
 from src.ingestion.ingest import DocumentIngestionPipeline, IngestionConfig
+from src.ingestion.model_registry import initialize_model_registry, get_model_registry, close_model_registry
 from src.config.providers import ProviderConfig
 from src.storage.chroma_client import initialize_chroma, close_chroma
 from src.graph.graph_client import _get_global_client as get_graph_client
@@ -59,7 +60,7 @@ class DocumentWorker:
             use_semantic_chunking=True,
             extract_knowledge_graph=True,
         )
-        self.pipeline = DocumentIngestionPipeline(config)
+        self.pipeline = DocumentIngestionPipeline(config, models=get_model_registry())
         
         print(f"Worker initialized:")
         print(f"  - Watch directory: {self.watch_dir.absolute()}")
@@ -139,6 +140,7 @@ class DocumentWorker:
         print("Initializing services...")
         await initialize_chroma()
         graph_client = get_graph_client()
+        await initialize_model_registry()
         print("✓ Services initialized\n")
         
         try:
@@ -165,6 +167,7 @@ class DocumentWorker:
         finally:
             # Clean up
             await close_chroma()
+            close_model_registry()
             print("✓ Services closed")
             print("Worker stopped")
 
@@ -0,0 +1,99 @@
+"""
+Tests for ``QdrantStore`` against legacy (unnamed dense vector) collection layouts.
+
+Runs against an in-memory Qdrant (``QdrantClient(":memory:")``), so no server
+is needed.
+"""
+
+import hashlib
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    Distance,
+    PointStruct,
+    SparseIndexParams,
+    SparseVector,
+    SparseVectorParams,
+    VectorParams,
+)
+
+import src.storage.qdrant_store as qdrant_store_module
+from src.storage.qdrant_store import QdrantStore, QdrantStoreConfig
+
+DIMENSION = 8
+
+TEXTS = [
+    "parse_config reads the YAML settings file",
+    "the retriever ranks chunks by similarity",
+    "GET /api/v1/collections lists every collection",
+]
+
+
+def embed(text: str):
+    digest = hashlib.sha256(text.encode()).digest()
+    return [byte / 255 + 0.01 for byte in digest[:DIMENSION]]
+
+
+@pytest.fixture
+def qdrant(monkeypatch):
+    """One in-memory Qdrant shared by every store."""
+    client = QdrantClient(":memory:")
+    monkeypatch.setattr(qdrant_store_module, "QdrantClient", lambda **kwargs: client)
+    return client
+
+
+def make_store(**overrides) -> QdrantStore:
+    config = QdrantStoreConfig(
+        collection_name="docs",
+        vector_size=DIMENSION,
+        enable_quantization=False,
+        tuning_file=None,
+        track_filter_usage=False,
+        **overrides,
+    )
+    return QdrantStore(config)
+
+
+def test_hybrid_search_on_legacy_collection_falls_back_to_dense(qdrant):
+    legacy = make_store(enable_sparse=False)
+    legacy.add_embeddings(
+        embeddings=[embed(text) for text in TEXTS],
+        metadatas=[{"content": text} for text in TEXTS],
+        documents=TEXTS,
+    )
+
+    # Hybrid config over the existing unnamed-vector collection
+    store = make_store()
+    assert not store.named_vectors
+    assert not store.sparse_enabled
+
+    results = store.hybrid_search(TEXTS[1], embed(TEXTS[1]), limit=1)
+
+    assert results[0]["content"] == TEXTS[1]
+
+
+def test_hybrid_search_on_unnamed_dense_with_sparse_vectors(qdrant):
+    # Legacy unnamed dense vector with a sparse vector added alongside it
+    qdrant.create_collection(
+        "docs",
+        vectors_config=VectorParams(size=DIMENSION, distance=Distance.COSINE),
+        sparse_vectors_config={"sparse": SparseVectorParams(index=SparseIndexParams())},
+    )
+    store = make_store()
+    assert not store.named_vectors
+    assert store.sparse_enabled
+
+    points = []
+    for i, text in enumerate(TEXTS):
+        indices, values = store.sparse_encoder.encode_document(text)
+        points.append(PointStruct(
+            id=i,
+            vector={"": embed(text), "sparse": SparseVector(indices=indices, values=values)},
+            payload={"content": text},
+        ))
+    qdrant.upsert("docs", points=points)
+
+    results = store.hybrid_search(TEXTS[2], embed(TEXTS[2]), limit=1)
+
+    assert results[0]["content"] == TEXTS[2]
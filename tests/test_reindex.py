@@ -0,0 +1,174 @@
+"""
+End-to-end tests for blue/green reindexing (``DocumentConverter.reindex_directory``).
+
+Runs against an in-memory Qdrant (``QdrantClient(":memory:")``) with fake
+processor, chunker and embedder, so no server or models are needed.
+"""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from qdrant_client import QdrantClient
+
+import src.storage.qdrant_store as qdrant_store_module
+import src.storage.reindex as reindex_module
+from src.converter import DocumentConverter
+from src.exceptions import ConfigurationError
+from src.ingestion.chunker import DocumentChunk
+from src.ingestion.processor import DocumentMetadata, ProcessedDocument
+from src.storage.qdrant_store import QdrantStore, QdrantStoreConfig
+
+DIMENSION = 8
+
+
+class FakeProcessor:
+    """Reads text files as-is."""
+
+    ALL_SUPPORTED_FORMATS = {".md"}
+
+    def process_file(self, file_path: str) -> ProcessedDocument:
+        path = Path(file_path)
+        content = path.read_text()
+        return ProcessedDocument(
+            content=content,
+            metadata=DocumentMetadata(
+                file_path=str(path),
+                file_name=path.name,
+                file_size=len(content),
+                file_format="md",
+                sha256_hash=hashlib.sha256(content.encode()).hexdigest(),
+                title=path.stem,
+            ),
+        )
+
+
+class FakeChunker:
+    """One chunk per non-empty line."""
+
+    async def chunk_document(self, content, title, source, metadata=None, docling_doc=None):
+        lines = [line for line in content.splitlines() if line.strip()]
+        return [
+            DocumentChunk(content=line, index=i, start_char=0, end_char=len(line), metadata={"source": source})
+            for i, line in enumerate(lines)
+        ]
+
+
+class FakeEmbedder:
+    """Deterministic hash-based vectors."""
+
+    def get_dimension(self) -> int:
+        return DIMENSION
+
+    def _embed(self, text: str):
+        digest = hashlib.sha256(text.encode()).digest()
+        return [byte / 255 + 0.01 for byte in digest[:DIMENSION]]
+
+    async def embed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    async def embed_query(self, text):
+        return self._embed(text)
+
+
+@pytest.fixture
+def qdrant(monkeypatch):
+    """One in-memory Qdrant shared by every store and reindexer."""
+    client = QdrantClient(":memory:")
+    monkeypatch.setattr(qdrant_store_module, "QdrantClient", lambda **kwargs: client)
+    monkeypatch.setattr(reindex_module, "QdrantClient", lambda **kwargs: client)
+    return client
+
+
+def make_converter(store: QdrantStore) -> DocumentConverter:
+    converter = DocumentConverter.__new__(DocumentConverter)
+    converter.processor = FakeProcessor()
+    converter.chunker = FakeChunker()
+    converter.embedder = FakeEmbedder()
+    converter.vector_store = store
+    return converter
+
+
+def make_store(**overrides) -> QdrantStore:
+    config = QdrantStoreConfig(
+        collection_name="docs",
+        vector_size=DIMENSION,
+        enable_quantization=False,
+        tuning_file=None,
+        track_filter_usage=False,
+        **overrides,
+    )
+    return QdrantStore(config)
+
+
+def write_docs(directory: Path, lines_per_file: int = 3) -> None:
+    for name in ("a", "b"):
+        (directory / f"{name}.md").write_text(
+            "\n".join(f"{name} line {i} about reindexing" for i in range(lines_per_file))
+        )
+
+
+def aliases(client: QdrantClient):
+    return {a.alias_name: a.collection_name for a in client.get_aliases().aliases}
+
+
+def collections(client: QdrantClient):
+    return {c.name for c in client.get_collections().collections}
+
+
+async def test_reindex_directory_refuses_legacy_collection(qdrant, tmp_path):
+    write_docs(tmp_path)
+    converter = make_converter(make_store())
+
+    with pytest.raises(ConfigurationError):
+        await converter.reindex_directory(str(tmp_path))
+
+    # Nothing was built and the live collection is untouched
+    assert collections(qdrant) == {"docs"}
+    assert aliases(qdrant) == {}
+
+
+async def test_reindex_directory_migrates_legacy_collection(qdrant, tmp_path):
+    write_docs(tmp_path)
+    legacy = make_store(enable_sparse=False)
+    await make_converter(legacy).convert_file(str(tmp_path / "a.md"), output_format="dict")
+    assert legacy.get_stats()["points_count"] == 3
+
+    # Hybrid config over the existing unnamed-vector collection
+    converter = make_converter(make_store())
+    assert not converter.vector_store.named_vectors
+    report = await converter.reindex_directory(
+        str(tmp_path), sample_queries=["a line 0 about reindexing"], migrate_legacy=True
+    )
+
+    assert report.swapped, report.validation.errors
+    assert report.new_collection.startswith("docs__v")
+    assert report.previous_collection is None
+    assert report.validation.points_count == 6
+    assert aliases(qdrant) == {"docs": report.new_collection}
+    assert "docs" not in collections(qdrant)
+
+    # Content is stored in the payload and sparse vectors are written
+    points, _ = qdrant.scroll(report.new_collection, limit=10, with_vectors=True)
+    assert all(point.payload["content"] for point in points)
+    assert all("sparse" in point.vector for point in points)
+
+    # The store re-detected the hybrid layout and searches the new version
+    assert converter.vector_store.named_vectors
+    results = converter.vector_store.search(await converter.embedder.embed_query("b line 1 about reindexing"), limit=1)
+    assert results[0]["content"] == "b line 1 about reindexing"
+
+
+async def test_reindex_directory_swaps_alias_and_removes_old_version(qdrant, tmp_path):
+    write_docs(tmp_path)
+    converter = make_converter(make_store())
+    first = await converter.reindex_directory(str(tmp_path), migrate_legacy=True)
+
+    write_docs(tmp_path, lines_per_file=4)
+    second = await converter.reindex_directory(str(tmp_path))
+
+    assert second.swapped, second.validation.errors
+    assert second.previous_collection == first.new_collection
+    assert second.deleted_collections == [first.new_collection]
+    assert aliases(qdrant) == {"docs": second.new_collection}
+    assert converter.vector_store.get_stats()["points_count"] == 8